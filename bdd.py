@@ -0,0 +1,393 @@
+"""
+Reduced ordered binary decision diagrams (BDDs) for checking validity, equivalence and counting the satisfying assignments of statements.
+
+A BDD represents a logical statement as a DAG of decisions on the atomic sentences, in a fixed order from the top to the bottom.
+Since the BDD is reduced (no node has two identical child nodes, and no two nodes are the same), every logical statement has exactly one BDD
+for a given order. Therefore, two statements are equivalent if and only if they are the same node, and a statement is unsatisfiable if and only if
+it is the node False. For structured statements, such as long chains of implications, the BDD stays small where the truth table explodes.
+"""
+
+from collections import OrderedDict
+
+FALSE, TRUE = 0, 1	# the two terminal nodes
+
+class BDD:
+	"""
+	This is a class for a manager of BDD nodes sharing one unique table.
+
+	Each node is an integer u. The nodes 0 and 1 are the terminal nodes False and True.
+	Every other node decides on the atomic sentence self.var[u]: its truth value is that of self.high[u] if the atomic sentence is True,
+	and that of self.low[u] if it is False.
+	"""
+
+	def __init__(self, atomic_sentences, cache_size=2**18):
+		"""
+		Input: 1. A list of the atomic sentences, in the order of the variables from the top to the bottom.
+			   2. cache_size : Integer - the maximum number of entries in the computed table.
+
+		Attributes:
+		order : List of the atomic sentences by level, from the top (level 0) to the bottom.
+		level : Dictionary that maps the atomic sentences to their levels. The terminal nodes are at level len(order).
+		var, low, high : Lists - the atomic sentence and the child nodes of every node.
+		unique : Dictionary that maps (var, low, high) to the node, so that the same node is never created twice.
+		nodes_of : Dictionary that maps the atomic sentences to the sets of their nodes, to find the nodes of a level when the levels are swapped.
+		computed : Ordered Dictionary - the computed table, which caches the results of the operations, e.g., ("and", u, v) -> w.
+				   When it is full, the least recently used entry is evicted.
+		refs : Dictionary that maps the nodes reachable from the roots being sifted to their numbers of references from the roots and 
+			   from reachable nodes, or None when not sifting. live is the number of reachable nodes, i.e., len(refs).
+		"""
+		self.order = list(atomic_sentences)
+		self.level = {atom: i for i, atom in enumerate(self.order)}
+		self.var = [None, None]
+		self.low = [None, None]
+		self.high = [None, None]
+		self.unique = {}
+		self.nodes_of = {atom: set() for atom in self.order}
+		self.computed = OrderedDict()
+		self.cache_size = cache_size
+		self.refs = None
+		self.live = 0
+
+	def node_level(self, u):
+		return len(self.order) if u <= TRUE else self.level[self.var[u]]
+
+	def mk(self, var, low, high):
+		"""
+		Return the node deciding on var with the child nodes low and high, creating it only if it does not exist in the unique table.
+		"""
+		if low == high:
+			return low
+		key = (var, low, high)
+		if key not in self.unique:
+			self.unique[key] = len(self.var)
+			self.var.append(var)
+			self.low.append(low)
+			self.high.append(high)
+			self.nodes_of[var].add(self.unique[key])
+		return self.unique[key]
+
+	def atom(self, atom):
+		return self.mk(atom, FALSE, TRUE)
+
+	def cached(self, key):
+		if key in self.computed:
+			self.computed.move_to_end(key)
+			return self.computed[key]
+		return None
+
+	def remember(self, key, u):
+		self.computed[key] = u
+		if len(self.computed) > self.cache_size:
+			self.computed.popitem(last=False)
+		return u
+
+	def negate(self, u):
+		"""
+		Return the node of "not u". The nodes below u are negated before their parent nodes with an explicit stack instead of recursion,
+		so that a BDD of any depth can be negated. The results are cached in the computed table.
+		"""
+		results = {FALSE: TRUE, TRUE: FALSE}
+		stack = [u]
+		while stack:
+			w = stack[-1]
+			if w in results:
+				stack.pop()
+				continue
+			result = self.cached(("not", w))
+			if result is None:
+				missing = [child for child in (self.low[w], self.high[w]) if child not in results]
+				if missing:
+					stack += missing
+					continue
+				result = self.remember(("not", w), self.mk(self.var[w], results[self.low[w]], results[self.high[w]]))
+			results[w] = result
+			stack.pop()
+		return results[u]
+
+	def terminal_case(self, op, u, v):
+		"""
+		Return the node of "u op v" if the connective can be decided from a terminal node or from u == v, e.g., False and v is False, or None.
+		"""
+		if op == "and":
+			if u == FALSE or v == FALSE:
+				return FALSE
+			if u == TRUE:
+				return v
+			if v == TRUE or u == v:
+				return u
+		elif op == "or":
+			if u == TRUE or v == TRUE:
+				return TRUE
+			if u == FALSE:
+				return v
+			if v == FALSE or u == v:
+				return u
+		elif op == "then":
+			if u == FALSE or v == TRUE or u == v:
+				return TRUE
+			if u == TRUE:
+				return v
+			if v == FALSE:
+				return self.negate(u)
+		elif op == "xor":
+			if u == FALSE:
+				return v
+			if v == FALSE:
+				return u
+			if u == v:
+				return FALSE
+			if u == TRUE:
+				return self.negate(v)
+			if v == TRUE:
+				return self.negate(u)
+		return None
+
+	def cofactors(self, u, v):
+		"""
+		Return (the atomic sentence with the lowest level of u and v, (u0, v0), (u1, v1)): the child nodes of u and v for the atomic sentence
+		False and True. A node which does not decide on that atomic sentence is its own child node.
+		"""
+		level = min(self.node_level(u), self.node_level(v))
+		u0, u1 = (self.low[u], self.high[u]) if self.node_level(u) == level else (u, u)
+		v0, v1 = (self.low[v], self.high[v]) if self.node_level(v) == level else (v, v)
+		return self.order[level], (u0, v0), (u1, v1)
+
+	def apply(self, op, u, v):
+		"""
+		Input: 1. op : String - the connective "and", "or", "then" or "xor"
+			   2. u, v : the nodes of the left and right logical statements
+		Output: The node of "u op v".
+
+		1.	If the connective can be decided from a terminal node, return the result directly (see terminal_case).
+		2.	Otherwise, split both nodes on the atomic sentence with the lowest level (see cofactors), apply the connective to the two pairs 
+			of child nodes, and make the node from the results. The results are cached in the computed table.
+		The pairs of nodes are visited with an explicit stack instead of recursion, so that BDDs of any depth can be combined.
+		"""
+		results = {}
+		stack = [(u, v, None)]	# a pair of nodes to visit, or (a, b, (var, low, high)) to make the node once the pairs low and high are done
+		while stack:
+			a, b, split = stack.pop()
+			if split is not None:
+				var, low, high = split
+				results[(a, b)] = self.remember((op, a, b), self.mk(var, results[low], results[high]))
+				continue
+			if (a, b) in results:
+				continue
+			result = self.terminal_case(op, a, b)
+			if result is None:
+				result = self.cached((op, a, b))
+			if result is not None:
+				results[(a, b)] = result
+				continue
+			var, low, high = self.cofactors(a, b)
+			stack.append((a, b, (var, low, high)))
+			stack.append(low + (None,))
+			stack.append(high + (None,))
+		return results[(u, v)]
+
+	def from_tree(self, root, built=None):
+		"""
+		Input: 1. A node (the root of a Logic Tree)
+			   2. built : Dictionary (optional) that maps the id of the nodes of Logic Trees to their BDD nodes, for the nodes shared by several trees.
+		Output: The BDD node of the logical statement of the Logic Tree.
+
+		The child nodes of "and" and "or" are combined one after another. "iff", "nand" and "nor" are the negations of "xor", "and" and "or".
+		"""
+		if built is None:
+			built = {}
+		stack = [(root, False)]	# the nodes are built in post-order with an explicit stack, so any depth can be built
+		while stack:
+			node, expanded = stack.pop()
+			if id(node) in built:
+				continue
+			if node.children and not expanded:
+				stack.append((node, True))
+				stack += [(child, False) for child in reversed(node.children)]
+				continue
+			if not node.children:	#the node is a leaf
+				u = self.atom(node.data)
+			else:
+				op = {"iff": "xor", "nand": "and", "nor": "or"}.get(node.data, node.data)
+				children = [built[id(child)] for child in node.children]
+				u = children[0]
+				for v in children[1:]:
+					u = self.apply(op, u, v)
+				if node.data in ("iff", "nand", "nor"):
+					u = self.negate(u)
+			built[id(node)] = self.negate(u) if node.negation else u
+		return built[id(root)]
+
+	def size(self, roots):
+		"""
+		Return the number of nodes reachable from the list of roots, including the terminal nodes.
+		"""
+		seen = set()
+		stack = list(roots)
+		while stack:
+			u = stack.pop()
+			if u not in seen:
+				seen.add(u)
+				if u > TRUE:
+					stack += [self.low[u], self.high[u]]
+		return len(seen)
+
+	def count(self, u):
+		"""
+		Return the number of assignments of all the atomic sentences in order which make the node u True.
+		The counts of the child nodes are computed first with an explicit stack, so that a BDD of any depth can be counted.
+		"""
+		counts = {FALSE: 0, TRUE: 1}
+		stack = [u]
+		while stack:
+			w = stack[-1]
+			if w in counts:
+				stack.pop()
+				continue
+			missing = [child for child in (self.low[w], self.high[w]) if child not in counts]
+			if missing:
+				stack += missing
+				continue
+			lvl = self.node_level(w)
+			counts[w] = (counts[self.low[w]] * 2**(self.node_level(self.low[w]) - lvl - 1)
+						 + counts[self.high[w]] * 2**(self.node_level(self.high[w]) - lvl - 1))
+			stack.pop()
+		return counts[u] * 2**self.node_level(u)
+
+	def satisfying_assignment(self, u, atomic_sentences=None):
+		"""
+		Input: 1. A node u
+			   2. A list of the atomic sentences to include in the assignment. By default, all the atomic sentences of the BDD.
+		Output: Ordered Dictionary that maps the atomic sentences to truth values which make the node u True, or None if u is False.
+				The atomic sentences which u does not depend on are False.
+		"""
+		if u == FALSE:
+			return None
+		assignment = OrderedDict((atom, False) for atom in (atomic_sentences or self.order))
+		while u > TRUE:
+			if self.low[u] != FALSE:
+				u = self.low[u]
+			else:
+				assignment[self.var[u]] = True
+				u = self.high[u]
+		return assignment
+
+	def reference(self, u):
+		"""
+		Modifying method. Add a reference to the node u. If u was not reachable, it becomes reachable and references its child nodes.
+		"""
+		stack = [u]
+		while stack:
+			w = stack.pop()
+			if w in self.refs:
+				self.refs[w] += 1
+			else:
+				self.refs[w] = 1
+				self.live += 1
+				if w > TRUE:
+					stack += [self.low[w], self.high[w]]
+
+	def dereference(self, u):
+		"""
+		Modifying method. Remove a reference to the node u. If it was the last one, u is no longer reachable and releases its child nodes.
+		"""
+		stack = [u]
+		while stack:
+			w = stack.pop()
+			self.refs[w] -= 1
+			if not self.refs[w]:
+				del self.refs[w]
+				self.live -= 1
+				if w > TRUE:
+					stack += [self.low[w], self.high[w]]
+
+	def swap(self, i):
+		"""
+		Modifying method. Swap the atomic sentences at levels i and i+1 in place. Every node keeps representing the same logical statement.
+
+		Let x be at level i and y at level i+1. A node u = x ? f1 : f0 whose child nodes depend on y is rewritten as
+		u = y ? (x ? f11 : f01) : (x ? f10 : f00), where fab is the child node of fa for y = b. The other nodes of x simply move down to level i+1.
+		While sifting, the references of the rewritten nodes which are reachable are moved from their old child nodes to the new ones.
+		Only the nodes at the levels i and i+1 can become reachable or unreachable, so the swap does not walk the rest of the BDD.
+		"""
+		x, y = self.order[i], self.order[i+1]
+		for u in list(self.nodes_of[x]):
+			f0, f1 = self.low[u], self.high[u]
+			if self.var[f0] != y and self.var[f1] != y:
+				continue
+			f00, f01 = (self.low[f0], self.high[f0]) if self.var[f0] == y else (f0, f0)
+			f10, f11 = (self.low[f1], self.high[f1]) if self.var[f1] == y else (f1, f1)
+			del self.unique[(x, f0, f1)]
+			self.nodes_of[x].discard(u)
+			low, high = self.mk(x, f00, f10), self.mk(x, f01, f11)
+			self.var[u], self.low[u], self.high[u] = y, low, high
+			self.unique[(y, low, high)] = u
+			self.nodes_of[y].add(u)
+			if self.refs is not None and u in self.refs:
+				self.reference(low)
+				self.reference(high)
+				self.dereference(f0)
+				self.dereference(f1)
+		self.order[i], self.order[i+1] = y, x
+		self.level[x], self.level[y] = i + 1, i
+
+	def sift(self, roots, max_growth=1.2):
+		"""
+		Modifying method. Improve the order of the atomic sentences for the list of roots by sifting.
+
+		For each atomic sentence, from the one with the most nodes, move it through all the levels with adjacent swaps,
+		and put it back at the level where the number of nodes reachable from the roots is the smallest.
+		An atomic sentence stops moving in a direction as soon as the BDD grows more than max_growth times its smallest size, 
+		since moving it further rarely makes the BDD smaller again, like the sifting of CUDD.
+		The number of reachable nodes is counted once with reference counts (see reference), which every swap updates, 
+		instead of walking the whole BDD with size after every swap.
+		"""
+		self.refs, self.live = {}, 0
+		for root in roots:
+			self.reference(root)
+		try:
+			for atom in sorted(self.order, key=lambda a: -len(self.nodes_of[a])):
+				best_size, best_level = self.live, self.level[atom]
+				while self.level[atom] < len(self.order) - 1:
+					self.swap(self.level[atom])
+					if self.live < best_size:
+						best_size, best_level = self.live, self.level[atom]
+					elif self.live > max_growth * best_size:
+						break
+				while self.level[atom] > 0:
+					self.swap(self.level[atom] - 1)
+					if self.live < best_size:
+						best_size, best_level = self.live, self.level[atom]
+					elif self.live > max_growth * best_size:
+						break
+				while self.level[atom] < best_level:
+					self.swap(self.level[atom])
+				while self.level[atom] > best_level:
+					self.swap(self.level[atom] - 1)
+		finally:
+			self.refs = None
+
+def variable_order(logic_trees, dict_atomic_sentences, ordering="static"):
+	"""
+	Input: 1. A list of logic trees
+		   2. A dictionary which maps all the symbols of atomic sentences to None
+		   3. ordering : String - the heuristic of the order of the atomic sentences:
+		   	  "static" - the order of the atomic sentences found by identify_atomic_sentences.
+		   	  "reverse" - the reverse of the static order.
+		   	  "frequency" - the atomic sentences which appear in the most leaves first.
+	Output: A list of the atomic sentences in order.
+	"""
+	order = list(dict_atomic_sentences)
+	if ordering == "static":
+		return order
+	if ordering == "reverse":
+		return order[::-1]
+	if ordering == "frequency":
+		occurrences = dict.fromkeys(order, 0)
+		stack = [T.root for T in logic_trees]
+		while stack:
+			node = stack.pop()
+			if not node.children:
+				occurrences[node.data] += 1
+			stack += node.children
+		return sorted(order, key=lambda atom: -occurrences[atom])
+	raise ValueError("Unknown variable ordering %r. Choose one of: static, reverse, frequency" % ordering)
@@ -0,0 +1,216 @@
+"""
+A reproducible benchmark of the truth table, with synthetic arguments of growing size.
+
+Usage:
+	python benchmark.py										print the time and the peak memory of every phase of every case
+	python benchmark.py --save baseline.json					also store the results as a baseline
+	python benchmark.py --baseline baseline.json				compare the results with a stored baseline, and exit with status 1
+															if a phase of a case is slower, or uses more memory, than the baseline by more than the tolerance
+
+The arguments are generated from a seed, so every run benchmarks the same statements:
+1.	random_argument - random statements with a given number of atomic sentences, depth, mix of connectives and amount of shared subformulas.
+2.	chain_argument - a chain of implications, like sample3: "if A1, then A2", "if A2, then A3", ..., therefore "if A1, then An".
+3.	dilemma_argument - a constructive dilemma with k pairs of atomic sentences, like sample8.
+
+Every phase of answer_truth_table_validity is timed separately, on the FlatTree which it uses by default: parse (FlatTree), 
+atoms (generate_truth_values_for_atomic_sentences), assign (FlatTree.assign_truth_values), describe (FlatTree.describe), 
+print (FlatTree.print_truth_table) and validity (FlatTree.check_validity).
+The time of a phase is the smallest of several repeats. The peak memory of a phase is measured with tracemalloc in a separate run,
+since tracing the allocations slows down the phases.
+"""
+
+from collections import OrderedDict
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+from logic import FlatTree, compiled_formulas, generate_truth_values_for_atomic_sentences, parse_statement
+
+PHASES = ("parse", "atoms", "assign", "describe", "print", "validity")
+
+def random_formula(rng, atoms, depth, connectives, negation, pool, shared):
+	"""
+	Input: 1. rng : random.Random - the generator of random numbers
+		   2. A list of the atomic sentences
+		   3. depth : Integer - the maximum depth of the formula
+		   4. connectives : Dictionary that maps the connectives "and", "or", "then" to their weights
+		   5. negation : Float - the probability that a subformula is negated
+		   6. pool : List of the subformulas generated so far, which is extended with the new subformulas
+		   7. shared : Float - the probability that a subformula is taken again from the pool instead of being generated
+	Output: String - a statement in the input format of answer_truth_table_validity.
+	"""
+	if pool and depth and rng.random() < shared:
+		return rng.choice(pool)
+	if depth == 0:
+		formula = rng.choice(atoms)
+	else:
+		left = random_formula(rng, atoms, depth - 1, connectives, negation, pool, shared)
+		right = random_formula(rng, atoms, depth - 1, connectives, negation, pool, shared)
+		left, right = [f if " " not in f else "( " + f + " )" for f in (left, right)]
+		connective = rng.choices(list(connectives), weights=list(connectives.values()))[0]
+		formula = "if %s, then %s" % (left, right) if connective == "then" else "%s %s %s" % (left, connective, right)
+		pool.append(formula)
+	if rng.random() < negation:
+		formula = "not ( " + formula + " )"
+	return formula
+
+def random_argument(seed, atom_count, depth=3, premise_count=3, connectives=None, negation=0.2, shared=0.0):
+	"""
+	Input: 1. seed : Integer - the seed of the random numbers, so that the same argument is generated every time
+		   2. atom_count : Integer - the number of atomic sentences to choose from
+		   3. depth : Integer - the depth of the statements
+		   4. premise_count : Integer - the number of premises
+		   5. connectives : Dictionary (optional) that maps the connectives to their weights. By default, they are equally likely.
+		   6. negation : Float - the probability that a subformula is negated
+		   7. shared : Float - the probability that a subformula is a subformula generated before, i.e., the amount of shared subformulas
+	Output: List of Statements (Argument). The last entry is the conclusion.
+
+	The first premise is the disjunction of all the atomic sentences in a random order, so that the argument has exactly atom_count atomic sentences.
+	"""
+	rng = random.Random(seed)
+	atoms = ["A%d" % i for i in range(1, atom_count + 1)]
+	connectives = connectives or {"and": 1, "or": 1, "then": 1}
+	pool = []
+	statements = [" or ".join(rng.sample(atoms, atom_count))]
+	statements += [random_formula(rng, atoms, depth, connectives, negation, pool, shared) for _ in range(premise_count)]
+	return statements
+
+def chain_argument(atom_count):
+	"""
+	Output: List of Statements - "if A1, then A2", ..., "if An-1, then An", therefore "if A1, then An". It is valid.
+	"""
+	statements = ["if A%d, then A%d" % (i, i + 1) for i in range(1, atom_count)]
+	return statements + ["if A1, then A%d" % atom_count]
+
+def dilemma_argument(pair_count):
+	"""
+	Output: List of Statements - "( if p1, then q1 ) and ... and ( if pk, then qk )", "p1 or ... or pk", therefore "q1 or ... or qk". It is valid.
+	"""
+	return [" and ".join("( if p%d, then q%d )" % (i, i) for i in range(1, pair_count + 1)),
+			" or ".join("p%d" % i for i in range(1, pair_count + 1)),
+			" or ".join("q%d" % i for i in range(1, pair_count + 1))]
+
+def benchmark_cases(max_atoms=14):
+	"""
+	Output: Ordered Dictionary that maps the names of the cases to their arguments. The sizes grow in steps of 2 atomic sentences,
+			so the results of the cases of a generator form a scaling curve.
+	"""
+	cases = OrderedDict()
+	for n in range(4, max_atoms + 1, 2):
+		cases["random-%d" % n] = random_argument(n, n)
+		cases["shared-%d" % n] = random_argument(n, n, depth=5, shared=0.5)
+		cases["chain-%d" % n] = chain_argument(n)
+		cases["dilemma-%d" % n] = dilemma_argument(n // 2)
+	return cases
+
+def run_phases(list_of_statements, measure):
+	"""
+	Input: 1. List of Statements (Argument).
+		   2. measure : Function - called with the name of every phase and a function which runs the phase, which returns the result of the phase.
+	Output: None. The phases of answer_truth_table_validity are run in order on a FlatTree. The truth table is printed to os.devnull.
+
+	The caches of parse_statement and Tree.compile are cleared first, so that every run parses the statements again.
+	"""
+	parse_statement.cache_clear()
+	compiled_formulas.clear()
+	flat_tree = measure("parse", lambda: FlatTree(list_of_statements))
+	truth_values_atomic_sentences = measure("atoms", lambda: generate_truth_values_for_atomic_sentences(flat_tree.atomic_sentences))
+	measure("assign", lambda: flat_tree.assign_truth_values(truth_values_atomic_sentences))
+	measure("describe", flat_tree.describe)
+
+	def print_phase():
+		with open(os.devnull, "w") as devnull:
+			flat_tree.print_truth_table(devnull)
+	measure("print", print_phase)
+	measure("validity", flat_tree.check_validity)
+
+def benchmark(list_of_statements, repeat=3):
+	"""
+	Input: 1. List of Statements (Argument).
+		   2. repeat : Integer - the number of times the phases are timed
+	Output: Ordered Dictionary that maps every phase to a dictionary {"seconds": the smallest time, "peak_bytes": the peak memory}.
+	"""
+	results = OrderedDict((phase, {"seconds": float("inf"), "peak_bytes": 0}) for phase in PHASES)
+
+	def timed(phase, run):
+		start = time.perf_counter()
+		result = run()
+		results[phase]["seconds"] = min(results[phase]["seconds"], time.perf_counter() - start)
+		return result
+
+	def traced(phase, run):
+		tracemalloc.reset_peak()
+		start = tracemalloc.get_traced_memory()[0]
+		result = run()
+		results[phase]["peak_bytes"] = tracemalloc.get_traced_memory()[1] - start
+		return result
+
+	for _ in range(repeat):
+		run_phases(list_of_statements, timed)
+	tracemalloc.start()
+	try:
+		run_phases(list_of_statements, traced)
+	finally:
+		tracemalloc.stop()
+	return results
+
+def compare_with_baseline(results, baseline, tolerance, min_seconds=0.001):
+	"""
+	Input: 1. results : Dictionary that maps the names of the cases to their results from benchmark
+		   2. baseline : Dictionary - the stored results of a previous run
+		   3. tolerance : Float - the largest allowed ratio of a result to its baseline
+		   4. min_seconds : Float - times below it are too noisy to compare
+	Output: A list of the regressions as Strings. The cases and phases which are not in the baseline are not compared.
+	"""
+	regressions = []
+	for case, phases in results.items():
+		for phase, result in phases.items():
+			if phase not in baseline.get(case, {}):
+				continue
+			before = baseline[case][phase]
+			if result["seconds"] > max(before["seconds"], min_seconds) * tolerance:
+				regressions.append("%s %s: %.6fs, baseline %.6fs" % (case, phase, result["seconds"], before["seconds"]))
+			if result["peak_bytes"] > max(before["peak_bytes"], 1024) * tolerance:
+				regressions.append("%s %s: %d bytes, baseline %d bytes" % (case, phase, result["peak_bytes"], before["peak_bytes"]))
+	return regressions
+
+def print_results(results, file=None):
+	"""
+	Print a table of the time in milliseconds and the peak memory in KiB of every phase of every case.
+	The cases of a generator are printed one after another in growing size, which is the scaling curve of the generator.
+	"""
+	file = file or sys.stdout
+	print("%-14s" % "case" + "".join("%20s" % phase for phase in PHASES), file=file)
+	for case in sorted(results, key=lambda case: (case.rsplit("-", 1)[0], int(case.rsplit("-", 1)[1]))):
+		cells = ["%9.3fms %7dK" % (results[case][phase]["seconds"] * 1000, results[case][phase]["peak_bytes"] // 1024) for phase in PHASES]
+		print("%-14s" % case + "".join("%20s" % cell for cell in cells), file=file)
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description="Benchmark the phases of the truth table on synthetic arguments.")
+	parser.add_argument("--max-atoms", type=int, default=14, help="the largest number of atomic sentences of the cases")
+	parser.add_argument("--repeat", type=int, default=3, help="the number of times every phase is timed")
+	parser.add_argument("--save", metavar="PATH", help="store the results as a baseline in PATH")
+	parser.add_argument("--baseline", metavar="PATH", help="compare the results with the baseline stored in PATH")
+	parser.add_argument("--tolerance", type=float, default=1.5, help="the largest allowed ratio of a result to its baseline")
+	args = parser.parse_args(argv)
+
+	results = OrderedDict((case, benchmark(statements, args.repeat)) for case, statements in benchmark_cases(args.max_atoms).items())
+	print_results(results)
+
+	if args.save:
+		with open(args.save, "w") as f:
+			json.dump(results, f, indent=1)
+	if args.baseline:
+		with open(args.baseline) as f:
+			regressions = compare_with_baseline(results, json.load(f), args.tolerance)
+		for regression in regressions:
+			print("Regression:", regression)
+		return 1 if regressions else 0
+	return 0
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,158 @@
+"""
+An index of a catalog of statements, to find which statements are logically equivalent and which statements entail which others
+without checking every pair with answer_truth_table_validity.
+
+Every statement of the catalog gets one column of truth values over the union of the atomic sentences of the catalog, computed with
+Tree.assign_truth_values_to_node. The Logic Trees share one node_table, so a subformula which appears in several statements is evaluated once.
+1.	If the catalog has at most max_atoms atomic sentences, the columns are the whole truth table, so two statements are equivalent if and only if
+	their columns are equal, and A entails B if and only if the column of A is a subset of the column of B.
+2.	Otherwise, the whole truth table is too large, and the columns are the truth values in a random sample of sample_rows rows.
+	Equal columns and subsets are then only necessary conditions, and the candidates are verified with one shared BDD (see bdd.py).
+
+The columns are the keys of a lookup table, so the statements with the same column are found in one pass over the catalog,
+and the entailments are only verified for the candidates which pass the cheap checks (see FormulaIndex.entailed_by).
+"""
+
+from bisect import bisect_left
+from collections import OrderedDict
+import random
+
+from bdd import BDD, FALSE
+from logic import Tree, generate_truth_values_for_atomic_sentences, identify_atomic_sentences_of_statements
+
+SIGNATURE_ROWS = 64	# the number of rows of the signatures, which are compared before the whole columns
+
+class FormulaIndex:
+	"""
+	This is a class for the equivalence classes and the entailments of a catalog of statements.
+	"""
+
+	def __init__(self, list_of_statements, max_atoms=16, sample_rows=1024, seed=0):
+		"""
+		Input: 1. List of Statements - the catalog.
+			   2. max_atoms : Integer - the largest number of atomic sentences for which the columns are the whole truth table.
+			   3. sample_rows : Integer - the number of rows of the columns if there are more atomic sentences.
+			   4. seed : Integer - the seed of the random rows, so that the same catalog has the same columns every time.
+
+		Attributes:
+		statements : List of the statements of the catalog.
+		atomic_sentences : Ordered Dictionary which maps the atomic sentences of all the statements to None.
+		exact : Bool - whether the columns are the whole truth table, so that they decide equivalence and entailment without verification.
+		trees : List of the Logic Trees of the statements, which share one node_table.
+		columns : List of the columns of truth values of the statements.
+		popcounts : List of the number of rows in which each statement is True. A statement can only entail a statement which is True in at least as many rows.
+		signatures : List of the truth values of the statements in SIGNATURE_ROWS random rows, packed into small integers. 
+					 If a statement entails another, its signature is also a subset of the signature of the other.
+		table : Dictionary that maps the columns to the lists of the equivalence classes (lists of indices of statements) which have the column.
+				There is more than one class for a column only if the columns are sampled.
+		classes : List of the equivalence classes, in the order of their first statement.
+		class_of : List of the equivalence class of every statement.
+		"""
+		self.statements = list(list_of_statements)
+		self.atomic_sentences = identify_atomic_sentences_of_statements(self.statements)
+		self.exact = len(self.atomic_sentences) <= max_atoms
+		if self.exact:
+			row_count = 2**len(self.atomic_sentences)
+			truth_values_atomic_sentences = generate_truth_values_for_atomic_sentences(self.atomic_sentences)
+		else:
+			row_count = sample_rows
+			rng = random.Random(seed)
+			truth_values_atomic_sentences = OrderedDict((s, rng.getrandbits(sample_rows)) for s in self.atomic_sentences)
+
+		self.trees = []
+		self.columns = []
+		node_table = {}
+		for s in self.statements:
+			T = Tree()
+			T.create_logic_tree_from_statement(s, node_table)
+			self.columns.append(T.assign_truth_values_to_node(truth_values_atomic_sentences, row_count).truth_values)
+			self.trees.append(T)
+		self.popcounts = [bin(column).count("1") for column in self.columns]
+		if self.exact and row_count > SIGNATURE_ROWS:
+			rows = random.Random(seed).sample(range(row_count), SIGNATURE_ROWS)
+		else:	# the rows are random already
+			rows = range(min(row_count, SIGNATURE_ROWS))
+		self.signatures = [sum(((column >> r) & 1) << k for k, r in enumerate(rows)) for column in self.columns]
+
+		self.manager = None
+		self.built = {}
+		self.table = {}
+		self.classes = []
+		self.class_of = []
+		for i, column in enumerate(self.columns):
+			candidates = self.table.setdefault(column, [])
+			equivalence_class = next((c for c in candidates if self.exact or self.verify_equivalent(c[0], i)), None)
+			if equivalence_class is None:
+				equivalence_class = []
+				candidates.append(equivalence_class)
+				self.classes.append(equivalence_class)
+			equivalence_class.append(i)
+			self.class_of.append(equivalence_class)
+
+		self.representatives = sorted((c[0] for c in self.classes), key=lambda i: self.popcounts[i])
+		self.sorted_popcounts = [self.popcounts[i] for i in self.representatives]
+
+	def bdd_node(self, i):
+		"""
+		Return the BDD node of the statement i. All the statements share one BDD manager, which is only created if a candidate has to be verified.
+		"""
+		if self.manager is None:
+			self.manager = BDD(self.atomic_sentences)
+		return self.manager.from_tree(self.trees[i].root, self.built)
+
+	def verify_equivalent(self, i, j):
+		return self.bdd_node(i) == self.bdd_node(j)
+
+	def verify_entails(self, i, j):
+		"""
+		Output: Bool - whether the statement i entails the statement j, i.e., j is True in every row where i is True.
+		"""
+		if self.exact:
+			return not self.columns[i] & ~self.columns[j]
+		u, v = self.bdd_node(i), self.bdd_node(j)
+		return self.manager.apply("and", u, self.manager.negate(v)) == FALSE
+
+	def equivalence_classes(self):
+		"""
+		Output: List of the equivalence classes as lists of statements, in the order of their first statement.
+		"""
+		return [[self.statements[i] for i in c] for c in self.classes]
+
+	def equivalents(self, i):
+		"""
+		Output: List of the other statements which are equivalent to the statement i.
+		"""
+		return [self.statements[j] for j in self.class_of[i] if j != i]
+
+	def entailed_by(self, i):
+		"""
+		Input: Integer - the index of a statement of the catalog
+		Output: List of the indices of the other statements which the statement i entails, in the order of the catalog.
+
+		1.	Only one statement (the representative) of every equivalence class is checked, and its whole class is entailed if it is.
+		2.	The representatives are sorted by the number of rows in which they are True, so the ones which are True in fewer rows than
+			the statement i are skipped with a binary search.
+		3.	The column of i must be a subset of the column of the candidate, first in the rows of the signatures, then in all the rows.
+		4.	If the columns are sampled, the remaining candidates are verified with the BDDs.
+		"""
+		column, signature = self.columns[i], self.signatures[i]
+		signatures = self.signatures
+		entailed = []
+		for j in self.representatives[bisect_left(self.sorted_popcounts, self.popcounts[i]):]:
+			if signature & ~signatures[j] or column & ~self.columns[j]:
+				continue
+			if self.exact or self.class_of[j] is self.class_of[i] or self.verify_entails(i, j):
+				entailed += self.class_of[j]
+		return sorted(j for j in entailed if j != i)
+
+	def entailments(self):
+		"""
+		Output: List - for every statement of the catalog, the list of the indices of the other statements it entails.
+				The statements of an equivalence class entail the same statements, so entailed_by is called once per class.
+		"""
+		result = [None] * len(self.statements)
+		for c in self.classes:
+			entailed = set(self.entailed_by(c[0])) | {c[0]}
+			for i in c:
+				result[i] = sorted(j for j in entailed if j != i)
+		return result
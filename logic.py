@@ -1,4 +1,16 @@
+from array import array
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache, reduce
+from operator import and_, or_
+import os
+import re
+import sys
+from bdd import BDD, FALSE, TRUE, variable_order
+from sat import CNF, satisfy
+from stats import phase
+from tablefile import TruthTableFileWriter
+from writers import open_writer
 
 def split_into_list(s):
 	"""
@@ -67,7 +79,7 @@ def identify_atomic_sentences(logical_sentences):
 	1. 	First initialize the Ordered Dictionary atomic_sentences. I use Ordered Dictionary because I want to use dictionary for O(1) access time and for hashing,
 		and most importantly, I want to retain the order of atomic sentences. In addition, I can use the set property of dictionary to avoid having 
 		duplicated atomic sentences in atomic_sentences. 
-	2.	Use the helper function. If the entries are one of the connective keywords "then", "and", "or" and "not".
+	2.	Use the helper function. If the entries are one of the connective keywords (see connective_precedence) or "not".
 		If they are, ignore them, Otherwise, put them into the dictionary atomic_sentences.
 		If the entry is a list, do a recursive call using the helper function so as to identify if there is any unique atomic sentences within the list.
 	3.	Return atomic_sentences.
@@ -77,7 +89,7 @@ def identify_atomic_sentences(logical_sentences):
 
 	def helper(elem):
 		if not isinstance(elem, list) :
-			if elem not in ("then", "and", "or", "not"):
+			if elem not in connective_precedence and elem != "not":
 				atomic_sentences[elem] = None
 		else:
 			for e in elem:
@@ -88,67 +100,295 @@ def identify_atomic_sentences(logical_sentences):
 
 	return atomic_sentences
 
+connective_precedence = {"iff": 0, "then": 1, "or": 2, "xor": 2, "nor": 2, "and": 3, "nand": 3}	# "not" binds tighter than all of them
+associative_connectives = ("and", "or")	# the connectives whose nodes are flattened into one node with any number of child nodes
+connective_symbols = {"then": "->", "and": "^", "or": "V", "iff": "<->", "xor": "XOR", "nand": "NAND", "nor": "NOR"}	# used in the descriptions
+
+remove_punctuation = str.maketrans("", "", ",.!")
+
+def tokenize(s):
+	"""
+	Input: String
+	Output: A list of the tokens of the sentence: the atomic sentences, the connectives (in English) and the parentheses.
+
+	The sentence is scanned once with a regular expression. The parentheses are tokens even without spaces around them.
+	Like in split_into_list, the punctuations ",.!" are deleted first, e.g., "A.1" is the atomic sentence "A1", and the word "if" is removed.
+	"""
+	return [token for token in re.findall(r"[()]|[^\s()]+", s.translate(remove_punctuation)) if token != "if"]
+
+@lru_cache(maxsize=4096)
+def parse_statement(s):
+	"""
+	Input: String - a statement
+	Output: Tuple - the statement in postfix order, e.g., "not ( A and B ), then C" becomes ("A", "B", "and", "not", "C", "then").
+			The result is cached by the statement, so a statement which appears again is not parsed again.
+
+	The tokens are parsed in one pass with the operator-precedence (shunting-yard) algorithm, using a stack of connectives instead of recursion,
+	so deeply nested statements do not hit the recursion limit.
+	1.	When an operand is expected, "not" and "(" are pushed to the stack, and an atomic sentence is output.
+	2.	After an operand (an atomic sentence or a closing parenthesis), the "not"s in front of it on the stack are output, since "not" binds tightest.
+	3.	Before a connective is pushed, the connectives on the stack which bind at least as tightly are output. "then" is right associative,
+		so "A then B then C" is "A then ( B then C )". The other connectives are left associative. Without parentheses, "and" and "nand" bind tightest,
+		then "or", "xor" and "nor", then "then", and "iff" binds loosest.
+	4.	At a closing parenthesis, the connectives are output until the matching opening parenthesis.
+	"""
+	output = []
+	stack = []
+	expect_operand = True
+	for token in tokenize(s):
+		if expect_operand:
+			if token in ("not", "("):
+				stack.append(token)
+				continue
+			if token in connective_precedence or token == ")":
+				raise ValueError("Cannot parse statement %r: expected an atomic sentence before %r" % (s, token))
+			output.append(token)
+			expect_operand = False
+		elif token in connective_precedence:
+			while stack and stack[-1] in connective_precedence and (connective_precedence[stack[-1]] > connective_precedence[token] 
+																	or (connective_precedence[stack[-1]] == connective_precedence[token] and token != "then")):
+				output.append(stack.pop())
+			stack.append(token)
+			expect_operand = True
+			continue
+		elif token == ")":
+			while stack and stack[-1] != "(":
+				output.append(stack.pop())
+			if not stack:
+				raise ValueError("Cannot parse statement %r: unmatched ')'" % s)
+			stack.pop()
+		else:
+			raise ValueError("Cannot parse statement %r: expected a connective before %r" % (s, token))
+		while stack and stack[-1] == "not":
+			output.append(stack.pop())
+
+	if expect_operand:
+		raise ValueError("Cannot parse statement %r: incomplete statement" % s)
+	while stack:
+		if stack[-1] == "(":
+			raise ValueError("Cannot parse statement %r: unmatched '('" % s)
+		output.append(stack.pop())
+	return tuple(output)
+
+def identify_atomic_sentences_of_statements(list_of_statements):
+	"""
+	Input: List of Statements
+	Output: A dictionary of atomic sentences, in the order they appear in the statements, like identify_atomic_sentences.
+	"""
+	atomic_sentences = OrderedDict()
+	for s in list_of_statements:
+		for token in parse_statement(s):
+			if token not in connective_precedence and token != "not":
+				atomic_sentences[token] = None
+	return atomic_sentences
+
 def generate_truth_values_for_atomic_sentences(dict_atomic_sentences):
 	"""
 	Input: A dictionary which maps all the symbols of atomic sentences to None
-	Output: A dictionary which maps all the symbols to their respective lists of truth values in different orders such that
+	Output: A dictionary which maps all the symbols to their respective columns of truth values in different orders such that
 			in a truth table, we can have distinct combinations of truth values in each row.
-
-	1.	Initialize the result with two lists: one contains True and the other contains False.
-	2.	Because the truth table will have 2^n rows for n atomic sentences, we can treat the list result as a queue.
-		For each atomic sentence, dequeue all the items from the result is dequeued, and for each the item dequeued, which is a list of truth values, 
-		duplicate the list into two lists and enqueue one with True and the other with False. Enqueue the lists into a temporary queue, which 
-		becomes the result at the end of each loop of atomic sentence.
-	3.	When step (2) ends, result stores all the rows of truth values combination in the truth table.
-		However, it is better to map the atomic sentences to their columns of truth values because it is easier to print the truth value for a given
-		row and column while printing the truth table.
-	4. 	Initilize an Ordered Dictionary truth_values_atomic_sentences because I want to map the atomic sentences to their columns of truth values,
+			Each column is packed into a single Python integer: bit i of the integer is the truth value of the row i of the truth table.
+
+	1.	The truth table has 2^n rows for n atomic sentences. The rows are ordered such that the last atomic sentence alternates
+		True, False, True, False, ..., and every atomic sentence before it alternates in blocks twice as long as the atomic sentence after it.
+		The blocks of an atomic sentence start with True if the number of atomic sentences after it is even, otherwise they start with False.
+		(This is the same order which was previously produced by duplicating the rows of the table with a queue.)
+	2.	For each atomic sentence, create one period of its column, which is a block of 1-bits followed by a block of 0-bits (or the other way round).
+		Then repeat the period across all the rows by doubling it, i.e., copying the bits filled so far next to themselves with a shift.
+	3. 	Initilize an Ordered Dictionary truth_values_atomic_sentences because I want to map the atomic sentences to their columns of truth values,
 		and most importantly, I want to retain the order of atomic sentences.
-	5.	Use a for-loop and list comprehension to generate the columns of truth values and map it to the atomic sentences.
-	6. 	Return truth_values_atomic_sentences.
+	4. 	Return truth_values_atomic_sentences.
 	"""
-	
-	result = [[True], [False]]
-	
-	def generate_helper(dict_atomic_sentences, idx):
-		if idx < len(dict_atomic_sentences):
-			tmp = []
-			nonlocal result
-			while result:
-				row = result.pop()
-				row_1 = row[:] + [True]
-				row_2 = row[:] + [False]
-				tmp.append(row_1)
-				tmp.append(row_2)
-			result = tmp[:]
-			generate_helper(dict_atomic_sentences, idx+1)
-
-	generate_helper(dict_atomic_sentences, 1)	# start from the second atomic sentence because the result is initialized as [[True], [False]] instead of [].
+	n = len(dict_atomic_sentences)
 
 	truth_values_atomic_sentences = OrderedDict()
-	def assign_to_atomic_sentences(result):
-		col = 0
-		for s in dict_atomic_sentences:
-			truth_values_atomic_sentences[s] = [result[row][col] for row in range(len(result))]
-			col += 1
-	
-	assign_to_atomic_sentences(result)
+	for col, s in enumerate(dict_atomic_sentences):
+		shift = n - 1 - col	# number of atomic sentences after s
+		block = (1 << 2**shift) - 1
+		column = block if shift % 2 == 0 else block << 2**shift
+		filled = 2**(shift+1)
+		while filled < 2**n:
+			column |= column << filled
+			filled *= 2
+		truth_values_atomic_sentences[s] = column
+
+	return truth_values_atomic_sentences
+
+def generate_truth_values_for_block(dict_atomic_sentences, block, fixed):
+	"""
+	Input: 1. A dictionary which maps all the symbols of atomic sentences to None
+		   2. block : Integer - the index of the block of rows
+		   3. fixed : Integer - the number of atomic sentences, counted from the first one, whose truth values are fixed within a block
+	Output: An Ordered Dictionary which maps all the symbols to their columns of truth values in the block-th block of the truth table.
+
+	The 2^n rows of the truth table are split into 2^fixed blocks of 2^(n-fixed) consecutive rows. Within a block,
+	1.	The first fixed atomic sentences keep the same truth value, so their columns are all True or all False.
+	2.	The other atomic sentences repeat their pattern, so their columns are the same as a truth table of those atomic sentences only.
+	Therefore, row i of the block is row block * 2^(n-fixed) + i of the truth table.
+	"""
+	atoms = list(dict_atomic_sentences)
+	n, free = len(atoms), len(atoms) - fixed
+	mask = column_mask(2**free)
+
+	truth_values_atomic_sentences = OrderedDict()
+	for col, s in enumerate(atoms[:fixed]):
+		shift = n - 1 - col	# number of atomic sentences after s
+		truth_values_atomic_sentences[s] = mask if (block >> (shift - free)) & 1 == shift & 1 else 0
+	truth_values_atomic_sentences.update(generate_truth_values_for_atomic_sentences(OrderedDict.fromkeys(atoms[fixed:])))
 	return truth_values_atomic_sentences
 
+def join_columns(columns, row_count):
+	"""
+	Input: 1. A list of columns of truth values of consecutive blocks of rows
+		   2. Integer - number of rows in each block
+	Output: Integer - the column of truth values of all the blocks, one after another.
+	"""
+	if row_count % 8:
+		return sum(column << (i * row_count) for i, column in enumerate(columns))
+	return int.from_bytes(b"".join(column.to_bytes(row_count // 8, "little") for column in columns), "little")
+
+def extend_column(column, row_count):
+	"""
+	Input: 1. Integer - a column of truth values of a truth table
+		   2. Integer - number of rows in the truth table
+	Output: Integer - the same column in the truth table with one more atomic sentence after all the others, which has 2 * row_count rows.
+
+	By the order of the rows (see generate_truth_values_for_atomic_sentences), adding an atomic sentence after all the others reverses the rows,
+	and duplicates every row: once with the new atomic sentence True and once with it False. A logical statement without the new atomic sentence
+	has the same truth value in both. Therefore, the column is extended by reversing its bits and doubling every bit, without evaluating it again.
+	"""
+	bits = format(column, "0%db" % row_count)	# row_count - 1, ..., 1, 0
+	return int(bits[::-1].translate({ord("0"): "00", ord("1"): "11"}), 2)
+
+def column_mask(row_count):
+	"""
+	Input: Integer - number of rows in the truth table
+	Output: Integer - a column whose truth values are all True.
+
+	Since the columns of truth values are packed into integers, negating a column is an exclusive-or with this mask.
+	"""
+	return (1 << row_count) - 1
+
+def connective_column(connective, columns, mask):
+	"""
+	Input: 1. connective : String - one of the connectives in connective_precedence
+		   2. columns : List of Integers - the columns of truth values of the child nodes, from left to right. 
+		   	  "and" and "or" take any number of columns, the other connectives take two.
+		   3. mask : Integer - column_mask of the number of rows
+	Output: Integer - the column of truth values of the connective applied to the columns. Each connective is one fused bitwise expression 
+			over the whole columns: "and" is c1 & c2 & ... & ck, "or" is c1 | c2 | ... | ck, "then" is ~l | r, "iff" is ~(l ^ r), "xor" is l ^ r, 
+			"nand" is ~(l & r) and "nor" is ~(l | r). The negation ~ is an exclusive-or with the mask.
+	"""
+	if connective == "and":
+		return reduce(and_, columns)
+	if connective == "or":
+		return reduce(or_, columns)
+	left, right = columns
+	if connective == "then":
+		return (left ^ mask) | right
+	if connective == "iff":
+		return left ^ right ^ mask
+	if connective == "xor":
+		return left ^ right
+	if connective == "nand":
+		return (left & right) ^ mask
+	if connective == "nor":
+		return (left | right) ^ mask
+
+def connective_value(connective, values):
+	"""
+	Input: 1. connective : String - one of the connectives in connective_precedence
+		   2. values : List of Bools - the truth values of the child nodes, from left to right
+	Output: Bool - the truth value of the connective applied to the values, like connective_column for one row.
+	"""
+	if connective == "and":
+		return all(values)
+	if connective == "or":
+		return any(values)
+	left, right = values
+	if connective == "then":
+		return (not left) or right
+	if connective == "iff":
+		return left == right
+	if connective == "xor":
+		return left != right
+	if connective == "nand":
+		return not (left and right)
+	if connective == "nor":
+		return not (left or right)
+
+def unpack_column(column, row_count):
+	"""
+	Input: 1. Integer - a column of truth values packed into an integer.
+		   2. Integer - number of rows in the truth table
+	Output: A list of the truth values (True/False) of the column, row by row.
+	"""
+	bits = format(column, "0%db" % row_count)[::-1] if row_count else ""
+	return [b == "1" for b in bits]
+
+def assignment_of_row(dict_atomic_sentences, row):
+	"""
+	Input: 1. A dictionary which maps all the symbols of atomic sentences to None
+		   2. Integer - the index of a row in the truth table
+	Output: An Ordered Dictionary mapping every symbol of atomic sentences to its truth value in that row.
+
+	The rows are in the same order as the columns generated by generate_truth_values_for_atomic_sentences, i.e., in row r,
+	the atomic sentence with k atomic sentences after it is True if and only if the k-th bit of r equals the parity of k.
+	"""
+	n = len(dict_atomic_sentences)
+	return OrderedDict((s, (row >> (n-1-col)) & 1 == (n-1-col) & 1) for col, s in enumerate(dict_atomic_sentences))
+
+def verdict_of_columns(premises, conclusion, dict_atomic_sentences=None):
+	"""
+	Input: 1. Integer - the column of the conjunction of all the premises
+		   2. Integer - the column of the conclusion
+		   3. A dictionary which maps all the symbols of atomic sentences to None, or None
+	Output: Tuple - (String - whether the argument is valid or invalid, the counterexample or None). The counterexample is the first row 
+			of the columns in which all the premises are True and the conclusion is False, i.e., the lowest 1-bit of premises & ~conclusion,
+			as an Ordered Dictionary (see assignment_of_row), or as the index of the row if dict_atomic_sentences is None.
+
+	1.	If there is any row when all the premises are True and the conclusion is False, the argument is "Not Valid".
+	2.	Otherwise, if there is a row when all the premises and the conclusion are True, the argument "Is Valid".
+	3.	Otherwise, (all the statements are) "Not Logically Connected".
+	"""
+	counterexamples = premises & ~conclusion
+	if counterexamples:
+		row = (counterexamples & -counterexamples).bit_length() - 1
+		return "Not Valid", (row if dict_atomic_sentences is None else assignment_of_row(dict_atomic_sentences, row))
+	if premises & conclusion:
+		return "Is Valid", None
+	return "Not Logically Connected", None
+
+def generate_assignments(dict_atomic_sentences):
+	"""
+	Input: A dictionary which maps all the symbols of atomic sentences to None
+	Output: A generator which lazily yields the rows of the truth table, one at a time, as Ordered Dictionaries mapping
+			every symbol of atomic sentences to its truth value in that row (see assignment_of_row).
+
+	Only one row exists at a time, so the rows can be searched without building the 2^n columns.
+	"""
+	for row in range(2**len(dict_atomic_sentences)):
+		yield assignment_of_row(dict_atomic_sentences, row)
+
 class Node:
 	"""
 	Attributes:
-	data : String - contains the symbol for atomic sentences (e.g., "A", "B", "C") and ordinary language of connectives("then", "and", "or").
+	data : String - contains the symbol for atomic sentences (e.g., "A", "B", "C") and ordinary language of connectives("then", "and", "or", "iff", "xor", "nand", "nor").
 	
 	negation : Bool - whether the atomic sentence or the logical statement is negated
-	truth_values : Ordered Dictionary - map the node's description, desc, to its column of truth values in the truth table. This takes into account of the negation. 
+	truth_values : Integer - the node's column of truth values in the truth table packed into an integer (bit i is the truth value of row i). This takes into account of the negation.
+	truth_values_wo_negation : Integer - the node's column of truth values EXCLUDING the negation.
 	
 	desc : String - contains the symbol for atomic sentences (e.g., "A", "B", "C") or describe the relationship between the two chldren nodes(e.g., "A -> B", "A ^ B", "A V B") INCLUDING the negation symbol.
 	desc_wo_negation: String - contains the symbol for atomic sentences (e.g., "A", "B", "C") or describe the relationship between the two chldren nodes(e.g., "A -> B", "A ^ B", "A V B") EXCLUDING the negation symbol.
 	
+	value : Bool - the node's truth value in the current row of a row-at-a-time evaluation (see generate_rows_gray). This takes into account of the negation.
+
 	p : Node - parent node
-	left : Node - left child's node
-	right : Node - right child's node
+	children : List of Nodes - the child nodes, from left to right. It is empty for a leaf. The nodes of "and" and "or" can have any number of child nodes,
+			   e.g., "A and B and C" is one node with three child nodes. The nodes of the other connectives have two child nodes.
+	left : Node - left child's node, i.e., the first child node, or None for a leaf
+	right : Node - right child's node, i.e., the last child node, or None for a leaf
 	"""
 
 	def __init__(self, data):
@@ -159,10 +399,46 @@ class Node:
 		self.truth_values_wo_negation = None
 		self.desc = None
 		self.desc_wo_negation = None
-		self.left = None
-		self.right = None
+		self.value = None
+		self.children = []
 		self.p = None
 
+	@property
+	def left(self):
+		return self.children[0] if self.children else None
+
+	@property
+	def right(self):
+		return self.children[-1] if self.children else None
+
+class LRUCache(OrderedDict):
+	"""
+	This is a class for an Ordered Dictionary of at most maxsize entries, like the cache of functools.lru_cache.
+	When it is full, the least recently used entry is evicted. misses counts the keys which were looked up but not found.
+	"""
+
+	def __init__(self, maxsize):
+		super().__init__()
+		self.maxsize = maxsize
+		self.misses = 0
+
+	def lookup(self, key):
+		if key in self:
+			self.move_to_end(key)
+			return self[key]
+		self.misses += 1
+		return None
+
+	def store(self, key, value):
+		self[key] = value
+		if len(self) > self.maxsize:
+			self.popitem(last=False)
+		return value
+
+compiled_formulas = LRUCache(4096)	# maps the descriptions of logical statements to their compiled functions (see Tree.compile)
+row_templates = {"then": "((not %s) or %s)", "iff": "(%s == %s)", "xor": "(%s != %s)", "nand": "(not (%s and %s))", "nor": "(not (%s or %s))"}
+column_templates = {"then": "(%s ^ m) | %s", "iff": "%s ^ %s ^ m", "xor": "%s ^ %s", "nand": "(%s & %s) ^ m", "nor": "(%s | %s) ^ m"}
+
 class Tree:
 
 	"""
@@ -192,13 +468,16 @@ class Tree:
 		root : Node - root of the Tree
 		truth_tables_output : Ordered Dictionary that maps the premises and conclusion to their columns of truth values in the truth table.
 		Ordered Dictionary is used to ensure that O(1) access time, and that the premises are put in order of complexity and that conclusion comes before premises.
+		row_count : Integer - number of rows in the columns of truth values, which is set when the truth values are assigned to the nodes.
 		"""
 		self.root = None
 		self.truth_tables_output = OrderedDict()
+		self.row_count = None
 
-	def create_logic_tree(self, list_x):
+	def create_logic_tree(self, list_x, node_table=None):
 		"""
-		Input: List of entries list_x that compose a statement, e.g., ["not", ["A", "and", "B"]]
+		Input: 1. List of entries list_x that compose a statement, e.g., ["not", ["A", "and", "B"]]
+			   2. node_table : Dictionary (optional) shared by the Logic Trees of an argument to intern their nodes. See step (6).
 		Output: Root of the tree. The Logic Tree is created.
 
 		1.	Assign the list of entries list_x to the root.
@@ -218,10 +497,15 @@ class Tree:
 			The first and third entries in tmp_list_wo_not are made into left and right child nodes respectively, and the second entry 
 			is made into a parent node as the parent node should connnect two child nodes to represent the relationship between the child nodes.
 
-			The second step is to negate the child nodes. (Parent node is not negated because there is no "not" before the connective).
+			The second step is to negate the child nodes which come after "not", and count the negations in their negation_count. 
+			(Parent node is not negated because there is no "not" before the connective).
 
 			The final step is to check if the child nodes are atomic sentences. If they are not, then the node.data will store a list.
 			Therefore, we have to recursively call the helper function on the child nodes to break down the list. 
+		6.	If node_table is given, replace every node by the structurally identical node (same data, negation and child nodes) already in node_table,
+			from the leaves up to the root, so that the trees sharing node_table form one DAG. For example, if ( if p, then q ) appears in three
+			statements, the three trees share one node, and its column of truth values and its description are computed once.
+			A shared node keeps the parent node p through which it was first created.
 		"""
 		self.root = Node(list_x)
 
@@ -243,72 +527,122 @@ class Tree:
 			tmp_list_wo_not = [elem for elem in node.data if elem != "not"]
 
 			node.data = tmp_list_wo_not[1]
-			node.left = Node(tmp_list_wo_not[0])
-			node.right = Node(tmp_list_wo_not[2])
+			node.children = [Node(tmp_list_wo_not[0]), Node(tmp_list_wo_not[2])]
 			node.left.p, node.right.p = node, node
 
-			for i in range(len(tmp_list)):
-				if tmp_list[i] == "not":
-					if tmp_list[i+1] == node.left.data:
-						node.left.negation = not node.left.negation
-					elif tmp_list[i+1] == node.right.data:
-						node.right.negation = not node.right.negation
+			position = 0	# number of entries of tmp_list_wo_not passed so far
+			for elem in tmp_list:
+				if elem == "not":	# "not" negates the entry after it, which is the left child node before the connective and the right child node after
+					child = node.left if position == 0 else node.right
+					child.negation = not child.negation
+					child.negation_count += 1
+				else:
+					position += 1
 
 			if isinstance(node.left.data, list):	#left child node is not atomic sentence
 				create_logic_tree_helper(node.left)
 			if isinstance(node.right.data, list):	#right child node is not atomic sentence
 				create_logic_tree_helper(node.right)
 
+		def intern(node):
+			node.children = [intern(child) for child in node.children]
+			key = (node.data, node.negation, node.negation_count, tuple(map(id, node.children)))
+			if key not in node_table:
+				node_table[key] = node
+			return node_table[key]
+
 		create_logic_tree_helper(self.root)
+		if node_table is not None:
+			self.root = intern(self.root)
 		return self.root
 
-	def assign_truth_values_to_node(self, atomic_truth_values_dict):
+	def create_logic_tree_from_statement(self, s, node_table=None):
 		"""
-		Input: An Ordered Dictionary atomic_truth_values_dict mapping atomic sentences to their respective columns of truth values.
+		Input: 1. String - a statement, e.g., "not ( A and B )"
+			   2. node_table : Dictionary (optional) shared by the Logic Trees of an argument to intern their nodes, like create_logic_tree.
+		Output: Root of the tree. The Logic Tree is created, and it is the same as the one created by create_logic_tree from 
+				replace_parentheses_with_list(split_into_list(s)), except that the nodes of "and" and "or" are flattened.
+
+		The nodes are built directly from the postfix order of parse_statement, without the intermediate nested lists, using a stack of nodes:
+		1.	An atomic sentence pushes a leaf.
+		2.	"not" negates the node on the top of the stack and counts the negation in its negation_count.
+		3.	A connective pops the right and the left child nodes and pushes their parent node.
+			Since a child node can no longer be negated once it has a parent, it is interned in node_table at this point.
+		4.	If the connective is "and" or "or", and a child node is a node of the same connective without negation, its child nodes become
+			the child nodes of the parent node instead. Therefore, "A and B and C" is one node with three child nodes instead of a chain of two nodes,
+			and its column of truth values is computed without the column of "A and B".
+		"""
+		def intern(node):
+			if node_table is None:
+				return node
+			key = (node.data, node.negation, node.negation_count, tuple(map(id, node.children)))
+			if key not in node_table:
+				node_table[key] = node
+			return node_table[key]
+
+		stack = []
+		for token in parse_statement(s):
+			if token == "not":
+				node = stack[-1]
+				node.negation = not node.negation
+				node.negation_count += 1
+			elif token in connective_precedence:
+				node = Node(token)
+				right = stack.pop()
+				left = stack.pop()
+				for child in (left, right):
+					if token in associative_connectives and child.data == token and not child.negation_count:
+						for grandchild in child.children:
+							if grandchild.p is child:
+								grandchild.p = None
+						node.children += child.children
+					else:
+						node.children.append(intern(child))
+				for child in node.children:
+					if child.p is None:
+						child.p = node
+				stack.append(node)
+			else:
+				stack.append(Node(token))
+
+		self.root = intern(stack.pop())
+		return self.root
+
+	def assign_truth_values_to_node(self, atomic_truth_values_dict, row_count=None):
+		"""
+		Input: 1. An Ordered Dictionary atomic_truth_values_dict mapping atomic sentences to their respective columns of truth values.
+			   2. row_count : Integer - number of rows in the columns. By default, it is 2^n for the n atomic sentences in atomic_truth_values_dict.
 		Output: Root of the tree. All the nodes in the tree are assigned to their columns of truth values in the truth table.
 
 		1.	If the node's truth_values attribute is None, we have to assign its column of truth values to this truth_values attribute.
+			The nodes are visited with post_order, so the columns of the child nodes are assigned first, without recursion.
 		2.	If the node is a leaf, it means the node is an atomic sentence. Therefore, we use the inputted atomic_truth_values_dict to assign
 			the node's column of truth values to the node.truth_values attribute.
 		3.	If the node is an internal node, it means the node represents the connective. We use the connective, which is stored in node.data, 
 			to find the column of truth values for the node depending on whether the connective is a conjunction, disjunction or implication.
+			Since the columns are packed into integers, each connective is a single bitwise expression over the whole columns of all the child nodes
+			(see connective_column), e.g., "and" is c1 & c2 & ... & ck, "or" is c1 | c2 | ... | ck and "then" is ~l | r.
 
 			Also, if the node is negated, we first store the columns of truth values that have not been negated into node.truth_values_wo_negation.
-			Then, we negate all the truth value in the node.truth_values. The reason to store the truth values that are not negated is that
-			in truth table, we may have to print both the logical statements that is not negated and that is negated.
+			Then, we negate all the truth value in the node.truth_values, which is an exclusive-or with the mask of all the rows. 
+			The reason to store the truth values that are not negated is that in truth table, we may have to print both the logical statements 
+			that is not negated and that is negated.
 		4. 	Return the root. 
 		"""
-		def helper(node):
-			if not node.truth_values:
-				if not node.left and not node.right:	#the node is a leaf
-					node.truth_values = atomic_truth_values_dict[node.data]
-					if node.negation:
-						node.truth_values_wo_negation = node.truth_values[:]
-						node.truth_values = [not t_value for t_value in node.truth_values]
-				else: #node is an internal node, i.e., it has left and right child nodes
-					node.truth_values = []
-					helper(node.left)
-					helper(node.right)
-					if node.data == "and":
-						for i in range(len(node.left.truth_values)):
-							node.truth_values.append(node.left.truth_values[i] and node.right.truth_values[i])
-						if node.negation:
-							node.truth_values_wo_negation = node.truth_values[:]
-							node.truth_values = [not t_value for t_value in node.truth_values]	
-					if node.data == "or":
-						for i in range(len(node.left.truth_values)):
-							node.truth_values.append(node.left.truth_values[i] or node.right.truth_values[i])
-						if node.negation:
-							node.truth_values_wo_negation = node.truth_values[:]
-							node.truth_values = [not t_value for t_value in node.truth_values]	
-					if node.data == "then":
-						for i in range(len(node.left.truth_values)):
-							node.truth_values.append((not node.left.truth_values[i]) or node.right.truth_values[i])
-						if node.negation:
-							node.truth_values_wo_negation = node.truth_values[:]
-							node.truth_values = [not t_value for t_value in node.truth_values]	
-
-		helper(self.root)	
+		if row_count is None:
+			row_count = 2**len(atomic_truth_values_dict)
+		self.row_count = row_count
+		mask = column_mask(row_count)
+
+		for node in post_order([self.root], lambda node: node.truth_values is not None):	# the child nodes come before their parent node
+			if not node.children:	#the node is a leaf
+				node.truth_values = atomic_truth_values_dict[node.data]
+			else: #node is an internal node, i.e., it has child nodes
+				node.truth_values = connective_column(node.data, [child.truth_values for child in node.children], mask)
+			if node.negation:
+				node.truth_values_wo_negation = node.truth_values
+				node.truth_values = node.truth_values ^ mask
+
 		return self.root
 
 	def describe(self, node):
@@ -318,13 +652,13 @@ class Tree:
 		Output: None. All the node.desc attributes are filled with descriptions of what the respective node means (in other words, the logical statement).
 				Examples of description : ~ ( B -> C ), ( ( C V A ) ^ B ), ~ ~ ~ A
 
-		1.  Base case: the node must be valid, i.e., not None.
-		2.	Since the inputted node is from root node, and we need the description about the node's left and right child nodes before we can describe
-			the node, recursively call the describe method on the node's left and right child nodes.
+		1.  Base case: the node must be valid, i.e., not None, and not described yet.
+		2.	Since the inputted node is from root node, and we need the description about the node's child nodes before we can describe
+			the node, the nodes are visited in post-order with post_order, which does not recurse, so any depth can be described.
 		3.	If the node itself is an atomic sentence, the description is the node.data, which is "A", "B", "C", etc.
-		4.	If the node itself is not an atomic sentence, then its node.data must contain the connective "then", "and", or "or".
-			Transform the connective into its symbol and sandwich it between the descriptions of left and right child nodes to represent the relationship between
-			the left and right child nodes, which can be implication, conjunction or disjuntion.
+		4.	If the node itself is not an atomic sentence, then its node.data must contain a connective, e.g., "then", "and", or "or".
+			Transform the connective into its symbol (see connective_symbols) and put it between the descriptions of the child nodes to represent 
+			the relationship between the child nodes, which can be implication, conjunction, disjuntion, etc., e.g., ( A ^ B ^ C ) or ( A <-> B ).
 		5.  For both step 3 and step 4,if there the node is negated, stores the description without the symbol ~ in node.desc_wo_negation
 			This is because in the truth table, we may need to print out the description, or the logical statement in both not negated and negated from. 
 			
@@ -333,38 +667,122 @@ class Tree:
 			If the node is not negated but the node.negation_count is more than 0, it means that there is double negation.
 			Therefore we adding node.negation_count (which is an even number) number of "~" in front of the original node.desc.	
 		"""
-		if node:
-			self.describe(node.left)
-			self.describe(node.right)
-			if node.data not in ("then", "and", "or"):	#atomic sentence
+		if not node:
+			return
+		for node in post_order([node], lambda node: node.desc is not None):	# a node shared with another tree may already be described
+			if not node.children:	#atomic sentence
 				node.desc = node.data
-				if node.negation:
-					node.desc_wo_negation = node.desc
-					node.desc = "~ "*node.negation_count + node.desc
-				if node.negation_count and not node.negation:
-					node.desc = "~ "*node.negation_count + node.desc
 			else:	#not an atomic sentence
-				if node.data == "then":
-					node.desc = "( " + node.left.desc + " -> " + node.right.desc + " )"
-					if node.negation:
-						node.desc_wo_negation = node.desc
-						node.desc = "~ "*node.negation_count + node.desc
-					if node.negation_count and not node.negation:
-						node.desc = "~ "*node.negation_count + node.desc
-				elif node.data == "and":
-					node.desc = "( " + node.left.desc + " ^ " + node.right.desc + " )"
-					if node.negation:
-						node.desc_wo_negation = node.desc
-						node.desc = "~ "*node.negation_count + node.desc
-					if node.negation_count and not node.negation:
-						node.desc = "~ "*node.negation_count + node.desc
-				elif node.data == "or":
-					node.desc = "( " + node.left.desc + " V " + node.right.desc + " )"
-					if node.negation:
-						node.desc_wo_negation = node.desc
-						node.desc = "~ "*node.negation_count + node.desc
-					if node.negation_count and not node.negation:
-						node.desc = "~ "*node.negation_count + node.desc
+				node.desc = connective_description(node.data, [child.desc for child in node.children])
+			if node.negation:
+				node.desc_wo_negation = node.desc
+				node.desc = "~ "*node.negation_count + node.desc
+			if node.negation_count and not node.negation:
+				node.desc = "~ "*node.negation_count + node.desc
+
+	def compile(self):
+		"""
+		Output: Tuple - (row function, column function). Both are compiled from the logical statement (the root) of the tree.
+				row function(assignment) : Bool - the truth value of the logical statement for a dictionary mapping atomic sentences to their truth values.
+				column function(columns, mask) : Integer - the column of truth values of the logical statement for a dictionary mapping atomic 
+												 sentences to their columns of truth values, where mask is column_mask of the number of rows.
+
+		Interpreting the tree means walking through the nodes and comparing node.data with the connectives at every node, every time.
+		Instead, the tree is turned into Python source code once and compiled with compile().
+		1.	The row function is one nested boolean expression, e.g., "( A -> ~ B )" becomes lambda v: ((not v['A']) or (not v['B'])),
+			so the evaluation short-circuits exactly like Tree.evaluate.
+			If the expression is nested too deeply for the Python compiler, the row function interprets the tree instead.
+		2.	The column function is a sequence of bitwise operations over packed columns, one line per distinct node, e.g.,
+			t1 = c['A']; t2 = c['B'] ^ m; t3 = (t1 ^ m) | t2; return t3
+		3.	The compiled functions are cached in compiled_formulas by the description of the root (see describe), so the trees of the same
+			logical statement are only compiled once. The cache keeps the 4096 most recently used statements.
+		The nodes are visited with post_order, which does not recurse, so the column function can be compiled for any depth.
+		"""
+		if self.root.desc is None:
+			self.describe(self.root)
+		key = self.root.desc
+		compiled = compiled_formulas.lookup(key)
+		if compiled:
+			return compiled
+
+		def row_source(node):
+			if not node.children:	#the node is a leaf
+				source = "v[%r]" % node.data
+			elif node.data in associative_connectives:
+				source = "(%s)" % (" %s " % node.data).join(row_source(child) for child in node.children)
+			else:
+				source = row_templates[node.data] % (row_source(node.left), row_source(node.right))
+			return "(not %s)" % source if node.negation else source
+
+		lines = []
+		names = {}
+		for node in post_order([self.root]):	# one line per distinct node, after the lines of its child nodes
+			if not node.children:	#the node is a leaf
+				source = "c[%r]" % node.data
+			elif node.data in associative_connectives:
+				source = (" & " if node.data == "and" else " | ").join(names[id(child)] for child in node.children)
+			else:
+				source = column_templates[node.data] % (names[id(node.left)], names[id(node.right)])
+			if node.negation:
+				source = "(%s) ^ m" % source
+			names[id(node)] = "t%d" % len(lines)
+			lines.append("\t%s = %s" % (names[id(node)], source))
+
+		try:
+			row_function = eval(compile("lambda v: " + row_source(self.root), "<formula %s>" % key, "eval"))
+		except (RecursionError, SyntaxError, MemoryError):	# too deeply nested
+			row_function = self.interpret
+		namespace = {}
+		exec(compile("def column_function(c, m):\n%s\n\treturn %s\n" % ("\n".join(lines), names[id(self.root)]), "<formula %s>" % key, "exec"), namespace)
+
+		return compiled_formulas.store(key, (row_function, namespace["column_function"]))
+
+	def evaluate(self, assignment):
+		"""
+		Input: A dictionary assignment mapping atomic sentences to their truth values in one row of the truth table.
+		Output: Bool - the truth value of the logical statement (the root) in that row, using the compiled row function.
+		"""
+		return self.compile()[0](assignment)
+
+	def evaluate_column(self, atomic_truth_values_dict, row_count=None):
+		"""
+		Input: 1. An Ordered Dictionary atomic_truth_values_dict mapping atomic sentences to their respective columns of truth values.
+			   2. row_count : Integer - number of rows in the columns. By default, it is 2^n for the n atomic sentences in atomic_truth_values_dict.
+		Output: Integer - the column of truth values of the logical statement (the root), using the compiled column function.
+				Unlike assign_truth_values_to_node, the columns of the other nodes are not kept.
+		"""
+		if row_count is None:
+			row_count = 2**len(atomic_truth_values_dict)
+		return self.compile()[1](atomic_truth_values_dict, column_mask(row_count))
+
+	def interpret(self, assignment):
+		"""
+		Input: A dictionary assignment mapping atomic sentences to their truth values in one row of the truth table.
+		Output: Bool - the truth value of the logical statement (the root) in that row.
+
+		This is the row function of the statements which are nested too deeply for the Python compiler (see compile),
+		so the nodes are visited with post_order instead of recursion.
+		1.	If the node is a leaf, look up the truth value of the atomic sentence in assignment.
+		2.	If the node is an internal node, apply its connective to the truth values of its child nodes with connective_value.
+		3.	Flip the truth value if the node is negated.
+		"""
+		values = {}
+		for node in post_order([self.root]):
+			if not node.children:	#the node is a leaf
+				value = assignment[node.data]
+			else:
+				value = connective_value(node.data, [values[id(child)] for child in node.children])
+			values[id(node)] = value != node.negation
+		return values[id(self.root)]
+
+	def clear_truth_values(self):
+		"""
+		Modifying method. Reset the columns of truth values of all the nodes to None, so that they can be assigned again with other columns,
+		e.g., for another block of rows.
+		"""
+		for node in dag_nodes([self]):
+			node.truth_values = None
+			node.truth_values_wo_negation = None
 
 	def ordered_dict_is_empty(self):
 		"""
@@ -380,67 +798,438 @@ class Tree:
 		Output: None. The ordered dictionary truth_tables_output of the tree is modified to map the all the nodes which will appear 
 				in the truth table's header row to their respective columns of truth values.
 
-		1.	If the node is not a leaf node, recursively call the function on its left and right child nodes.
-			If the logical statement (which is the node) is being negated, map the logical statement which is not negated to the truth values which are not negated.
+		1.	The nodes are visited with post_order, so the child nodes are mapped before their parent node, without recursion.
+			A node shared by several parents is visited once, which does not change the order of truth_tables_output.
+		2.	If the node is not a leaf node and the logical statement (which is the node) is being negated, map the logical statement 
+			which is not negated to the truth values which are not negated.
 			Regardless of whether or not the node is negated, map the logical statement to its column of truth values.
-		2.	If the node is a leaf node, check if its negation count is more than 0. If it is not, it means it is a simple atomic sentences, which already 
+		3.	If the node is a leaf node, check if its negation count is more than 0. If it is not, it means it is a simple atomic sentences, which already 
 			exists in truth_values_atomic_sentences. Therefore, we can ig nore it.
 			If the negation count is more than 0, we map the logical statement to its column of truth values.
 		"""
-		if node and node.left and node.right:	#not a leaf node
-			self.truth_tables_complex_sent(node.left)
-			self.truth_tables_complex_sent(node.right)
-			if node.negation:
-				self.truth_tables_output[node.desc_wo_negation] = node.truth_values_wo_negation
-			self.truth_tables_output[node.desc] = node.truth_values
-		elif node.negation_count: # includes ~ "A" (i.e., negation of atomic sentences) or ~ ~ "A" (i.e., double, triple...negation of the atomic sentences)
-			self.truth_tables_output[node.desc] = node.truth_values
+		for node in post_order([node]):
+			if node.children:	#not a leaf node
+				if node.negation:
+					self.truth_tables_output[node.desc_wo_negation] = node.truth_values_wo_negation
+				self.truth_tables_output[node.desc] = node.truth_values
+			elif node.negation_count: # includes ~ "A" (i.e., negation of atomic sentences) or ~ ~ "A" (i.e., double, triple...negation of the atomic sentences)
+				self.truth_tables_output[node.desc] = node.truth_values
+
+def post_order(roots, skip=None):
+	"""
+	Input: 1. A list of nodes
+		   2. skip : Function (optional) - a node for which skip(node) is True is not visited, and neither are its child nodes through it.
+	Output: A generator of the distinct nodes reachable from the roots in post-order, i.e., the child nodes come before their parent node,
+			from left to right. A node shared by several parents is visited once.
+
+	The nodes are visited with an explicit stack instead of recursion, so the depth of the trees is not limited by the recursion limit of Python.
+	Every node is pushed once to be expanded, and once more to be yielded after all its child nodes.
+	"""
+	visited = set()
+	stack = [(root, False) for root in reversed(roots)]
+	while stack:
+		node, expanded = stack.pop()
+		if expanded:
+			yield node
+		elif id(node) not in visited and not (skip and skip(node)):
+			visited.add(id(node))
+			stack.append((node, True))
+			stack += [(child, False) for child in reversed(node.children)]
+
+def dag_nodes(logic_trees):
+	"""
+	Input: A list of logic trees
+	Output: A list of all the distinct nodes of the trees in post-order, i.e., the child nodes come before their parent node.
+			A node shared by several trees (see Tree.create_logic_tree) appears once.
+	"""
+	return list(post_order([T.root for T in logic_trees]))
 
-def print_truth_table(truth_values_atomic_sentences, logic_trees, logic_trees_complex):
+def truth_table_header(truth_values_atomic_sentences, logic_trees):
 	"""
-	Input: 1. A dictionary truth_values_atomic_sentences which maps each symbol of atomic sentence to their respective lists of truth values.
+	Input: 1. A dictionary truth_values_atomic_sentences which maps each symbol of atomic sentence to their respective columns of truth values.
+		   2. A list of logic trees
+	Output: List - the header row of the truth table, which are all the symbols for the atomic sentences and statements (see header_row).
+	"""
+	return header_row(truth_values_atomic_sentences, [T.truth_tables_output for T in logic_trees], 
+					  [T.root.data if T.ordered_dict_is_empty() else None for T in logic_trees])
+
+def header_row(atomic_sentences, logic_trees_complex, root_atoms):
+	"""
+	Input: 1. The atomic sentences which have their own columns, in order.
+		   2. A list logic_trees_complex of the dictionaries which map the logical statements of each statement to their columns of truth values 
+		   	  (see Tree.truth_tables_complex_sent).
+		   3. A list of the atomic sentence of each statement which is a single atomic sentence without negation, or None for the other statements.
+	Output: List - the header row of the truth table. It is shared by the Logic Trees (truth_table_header) and the FlatTree.
+
+	1.	The atomic sentences come first, then the separator "|".
+	2.	The logical statements of every statement are appended in order, each only the first time it appears.
+	3.	A statement which is a single atomic sentence has no logical statements, and its atomic sentence is appended again.
+	"""
+	top_row = [t for t in atomic_sentences] + ['|']	# symbols for atomic sentences
+	in_top_row = set(top_row)
+	
+	for complex_sent, root_atom in zip(logic_trees_complex, root_atoms):
+		for v in complex_sent:	# this loop appends all the descriptions of internal nodes in the logical tree into top_row
+			if v not in in_top_row:
+				top_row.append(v)
+				in_top_row.add(v)
+		if root_atom is not None:	# this is for the case where the root is the leaf.
+			top_row.append(root_atom)
+	return top_row
+
+def connective_description(connective, descriptions):
+	"""
+	Output: String - the description of a node of the connective whose child nodes have the descriptions, e.g., ( A ^ B ^ C ) or ( A <-> B ).
+	"""
+	return "( " + (" %s " % connective_symbols[connective]).join(descriptions) + " )"
+
+def resolve_truth_table_columns(top_row, truth_values_atomic_sentences, logic_trees_complex):
+	"""
+	Input: 1. List - the header row of the truth table (see truth_table_header)
+		   2. A dictionary truth_values_atomic_sentences which maps each symbol of atomic sentence to their respective columns of truth values.
+		   3. A list logic_trees_complex of the dictionaries which map the logical statements of each tree to their respective columns of truth values.
+	Output: A list of the tuples (dictionary, key) where the column of each item of the header row is found, or None for the separator "|".
+
+	The dictionary which contains a logical statement is searched once here, instead of once for every row.
+	"""
+	resolved = []
+	for item in top_row:
+		if item == "|":
+			resolved.append(None)
+		# if the column is a symbol for atomic sentences
+		elif item in truth_values_atomic_sentences:
+			resolved.append((truth_values_atomic_sentences, item))
+		# if the column is a logical statement
+		else:
+			resolved.append(next((t, item) for t in logic_trees_complex if item in t))
+	return resolved
+
+def truth_table_columns(resolved):
+	"""
+	Input: A list from resolve_truth_table_columns.
+	Output: A list of the columns of truth values of the header row, or None for the separator "|".
+	"""
+	return [entry[0][entry[1]] if entry else None for entry in resolved]
+
+def create_logic_trees(list_of_statements):
+	"""
+	Input: List of Statements (Argument). 
+	Output: Tuple - (A list of the Logic Trees of the statements, which share their identical subformulas through one node_table,
+					 A dictionary of the atomic sentences of the statements)
+	"""
+	logic_trees = []
+	node_table = {}
+	for s in list_of_statements:
+		T = Tree()
+		T.create_logic_tree_from_statement(s, node_table)
+		logic_trees.append(T)
+	return logic_trees, identify_atomic_sentences_of_statements(list_of_statements)
+
+def print_truth_table(truth_values_atomic_sentences, logic_trees, logic_trees_complex, file=None, table_format="fixed"):
+	"""
+	Input: 1. A dictionary truth_values_atomic_sentences which maps each symbol of atomic sentence to their respective columns of truth values.
 		   2. A list of logic trees
 		   3. A dictionary logic_trees_complex which maps all the logical statements possibly formed from the logic_trees (excluding atomic sentences)
-			  to their respective lists of truth values.	
+			  to their respective columns of truth values.	
+		   4. file : File object to print to. By default, it is the standard output.
+		   5. table_format : String - the format of the truth table, one of "fixed" (default), "csv", "tsv", "markdown" and "jsonl" (see writers.py).
 
 	Output: Return None. Print the truth table.
 
-	1.	Generate the first row, the header row, which are all the symbols for the atomic sentences and statements
-	2.  Print the first row from step (1).
-	3.  Print out the truth values across the row by using nested for-loops.
+	1.	Generate the first row, the header row, which are all the symbols for the atomic sentences and statements, using truth_table_header.
+	2.  Find the column of truth values of every item of the header row once, using resolve_truth_table_columns.
+	3.  Write the header row and all the rows with the writer of the format, which formats the rows in bulk.
 	"""
-	top_row = [t for t in truth_values_atomic_sentences.keys()] + ['|']	# symbols for atomic sentences
-	
-	for T in logic_trees:
-		for v in T.truth_tables_output:	# this loop appends all the descriptions of internal nodes in the logical tree into top_row
-			if v not in top_row:
-				top_row.append(v)
-		if T.ordered_dict_is_empty():	# this is for the case where the root is the leaf.
-			top_row.append(T.root.data)
-	
-	for t in top_row:
-		print('%-15s' % t, end = "")
+	top_row = truth_table_header(truth_values_atomic_sentences, logic_trees)
+	resolved = resolve_truth_table_columns(top_row, truth_values_atomic_sentences, logic_trees_complex)
 
-	print()
-	for row in range(2**len(truth_values_atomic_sentences)):	# 2**len(atomic_sentences) is equivalent to the number of rows
-		# for each column in the header row
-		for item in top_row:
-			# if the column is a symbol for atomic sentences
-			# print out the truth value for the symbol at the particular row
-			if item in truth_values_atomic_sentences:
-				print('%-15s' % truth_values_atomic_sentences[item][row], end = "")
-			
-			elif item  == "|":
-				print('%-15s' % "", end = "")
-			
-			# if the column is a logical statement
-			# print out the truth value for the logical statement at the particular row
+	writer = open_writer(table_format, file or sys.stdout, top_row)
+	writer.write_header()
+	writer.write_rows(truth_table_columns(resolved), 2**len(truth_values_atomic_sentences))	# 2**len(atomic_sentences) is equivalent to the number of rows
+	writer.flush()
+
+class FlatTree:
+	"""
+	This is a class for the Logic Trees of all the statements of an argument in a compact, flat form.
+
+	Instead of one Node object per node, the nodes are the indices of a few arrays (a struct of arrays), in post-order:
+	the child nodes always come before their parent node. Identical subformulas are stored once, like the nodes shared through node_table.
+	For example, the statements "not ( A and B and C )" and "A" become
+
+		index		  0 	  1 	  2 	  3
+		opcode		atom	atom	atom	 and
+		operand		  0 	  1 	  2 	  0
+		arity		  0 	  0 	  0 	  3
+		negation	  0 	  0 	  0 	  1
+
+	with the children [0, 1, 2] and the roots [3, 0]. The operand of a leaf is the index of its atomic sentence in atom_names,
+	and the operand of an internal node is the offset of its child nodes in the array children.
+
+	Only the column of truth values including the negation is stored for each node. The column without the negation, which the truth table
+	may also print, is derived from it with one exclusive-or when it is needed. The descriptions are rendered only when the header row of 
+	the truth table is built, and every node is rendered once, from the cached descriptions of its child nodes.
+	"""
+
+	connectives = (None,) + tuple(connective_precedence)	# the opcode of a connective is its index. The opcode of an atomic sentence is 0.
+
+	def __init__(self, list_of_statements=()):
+		"""
+		Input: List of Statements (Argument) (optional).
+
+		Attributes:
+		opcode : Array of Integers - the opcode of every node (see connectives).
+		operand : Array of Integers - the index of the atomic sentence of a leaf, or the offset of the child nodes of an internal node in children.
+		arity : Array of Integers - the number of child nodes of every node. It is 0 for a leaf.
+		negation_count : Array of Integers - the number of negations of every node, like node.negation_count. The node is negated if it is odd.
+		children : Array of Integers - the indices of the child nodes of all the internal nodes, one node after another.
+		atomic_sentences : Ordered Dictionary which maps the atomic sentences to None, in the order they appear in the statements.
+		atom_names : List of the atomic sentences, by index, and atom_index : Dictionary that maps the atomic sentences to their indices.
+		roots : List of the indices of the roots of the statements, in order.
+		node_index : Dictionary that maps (opcode, atomic sentence or child nodes, negation_count) to the index of the node, 
+					 so that identical subformulas are stored once.
+		columns : List of the columns of truth values of the nodes, including the negation, or None until they are assigned.
+		truth_values_atomic_sentences : Ordered Dictionary - the columns of truth values of the atomic sentences which were assigned.
+		row_count : Integer - number of rows in the columns.
+		descriptions : List of the descriptions of the nodes without their negations, or None until they are rendered.
+		"""
+		self.opcode = array("b")
+		self.operand = array("q")
+		self.arity = array("q")
+		self.negation_count = array("q")
+		self.children = array("q")
+		self.atomic_sentences = OrderedDict()
+		self.atom_names = []
+		self.atom_index = {}
+		self.roots = []
+		self.node_index = {}
+		self.columns = None
+		self.truth_values_atomic_sentences = None
+		self.row_count = None
+		self.descriptions = []
+		for s in list_of_statements:
+			self.add_statement(s)
+
+	def __len__(self):
+		return len(self.opcode)
+
+	def child_nodes(self, i):
+		return self.children[self.operand[i]:self.operand[i] + self.arity[i]]
+
+	def node(self, opcode, operand, negation_count):
+		"""
+		Input: 1. opcode : Integer
+			   2. operand : Integer - the index of the atomic sentence of a leaf, or Tuple - the indices of the child nodes of an internal node
+			   3. negation_count : Integer
+		Output: The index of the node, which is appended to the arrays only if an identical node does not exist.
+		"""
+		key = (opcode, operand, negation_count)
+		if key not in self.node_index:
+			self.node_index[key] = len(self.opcode)
+			self.opcode.append(opcode)
+			if opcode == 0:	#atomic sentence
+				self.operand.append(operand)
+				self.arity.append(0)
+			else:
+				self.operand.append(len(self.children))
+				self.arity.append(len(operand))
+				self.children.extend(operand)
+			self.negation_count.append(negation_count)
+			self.descriptions.append(None)
+		return self.node_index[key]
+
+	def add_statement(self, s):
+		"""
+		Input: String - a statement
+		Output: The index of the root of the statement, which is appended to roots.
+
+		The nodes are appended from the postfix order of parse_statement with a stack, like Tree.create_logic_tree_from_statement.
+		A node on the stack is a tuple (opcode, operand, negation_count) which can still be negated. It is appended when it becomes a child node or the root.
+		The nodes of "and" and "or" are flattened like Tree.create_logic_tree_from_statement, so their operand is a tuple of any number of child nodes.
+		"""
+		stack = []
+		for token in parse_statement(s):
+			if token == "not":
+				opcode, operand, negation_count = stack[-1]
+				stack[-1] = (opcode, operand, negation_count + 1)
+			elif token in connective_precedence:
+				opcode = self.connectives.index(token)
+				right = stack.pop()
+				left = stack.pop()
+				operand = ()
+				for child in (left, right):
+					if token in associative_connectives and child[0] == opcode and not child[2]:
+						operand += child[1]
+					else:
+						operand += (self.node(*child),)
+				stack.append((opcode, operand, 0))
+			else:
+				if token not in self.atom_index:
+					self.atomic_sentences[token] = None
+					self.atom_index[token] = len(self.atom_names)
+					self.atom_names.append(token)
+				stack.append((0, self.atom_index[token], 0))
+		self.roots.append(self.node(*stack.pop()))
+		return self.roots[-1]
+
+	def assign_truth_values(self, truth_values_atomic_sentences, row_count=None):
+		"""
+		Modifying method.
+		Input: 1. An Ordered Dictionary mapping atomic sentences to their respective columns of truth values.
+			   2. row_count : Integer - number of rows in the columns. By default, it is 2^n for the n atomic sentences.
+		Output: None. The columns of truth values of all the nodes are computed in one pass over the arrays, like Tree.assign_truth_values_to_node.
+				Since the child nodes come before their parent node, no recursion is needed.
+		"""
+		if row_count is None:
+			row_count = 2**len(truth_values_atomic_sentences)
+		self.row_count = row_count
+		self.truth_values_atomic_sentences = truth_values_atomic_sentences
+		mask = column_mask(row_count)
+		columns = self.columns = []
+		children = self.children
+		for opcode, operand, arity, negation_count in zip(self.opcode, self.operand, self.arity, self.negation_count):
+			if opcode == 0:	#atomic sentence
+				column = truth_values_atomic_sentences[self.atom_names[operand]]
 			else:
-				for t in logic_trees_complex:
-					if item in t:
-						print('%-15s' % t[item][row], end = "")
-						break
-		print()
+				column = connective_column(self.connectives[opcode], [columns[k] for k in children[operand:operand + arity]], mask)
+			columns.append(column ^ mask if negation_count & 1 else column)
+
+	def column_wo_negation(self, i):
+		"""
+		Return the column of truth values of the node i without its negation, like node.truth_values_wo_negation.
+		"""
+		return self.columns[i] ^ column_mask(self.row_count) if self.negation_count[i] & 1 else self.columns[i]
+
+	def description(self, i, negation=True):
+		"""
+		Input: 1. i : Integer - the index of a node
+			   2. negation : Bool - whether the negations of the node are included, i.e., node.desc, or not, i.e., node.desc_wo_negation.
+		Output: String - the description of the node, the same as the one of Tree.describe.
+
+		The descriptions of the nodes below i which are not rendered yet are rendered with a stack instead of recursion, from the child nodes up,
+		so that a deep statement does not hit the recursion limit.
+		"""
+		def full(k):
+			return "~ "*self.negation_count[k] + self.descriptions[k]
+
+		stack = [i]
+		while stack:
+			j = stack[-1]
+			if self.descriptions[j] is not None:
+				stack.pop()
+			elif self.opcode[j] == 0:
+				self.descriptions[j] = self.atom_names[self.operand[j]]
+				stack.pop()
+			else:
+				missing = [k for k in self.child_nodes(j) if self.descriptions[k] is None]
+				if missing:
+					stack += missing
+					continue
+				self.descriptions[j] = connective_description(self.connectives[self.opcode[j]], [full(k) for k in self.child_nodes(j)])
+				stack.pop()
+		return full(i) if negation else self.descriptions[i]
+
+	def describe(self):
+		"""
+		Modifying method. Render the descriptions of all the nodes, like Tree.describe for every statement, 
+		so that truth_table_header only looks them up. Every node is below a root, so rendering the roots renders all the nodes.
+		"""
+		for root in self.roots:
+			self.description(root)
+
+	def truth_tables_complex_sent(self):
+		"""
+		Output: List - for each root, an Ordered Dictionary which maps the descriptions of its nodes which appear in the header row
+				of the truth table to their columns of truth values, like Tree.truth_tables_complex_sent. The truth values must be assigned.
+
+		The nodes are visited in post-order. An internal node adds its description, after its description without the negation if it is negated, 
+		and a leaf adds its description only if it has negations. A node shared with a previous root is already in the header row,
+		so every node is visited only once.
+		"""
+		logic_trees_complex = []
+		visited = set()
+		for root in self.roots:
+			complex_sent = OrderedDict()
+			stack = [(root, False)]
+			while stack:
+				i, children_visited = stack.pop()
+				if i in visited:
+					continue
+				if self.opcode[i] and not children_visited:
+					stack.append((i, True))
+					stack += [(k, False) for k in reversed(self.child_nodes(i))]
+					continue
+				visited.add(i)
+				if self.opcode[i]:
+					if self.negation_count[i] & 1:
+						complex_sent[self.description(i, False)] = self.column_wo_negation(i)
+					complex_sent[self.description(i)] = self.columns[i]
+				elif self.negation_count[i]:
+					complex_sent[self.description(i)] = self.columns[i]
+			logic_trees_complex.append(complex_sent)
+		return logic_trees_complex
+
+	def truth_table_header(self, atomic_sentences=None):
+		"""
+		Input: atomic_sentences : the atomic sentences which have their own columns (optional). By default, all the atomic sentences.
+		Output: Tuple - (List - the header row of the truth table, List - the column of truth values of each item of the header row, or None for "|").
+				The truth values must be assigned.
+
+		The header row is built with header_row and its columns are found with resolve_truth_table_columns, like print_truth_table 
+		for the Logic Trees of the statements, so both give the same truth table.
+		"""
+		if atomic_sentences is None:
+			atomic_sentences = self.atomic_sentences
+		logic_trees_complex = self.truth_tables_complex_sent()
+		root_atoms = [self.atom_names[self.operand[root]] if self.opcode[root] == 0 and not self.negation_count[root] else None for root in self.roots]
+		top_row = header_row(atomic_sentences, logic_trees_complex, root_atoms)
+		resolved = resolve_truth_table_columns(top_row, self.truth_values_atomic_sentences, logic_trees_complex)
+		return top_row, truth_table_columns(resolved)
+
+	def print_truth_table(self, file=None, table_format="fixed", atomic_sentences=None):
+		"""
+		Input: 1. file : File object to print to. By default, it is the standard output.
+			   2. table_format : String - the format of the truth table (see print_truth_table).
+			   3. atomic_sentences : the atomic sentences which have their own columns (optional). By default, all the atomic sentences.
+		Output: Return None. Print the truth table, the same as print_truth_table for the Logic Trees of the statements.
+		"""
+		top_row, columns = self.truth_table_header(atomic_sentences)
+		writer = open_writer(table_format, file or sys.stdout, top_row)
+		writer.write_header()
+		writer.write_rows(columns, self.row_count)
+		writer.flush()
+
+	def check_validity(self):
+		"""
+		Output: String - whether the argument is valid or invalid, from the columns of the roots, like check_validity.
+		"""
+		premises = column_mask(self.row_count)
+		for root in self.roots[:-1]:
+			premises &= self.columns[root]
+		conclusion = self.columns[self.roots[-1]]
+		return verdict_of_columns(premises, conclusion)[0]
+
+def generate_truth_table_blocks(logic_trees, dict_atomic_sentences, block_rows):
+	"""
+	Input: 1. A list of logic trees. Their descriptions must have been generated with Tree.describe.
+		   2. A dictionary which maps all the symbols of atomic sentences to None
+		   3. block_rows : Integer - the maximum number of rows in a block. It is rounded down to a power of 2.
+	Output: A generator which yields, block by block in the order of the rows, a tuple (truth_values_block, row_count):
+			the columns of truth values of the atomic sentences in the block (see generate_truth_values_for_block), and the number of rows in the block.
+
+	Before a block is yielded, the columns of truth values of the block are assigned to the nodes of the logic trees, 
+	and the truth_tables_output of the trees are updated, so the columns of the block can be found with truth_table_columns.
+	When the next block is computed, the columns of the previous block are discarded, so the memory is bounded by the size of a block, not 2^n rows.
+	"""
+	free = min(len(dict_atomic_sentences), max(0, block_rows.bit_length() - 1))
+	fixed = len(dict_atomic_sentences) - free
+	for block in range(2**fixed):
+		truth_values_block = generate_truth_values_for_block(dict_atomic_sentences, block, fixed)
+		for T in logic_trees:
+			T.clear_truth_values()
+		for T in logic_trees:
+			T.assign_truth_values_to_node(truth_values_block, 2**free)
+			T.truth_tables_complex_sent(T.root)
+		yield truth_values_block, 2**free
 
 def check_validity(list_of_trees):
 	"""
@@ -448,40 +1237,680 @@ def check_validity(list_of_trees):
 	Output: String - whether the argument is valid or invalid.
 
 	1. 	Since we are only interested in the combination of truth values of the premises and conclusion when we check validity,
-		and the truth values of premises and conclusions are stored in the roots of the logical trees, we first append their 
-		truth values into the list list_validity.
-	2.  Use nested for loops to compare if there is any case when all the premises are True and the conclusion is False.
-		If so, we can break out of the for loops and assign "Not Valid" to the variable is_valid.
+		and the truth values of premises and conclusions are stored in the roots of the logical trees, we first combine the 
+		columns of truth values of all the premises with a bitwise "and" into the column premises. A row of premises is True 
+		if and only if all the premises are True in that row.
+	2.  Compare the columns of premises and conclusion with bitwise operations with verdict_of_columns. If there is any case when all the premises 
+		are True and the conclusion is False, i.e., premises & ~conclusion is not 0, the argument is "Not Valid".
 		
 		Otherwise, if there is no case when all the premises are True and the conclusion is False, and there is a case
-		when all the premises and conclusion are True, then assign "Is Valid" to the variable is_valid.
+		when all the premises and conclusion are True, then the argument "Is Valid".
 		
-		Otherwise, if there is no cases when all the premises and conclusion are True, the variable is_valid remains its
-		initial value: (all the statements are) "Not Logically Connected"
-	3.  Return is_valid
+		Otherwise, if there is no cases when all the premises and conclusion are True, (all the statements are) "Not Logically Connected"
+	3.  Return the verdict
 	"""
-	list_validity = []
-	for T in list_of_trees:
-		list_validity.append(T.root.truth_values)
+	premises = column_mask(list_of_trees[-1].row_count)
+	for T in list_of_trees[:-1]:
+		premises &= T.root.truth_values
+	conclusion = list_of_trees[-1].root.truth_values
+	return verdict_of_columns(premises, conclusion)[0]
+
+
+def check_validity_short_circuit(list_of_trees, dict_atomic_sentences):
+	"""
+	Input: 1. A list of the logic trees formed from the list of given statements. The truth values need not be assigned to the nodes.
+		   2. A dictionary which maps all the symbols of atomic sentences to None
+	Output: Tuple - (String - whether the argument is valid or invalid, Ordered Dictionary - the counterexample or None)
+
+	1.	Enumerate the rows of the truth table lazily with generate_assignments.
+	2.	For each row, evaluate the premises one by one with Tree.evaluate, and stop at the first premise which is False.
+	3.	If all the premises are True and the conclusion is False, the row is a counterexample. Stop the search and return "Not Valid" with the row.
+		If all the premises and the conclusion are True, remember that the argument can be "Is Valid", but continue the search
+		as a counterexample may still exist in the later rows.
+	4.	The verdicts are the same as check_validity: "Is Valid", "Not Valid" or "Not Logically Connected".
+	"""
+	premises, conclusion = list_of_trees[:-1], list_of_trees[-1]
 
 	is_valid = "Not Logically Connected"
-	for col in range(len(list_validity[0])):
-		premises_all_valid = True
-		for row in range(len(list_validity)-1):
-			if not list_validity[row][col]:
-				premises_all_valid = False
-				break
-		if not premises_all_valid:
+	for row in generate_assignments(dict_atomic_sentences):
+		if not all(T.evaluate(row) for T in premises):
 			continue
+		if conclusion.evaluate(row):
+			is_valid = "Is Valid"
+		else:
+			return "Not Valid", row
+
+	return is_valid, None
+
+def unshared_tree(node):
+	"""
+	Input: A node (the root of a Logic Tree)
+	Output: Root of a copy of the Logic Tree in which no node is shared, so that the parent pointer p of every node is its only parent.
 
-		if premises_all_valid and list_validity[-1][col]:
+	The nodes of an argument are shared through node_table (see Tree.create_logic_tree), but a shared node keeps only its first parent in p.
+	"""
+	def copy_of(node):
+		copy = Node(node.data)
+		copy.negation = node.negation
+		copy.negation_count = node.negation_count
+		return copy
+
+	root = copy_of(node)
+	stack = [(node, root)]	# the nodes whose child nodes are not copied yet, with their copies
+	while stack:
+		node, copy = stack.pop()
+		copy.children = [copy_of(child) for child in node.children]
+		for child in copy.children:
+			child.p = copy
+		stack += zip(node.children, copy.children)
+	return root
+
+def generate_rows_gray(list_of_trees, dict_atomic_sentences):
+	"""
+	Input: 1. A list of logic trees
+		   2. A dictionary which maps all the symbols of atomic sentences to None
+	Output: A generator which yields, for every row of the truth table in Gray-code order, a tuple (row, values):
+			the index of the row in the truth table (see assignment_of_row), and the list of the truth values of the roots of the trees in that row.
+
+	In Gray-code order, only one atomic sentence changes between consecutive rows, so only the nodes above its leaves can change.
+	1.	Copy the trees with unshared_tree, so that every node has exactly one parent p, and find the leaves of every atomic sentence.
+	2.	Evaluate the value of every node in row 0.
+	3.	The i-th row in Gray-code order is the row i ^ (i >> 1) of the truth table. It differs from the previous row in the k-th bit of the row,
+		where k is the number of trailing zeros of i, i.e., in the atomic sentence with k atomic sentences after it.
+		Flip the value of its leaves, then walk up from every leaf through the parent pointers p, and evaluate every parent node again from the values 
+		of its child nodes. Stop as soon as the value of a node does not change, since the nodes above it cannot change either.
+	Therefore, the work for a row is proportional to the depth of the leaves which change, not to the size of the trees.
+	"""
+	atoms = list(dict_atomic_sentences)
+	n = len(atoms)
+	roots = [unshared_tree(T.root) for T in list_of_trees]
+	leaves = {s: [] for s in atoms}
+	assignment = assignment_of_row(dict_atomic_sentences, 0)
+
+	def evaluate(node):
+		if not node.children:	#the node is a leaf
+			return assignment[node.data] != node.negation
+		return connective_value(node.data, [child.value for child in node.children]) != node.negation
+
+	for node in post_order(roots):
+		if not node.children:
+			leaves[node.data].append(node)
+		node.value = evaluate(node)
+	yield 0, [root.value for root in roots]
+
+	for i in range(1, 2**n):
+		k = (i & -i).bit_length() - 1
+		for leaf in leaves[atoms[n-1-k]]:
+			leaf.value = not leaf.value
+			node = leaf.p
+			while node:
+				value = evaluate(node)
+				if value == node.value:
+					break
+				node.value = value
+				node = node.p
+		yield i ^ (i >> 1), [root.value for root in roots]
+
+def gray_code_columns(list_of_trees, dict_atomic_sentences):
+	"""
+	Input: 1. A list of logic trees
+		   2. A dictionary which maps all the symbols of atomic sentences to None
+	Output: A list of the columns of truth values of the roots of the trees, in the order of the rows of the truth table,
+			like the columns of Tree.assign_truth_values_to_node.
+
+	The rows are evaluated in Gray-code order with generate_rows_gray, and remapped to the order of the truth table by their indices:
+	the truth value of a root in row r is bit r % 8 of byte r // 8 of its column.
+	"""
+	row_count = 2**len(dict_atomic_sentences)
+	columns = [bytearray((row_count + 7) // 8) for T in list_of_trees]
+	for row, values in generate_rows_gray(list_of_trees, dict_atomic_sentences):
+		for column, value in zip(columns, values):
+			if value:
+				column[row >> 3] |= 1 << (row & 7)
+	return [int.from_bytes(column, "little") for column in columns]
+
+def check_validity_gray(list_of_trees, dict_atomic_sentences):
+	"""
+	Input: 1. A list of the logic trees formed from the list of given statements. The truth values need not be assigned to the nodes.
+		   2. A dictionary which maps all the symbols of atomic sentences to None
+	Output: Tuple - (String - whether the argument is valid or invalid, Ordered Dictionary - the counterexample or None)
+
+	The rows are evaluated one at a time in Gray-code order with generate_rows_gray, like check_validity_short_circuit.
+	It stops at the first row in Gray-code order in which all the premises are True and the conclusion is False, which is the counterexample.
+	"""
+	is_valid = "Not Logically Connected"
+	for row, values in generate_rows_gray(list_of_trees, dict_atomic_sentences):
+		if not all(values[:-1]):
+			continue
+		if values[-1]:
 			is_valid = "Is Valid"
-		elif premises_all_valid and not list_validity[-1][col]:
-			is_valid = "Not Valid"
+		else:
+			return "Not Valid", assignment_of_row(dict_atomic_sentences, row)
+
+	return is_valid, None
+
+def check_validity_columns(list_of_trees, dict_atomic_sentences):
+	"""
+	Input: 1. A list of the logic trees formed from the list of given statements. The truth values need not be assigned to the nodes.
+		   2. A dictionary which maps all the symbols of atomic sentences to None
+	Output: Tuple - (String - whether the argument is valid or invalid, Ordered Dictionary - the counterexample or None)
+
+	1.	Generate the columns of truth values of the atomic sentences, and evaluate only the column of each root with its compiled column function.
+	2.	Compare the columns of the premises and the conclusion with verdict_of_columns, like check_validity.
+		The counterexample is the first row of the truth table in which all the premises are True and the conclusion is False.
+	"""
+	truth_values_atomic_sentences = generate_truth_values_for_atomic_sentences(dict_atomic_sentences)
+	premises = column_mask(2**len(dict_atomic_sentences))
+	for T in list_of_trees[:-1]:
+		premises &= T.evaluate_column(truth_values_atomic_sentences)
+	conclusion = list_of_trees[-1].evaluate_column(truth_values_atomic_sentences)
+	return verdict_of_columns(premises, conclusion, dict_atomic_sentences)
+
+def check_validity_sat(list_of_trees, dict_atomic_sentences):
+	"""
+	Input: 1. A list of the logic trees formed from the list of given statements. The truth values need not be assigned to the nodes.
+		   2. A dictionary which maps all the symbols of atomic sentences to None
+	Output: Tuple - (String - whether the argument is valid or invalid, Ordered Dictionary - the counterexample or None)
+
+	1.	Convert all the logic trees into one CNF with the Tseitin transformation. Each root is represented by a literal.
+	2.	If the premises and the negation of the conclusion are satisfiable, the satisfying assignment is a counterexample, so the argument is "Not Valid".
+	3.	Otherwise, if the premises and the conclusion are satisfiable, the argument "Is Valid".
+	4.	Otherwise, the premises can never be all True, and the argument is "Not Logically Connected". These verdicts are the same as check_validity.
+	"""
+	cnf = CNF()
+	for s in dict_atomic_sentences:	# the variables of the atomic sentences keep the order of the atomic sentences
+		cnf.atom_var(s)
+	literals = [cnf.add_tree(T.root) for T in list_of_trees]
+	premises, conclusion = literals[:-1], literals[-1]
+
+	counterexample = satisfy(cnf, premises + [-conclusion])
+	if counterexample is not None:
+		return "Not Valid", counterexample
+	if satisfy(cnf, premises + [conclusion]) is not None:
+		return "Is Valid", None
+	return "Not Logically Connected", None
+
+def check_validity_bdd(list_of_trees, dict_atomic_sentences, ordering="static", sift=False):
+	"""
+	Input: 1. A list of the logic trees formed from the list of given statements. The truth values need not be assigned to the nodes.
+		   2. A dictionary which maps all the symbols of atomic sentences to None
+		   3. ordering : String - the heuristic of the order of the atomic sentences in the BDD (see bdd.variable_order)
+		   4. sift : Bool - whether to improve the order by sifting after the BDDs of the statements are built.
+	Output: Tuple - (String - whether the argument is valid or invalid, Ordered Dictionary - the counterexample or None)
+
+	1.	Build the BDD of every statement in one BDD manager, and the conjunction of the premises.
+	2.	If "premises ^ ~conclusion" is not the node False, the argument is "Not Valid", and any path to True in it is a counterexample.
+	3.	Otherwise, if "premises ^ conclusion" is not the node False, the argument "Is Valid". Otherwise, it is "Not Logically Connected".
+	"""
+	manager = BDD(variable_order(list_of_trees, dict_atomic_sentences, ordering))
+	built = {}
+	roots = [manager.from_tree(T.root, built) for T in list_of_trees]
+	if sift:
+		manager.sift(roots)
+	premises = TRUE
+	for u in roots[:-1]:
+		premises = manager.apply("and", premises, u)
+
+	counterexamples = manager.apply("and", premises, manager.negate(roots[-1]))
+	if counterexamples != FALSE:
+		return "Not Valid", manager.satisfying_assignment(counterexamples, list(dict_atomic_sentences))
+	if manager.apply("and", premises, roots[-1]) != FALSE:
+		return "Is Valid", None
+	return "Not Logically Connected", None
+
+def check_equivalence(statement_1, statement_2, ordering="static"):
+	"""
+	Input: 1. String - a statement
+		   2. String - another statement
+		   3. ordering : String - the heuristic of the order of the atomic sentences in the BDD (see bdd.variable_order)
+	Output: Tuple - (Bool - whether the statements are logically equivalent, 
+					 Ordered Dictionary - an assignment of the atomic sentences where their truth values differ, or None)
+
+	Since a reduced ordered BDD is unique for a logical statement, the statements are equivalent if and only if their BDDs are the same node.
+	"""
+	logic_trees, atomic_sentences = create_logic_trees([statement_1, statement_2])
+
+	manager = BDD(variable_order(logic_trees, atomic_sentences, ordering))
+	u, v = [manager.from_tree(T.root) for T in logic_trees]
+	if u == v:
+		return True, None
+	difference = manager.apply("or", manager.apply("and", u, manager.negate(v)), manager.apply("and", manager.negate(u), v))
+	return False, manager.satisfying_assignment(difference)
+
+def count_models(list_of_statements, ordering="static"):
+	"""
+	Input: 1. List of Statements
+		   2. ordering : String - the heuristic of the order of the atomic sentences in the BDD (see bdd.variable_order)
+	Output: Integer - the number of rows of the truth table of the statements in which all the statements are True.
+	"""
+	logic_trees, atomic_sentences = create_logic_trees(list_of_statements)
+
+	manager = BDD(variable_order(logic_trees, atomic_sentences, ordering))
+	conjunction = TRUE
+	for T in logic_trees:
+		conjunction = manager.apply("and", conjunction, manager.from_tree(T.root))
+	return manager.count(conjunction)
+
+class Simplification:
+	"""
+	This is a class for the simplification of an argument before its validity is checked (see simplify_argument).
+
+	Attributes:
+	premise_trees : List of the Logic Trees of the simplified premises. The premises which are always True are removed.
+	conclusion_tree : Tree - the Logic Tree of the simplified conclusion, or None if the conclusion is always True or always False.
+	conclusion_value : Bool - the truth value of the conclusion if it is constant, otherwise None.
+	premises_unsatisfiable : Bool - whether a premise is always False, so that the premises are never all True.
+	atomic_sentences : Ordered Dictionary which maps the atomic sentences of the simplified argument to None.
+	removed_atoms : Ordered Dictionary which maps the atomic sentences which were eliminated to the truth value they were fixed to, 
+					or to None if they disappeared from the statements, so that their truth value does not matter.
+	removed_premises : List of the indices of the premises which were removed because they are always True.
+	"""
+
+	def __init__(self):
+		self.premise_trees = []
+		self.conclusion_tree = None
+		self.conclusion_value = None
+		self.premises_unsatisfiable = False
+		self.atomic_sentences = OrderedDict()
+		self.removed_atoms = OrderedDict()
+		self.removed_premises = []
+
+	def complete(self, assignment, dict_atomic_sentences):
+		"""
+		Input: 1. An assignment of the atomic sentences of the simplified argument, e.g., a counterexample, or None
+			   2. A dictionary which maps all the symbols of atomic sentences of the original argument to None
+		Output: Ordered Dictionary - the assignment of all the atomic sentences of the original argument, or None. 
+				The eliminated atomic sentences get the truth values they were fixed to, and the ones which disappeared are False.
+		"""
+		if assignment is None:
+			return None
+		return OrderedDict((s, assignment[s] if s in assignment else bool(self.removed_atoms.get(s))) for s in dict_atomic_sentences)
+
+	def report(self, list_of_statements):
+		"""
+		Output: List of Strings - what the simplification removed, e.g., to be printed after the truth table of the simplified argument.
+		"""
+		lines = []
+		for i in self.removed_premises:
+			lines.append("Removed premise (always True): %s" % list_of_statements[i])
+		for s, value in self.removed_atoms.items():
+			if value is None:
+				lines.append("Removed atomic sentence: %s (it does not affect any statement)" % s)
+			else:
+				lines.append("Removed atomic sentence: %s = %s (it only appears with one polarity)" % (s, value))
+		if self.premises_unsatisfiable:
+			lines.append("A premise is always False")
+		if self.conclusion_value is not None:
+			lines.append("The conclusion is always %s" % self.conclusion_value)
+		return lines
+
+def simplify_argument(list_of_trees, dict_atomic_sentences):
+	"""
+	Input: 1. A list of the logic trees formed from the list of given statements. The last one is the conclusion.
+		   2. A dictionary which maps all the symbols of atomic sentences to None
+	Output: Simplification - the simplified argument, which has the same validity as the original argument, and the record of what was removed.
+
+	Every atomic sentence doubles the number of rows of the truth table, so the statements are rewritten into equivalent, smaller statements
+	with fewer atomic sentences before the validity is checked. The original trees are not modified.
+	1.	Every node is rebuilt through one table of nodes, so that identical subformulas are the same node, and a node and its negation can be found.
+		The negations are collapsed into their parity, e.g., ~ ~ ~ ~ A becomes A.
+	2.	Constants are folded, e.g., "A and False" is False and "if True, then A" is A. The constants come from the rules below.
+	3.	"and" and "or" are flattened, and the rules of idempotence (A ^ A is A), complement (A ^ ~ A is False, A V ~ A is True) 
+		and absorption (A ^ ( A V B ) is A, A V ( A ^ B ) is A) are applied. Similar rules are applied to "then", "iff", "xor", "nand" and "nor".
+	4.	An argument is invalid if and only if its premises and the negation of its conclusion can all be True. If an atomic sentence only appears 
+		with one polarity in the premises and the negation of the conclusion (pure literal), fixing it to the truth value which makes its 
+		occurrences True cannot remove a counterexample, nor a row where all the premises are True. Therefore, it is replaced by that constant.
+		Inside "iff" and "xor", an atomic sentence has both polarities.
+	5.	Repeat (1) to (4) until no pure literal is left.
+	6.	A premise which is always True is removed. If a premise is always False, or the conclusion is constant, it is recorded in the Simplification.
+	"""
+	premises, conclusion = list_of_trees[:-1], list_of_trees[-1]
+	substitution = OrderedDict()
+	while True:
+		table = {}
+
+		def make(data, negation, children):
+			key = (data, negation, frozenset(map(id, children)) if data in associative_connectives else tuple(map(id, children)))
+			if key not in table:
+				node = Node(data)
+				node.negation = negation
+				node.negation_count = int(negation)
+				node.children = list(children)
+				for child in children:
+					if child.p is None:
+						child.p = node
+				table[key] = node
+			return table[key]
+
+		def negate(x):
+			return (not x) if isinstance(x, bool) else make(x.data, not x.negation, x.children)
+
+		def fold(data, children):
+			if data in ("nand", "nor"):
+				return negate(fold("and" if data == "nand" else "or", children))
+			if data in associative_connectives:
+				absorbing = data == "or"	# the constant which decides the connective: True for "or", False for "and"
+				flat = []
+				for child in children:
+					if isinstance(child, bool):
+						if child == absorbing:
+							return absorbing
+					elif child.data == data and not child.negation:
+						flat += child.children
+					else:
+						flat.append(child)
+				flat = list(OrderedDict((id(child), child) for child in flat).values())	# idempotence
+				ids = set(map(id, flat))
+				if any(id(negate(child)) in ids for child in flat):	# complement
+					return absorbing
+				dual = "and" if data == "or" else "or"
+				flat = [child for child in flat if not (child.data == dual and not child.negation 
+														and any(id(grandchild) in ids for grandchild in child.children))]	# absorption
+				if not flat:
+					return not absorbing
+				return flat[0] if len(flat) == 1 else make(data, False, flat)
+
+			left, right = children
+			if data == "then":
+				if left is False or right is True or left is right:
+					return True
+				if left is True:
+					return right
+				if right is False or right is negate(left):
+					return negate(left) if right is False else right
+				return make(data, False, children)
+			# "iff" and "xor"
+			if isinstance(left, bool) or isinstance(right, bool):
+				constant, other = (left, right) if isinstance(left, bool) else (right, left)
+				if isinstance(other, bool):
+					return (constant == other) if data == "iff" else (constant != other)
+				return other if constant == (data == "iff") else negate(other)
+			if left is right or left is negate(right):
+				return (left is right) == (data == "iff")
+			return make(data, False, children)
+
+		rewritten = {}
+		for node in post_order([T.root for T in list_of_trees]):
+			if not node.children:	#the node is a leaf
+				x = substitution[node.data] if node.data in substitution else make(node.data, False, [])
+			else:
+				x = fold(node.data, [rewritten[id(child)] for child in node.children])
+			rewritten[id(node)] = negate(x) if node.negation else x
+		roots = [rewritten[id(T.root)] for T in list_of_trees]
+
+		polarities = {}
+		visited = set()
+		stack = [(root, i < len(premises)) for i, root in enumerate(roots) if not isinstance(root, bool)]
+		while stack:
+			node, positive = stack.pop()
+			if (id(node), positive) in visited:
+				continue
+			visited.add((id(node), positive))
+			positive = positive != node.negation
+			if not node.children:
+				polarities.setdefault(node.data, set()).add(positive)
+			elif node.data in ("iff", "xor"):
+				stack += [(child, value) for child in node.children for value in (True, False)]
+			else:
+				stack += [(child, positive != (node.data in ("nand", "nor") or (node.data == "then" and i == 0))) for i, child in enumerate(node.children)]
+		pure = [(s, polarities[s]) for s in dict_atomic_sentences if s in polarities and len(polarities[s]) == 1]
+		if not pure:
 			break
-			
-	return is_valid
+		for s, polarity_of_s in pure:
+			substitution[s] = polarity_of_s.pop()
+
+	simplification = Simplification()
+	for i, (T, root) in enumerate(zip(premises, roots)):
+		if root is True:
+			simplification.removed_premises.append(i)
+		elif root is False:
+			simplification.premises_unsatisfiable = True
+		else:
+			simplification.premise_trees.append(Tree())
+			simplification.premise_trees[-1].root = root
+	if isinstance(roots[-1], bool):
+		simplification.conclusion_value = roots[-1]
+	else:
+		simplification.conclusion_tree = Tree()
+		simplification.conclusion_tree.root = roots[-1]
+
+	remaining = set(polarities)
+	for s in dict_atomic_sentences:
+		if s in remaining:
+			simplification.atomic_sentences[s] = None
+		else:
+			simplification.removed_atoms[s] = substitution.get(s)
+	return simplification
 
+def check_validity_simplified(list_of_trees, dict_atomic_sentences, engine="sat"):
+	"""
+	Input: 1. A list of the logic trees formed from the list of given statements.
+		   2. A dictionary which maps all the symbols of atomic sentences to None
+		   3. engine : String - the name of the engine in validity_engines which checks the simplified argument.
+	Output: Tuple - (String - whether the argument is valid or invalid, Ordered Dictionary - the counterexample or None), like the engines.
+
+	1.	Simplify the argument with simplify_argument. If a premise is always False, the argument is "Not Logically Connected".
+	2.	If the conclusion is not constant, check the simplified argument with the engine, and complete its counterexample with the removed atomic sentences.
+	3.	If the conclusion is always True, the argument "Is Valid" if the premises can all be True, otherwise it is "Not Logically Connected".
+		If the conclusion is always False, the argument is "Not Valid" if the premises can all be True, and a counterexample is a row where they are.
+		The premises can all be True if and only if the argument "premises, therefore X" for an atomic sentence X is not "Not Logically Connected".
+		A counterexample of it, or of "premises, therefore ~ X", is a row where the premises are all True.
+	"""
+	simplification = simplify_argument(list_of_trees, dict_atomic_sentences)
+	if simplification.premises_unsatisfiable:
+		return "Not Logically Connected", None
+
+	premises, atoms = simplification.premise_trees, simplification.atomic_sentences
+	if simplification.conclusion_tree:
+		is_valid, counterexample = validity_engines[engine](premises + [simplification.conclusion_tree], atoms)
+		return is_valid, simplification.complete(counterexample, dict_atomic_sentences)
+
+	model = satisfy_premises(premises, atoms, engine)
+	if model is None:
+		return "Not Logically Connected", None
+	if simplification.conclusion_value:
+		return "Is Valid", None
+	return "Not Valid", simplification.complete(model, dict_atomic_sentences)
+
+def satisfy_premises(list_of_premises, dict_atomic_sentences, engine="sat"):
+	"""
+	Input: 1. A list of the logic trees of premises, without a conclusion.
+		   2. A dictionary which maps the symbols of the atomic sentences of the premises to None
+		   3. engine : String - the name of the engine in validity_engines which checks the premises.
+	Output: Ordered Dictionary - an assignment of the atomic sentences in which all the premises are True, or None if there is none.
+
+	The engines only check arguments, so the premises are checked as the argument "premises, therefore X" for an atomic sentence X.
+	1.	If it is "Not Logically Connected", the premises can never be all True.
+	2.	If it is "Not Valid", the counterexample is a row where the premises are all True.
+	3.	If it "Is Valid", the premises are all True in some row, and X is True in all of them, so "premises, therefore ~ X" is "Not Valid"
+		and its counterexample is such a row.
+	"""
+	if not list_of_premises:
+		return OrderedDict((s, False) for s in dict_atomic_sentences)
+	X = next(iter(dict_atomic_sentences))
+	for statement in (X, "not ( %s )" % X):
+		T = Tree()
+		T.create_logic_tree_from_statement(statement)
+		is_valid, model = validity_engines[engine](list_of_premises + [T], dict_atomic_sentences)
+		if is_valid != "Is Valid":
+			return model
+	return None
+
+def independent_components(list_of_trees, dict_atomic_sentences):
+	"""
+	Input: 1. A list of the logic trees formed from the list of given statements.
+		   2. A dictionary which maps all the symbols of atomic sentences to None
+	Output: A list of the components of the argument, as tuples (List - the indices of the trees of the component, 
+			Ordered Dictionary - the atomic sentences of the component). The components are ordered by their first tree.
+
+	Two statements are in the same component if they share an atomic sentence, or are both connected to a third statement of the component.
+	1.	Join the atomic sentences of every tree into one set with union-find. Every atomic sentence points to a parent atomic sentence,
+		and the atomic sentence which points to itself is the representative of the set.
+	2.	Group the trees by the representative of their atomic sentences, and the atomic sentences by their representative, in their original order.
+	"""
+	parent = {s: s for s in dict_atomic_sentences}
+
+	def find(s):
+		while parent[s] != s:
+			parent[s] = parent[parent[s]]	# path halving
+			s = parent[s]
+		return s
+
+	representatives = []
+	for T in list_of_trees:
+		atoms = [node.data for node in dag_nodes([T]) if not node.children]
+		for s in atoms[1:]:
+			a, b = find(atoms[0]), find(s)
+			if a != b:
+				parent[b] = a
+		representatives.append(find(atoms[0]))
+
+	components = OrderedDict()
+	for i, T in enumerate(list_of_trees):
+		components.setdefault(find(representatives[i]), ([], OrderedDict()))[0].append(i)
+	for s in dict_atomic_sentences:
+		if find(s) in components:
+			components[find(s)][1][s] = None
+	return list(components.values())
+
+def check_validity_components(list_of_trees, dict_atomic_sentences, engine="columns"):
+	"""
+	Input: 1. A list of the logic trees formed from the list of given statements. The truth values need not be assigned to the nodes.
+		   2. A dictionary which maps all the symbols of atomic sentences to None
+		   3. engine : String - the name of the engine in validity_engines which checks every component.
+	Output: Tuple - (String - whether the argument is valid or invalid, Ordered Dictionary - the counterexample or None), like the engines.
+
+	If the statements fall into groups which share no atomic sentences (see independent_components), the truth values of one group 
+	do not constrain the others, so the groups are checked separately over their own atomic sentences: 2^k1 + 2^k2 + ... rows 
+	instead of 2^(k1 + k2 + ...) rows.
+	1.	The premises of a component without the conclusion must be all True in some row, otherwise no row makes all the premises True,
+		and the argument is "Not Logically Connected". The row is found with satisfy_premises.
+	2.	Then, the argument has the verdict of the component of the conclusion, i.e., its premises, therefore the conclusion.
+	3.	The counterexample joins the counterexample of the component of the conclusion and the rows of the other components. 
+		The atomic sentences which appear in no statement are False.
+	"""
+	conclusion = len(list_of_trees) - 1
+	counterexample = OrderedDict((s, False) for s in dict_atomic_sentences)
+	for trees, atoms in independent_components(list_of_trees, dict_atomic_sentences):
+		if trees[-1] == conclusion:
+			is_valid, assignment = validity_engines[engine]([list_of_trees[i] for i in trees], atoms)
+		else:
+			assignment = satisfy_premises([list_of_trees[i] for i in trees], atoms, engine)
+			if assignment is None:
+				return "Not Logically Connected", None
+		if assignment:
+			counterexample.update(assignment)
+	return is_valid, (counterexample if is_valid == "Not Valid" else None)
+
+block_worker_state = {}	# the logic trees and atomic sentences of a worker process of the parallel engine
+
+def init_block_worker(list_of_trees, dict_atomic_sentences):
+	block_worker_state["trees"] = list_of_trees
+	block_worker_state["atomic_sentences"] = dict_atomic_sentences
+
+def check_block(block, fixed):
+	"""
+	Run in a worker process. Evaluate the columns of the premises and the conclusion in the block-th block of rows.
+	Return a tuple (index of the first row of the block which is a counterexample or None, whether any row of the block "Is Valid").
+	"""
+	list_of_trees = block_worker_state["trees"]
+	dict_atomic_sentences = block_worker_state["atomic_sentences"]
+	truth_values_block = generate_truth_values_for_block(dict_atomic_sentences, block, fixed)
+	row_count = 2**(len(dict_atomic_sentences) - fixed)
+	premises = column_mask(row_count)
+	for T in list_of_trees[:-1]:
+		premises &= T.evaluate_column(truth_values_block, row_count)
+	conclusion = list_of_trees[-1].evaluate_column(truth_values_block, row_count)
+	is_valid, row = verdict_of_columns(premises, conclusion)
+	return row, is_valid != "Not Logically Connected"
+
+def assign_block(block, fixed):
+	"""
+	Run in a worker process. Assign the columns of truth values in the block-th block of rows to the nodes of the logic trees,
+	and return the pairs (truth_values, truth_values_wo_negation) of all the distinct nodes, in the order of dag_nodes.
+	"""
+	list_of_trees = block_worker_state["trees"]
+	dict_atomic_sentences = block_worker_state["atomic_sentences"]
+	truth_values_block = generate_truth_values_for_block(dict_atomic_sentences, block, fixed)
+	for T in list_of_trees:
+		T.clear_truth_values()
+	for T in list_of_trees:
+		T.assign_truth_values_to_node(truth_values_block, 2**(len(dict_atomic_sentences) - fixed))
+	return [(node.truth_values, node.truth_values_wo_negation) for node in dag_nodes(list_of_trees)]
+
+def number_of_fixed_atoms(dict_atomic_sentences, workers, fixed):
+	"""
+	Return the number of atomic sentences to fix in each block. By default, there are at least 8 blocks per worker,
+	so that the work is balanced and a counterexample can cancel most of the blocks, but each block has at least 2^10 rows.
+	"""
+	if fixed is None:
+		fixed = max(0, (8 * workers - 1).bit_length())
+		fixed = min(fixed, len(dict_atomic_sentences) - 10)
+	return max(0, min(fixed, len(dict_atomic_sentences)))
+
+def check_validity_parallel(list_of_trees, dict_atomic_sentences, workers=None, fixed=None):
+	"""
+	Input: 1. A list of the logic trees formed from the list of given statements. The truth values need not be assigned to the nodes.
+		   2. A dictionary which maps all the symbols of atomic sentences to None
+		   3. workers : Integer - the number of worker processes. By default, it is the number of CPUs.
+		   4. fixed : Integer - the number of atomic sentences fixed in each block (see generate_truth_values_for_block).
+	Output: Tuple - (String - whether the argument is valid or invalid, Ordered Dictionary - the counterexample or None)
+
+	1.	Split the 2^n rows of the truth table into 2^fixed blocks by fixing the truth values of the first fixed atomic sentences.
+	2.	Check the blocks in a pool of worker processes with check_block. Every worker receives the logic trees once, when it starts.
+	3.	As soon as a block has a counterexample, cancel the blocks which have not started, and return "Not Valid" with the counterexample.
+		The counterexample is the first one within its block, but not necessarily the first one in the truth table.
+	4.	Otherwise, the verdict is "Is Valid" if any block has a row where all the premises and the conclusion are True, and "Not Logically Connected" if not.
+	"""
+	workers = workers or os.cpu_count() or 1
+	fixed = number_of_fixed_atoms(dict_atomic_sentences, workers, fixed)
+	row_count = 2**(len(dict_atomic_sentences) - fixed)
+
+	is_valid = "Not Logically Connected"
+	executor = ProcessPoolExecutor(workers, initializer=init_block_worker, initargs=(list_of_trees, dict_atomic_sentences))
+	try:
+		futures = {executor.submit(check_block, block, fixed): block for block in range(2**fixed)}
+		for future in as_completed(futures):
+			counterexample_row, supported = future.result()
+			if counterexample_row is not None:
+				return "Not Valid", assignment_of_row(dict_atomic_sentences, futures[future] * row_count + counterexample_row)
+			if supported:
+				is_valid = "Is Valid"
+	finally:
+		executor.shutdown(wait=True, cancel_futures=True)
+	return is_valid, None
+
+def assign_truth_values_parallel(list_of_trees, dict_atomic_sentences, workers=None, fixed=None):
+	"""
+	Input: Same as check_validity_parallel.
+	Output: None. All the nodes of the logic trees are assigned to their columns of truth values in the truth table,
+			like Tree.assign_truth_values_to_node, but the blocks of rows are evaluated in a pool of worker processes.
+
+	The columns of the blocks are joined back in the order of the blocks, so the truth table is the same as the one evaluated in a single process.
+	"""
+	workers = workers or os.cpu_count() or 1
+	fixed = number_of_fixed_atoms(dict_atomic_sentences, workers, fixed)
+	row_count = 2**(len(dict_atomic_sentences) - fixed)
+
+	with ProcessPoolExecutor(workers, initializer=init_block_worker, initargs=(list_of_trees, dict_atomic_sentences)) as executor:
+		blocks = list(executor.map(assign_block, range(2**fixed), [fixed] * 2**fixed))
+
+	for i, node in enumerate(dag_nodes(list_of_trees)):
+		node.truth_values = join_columns([block[i][0] for block in blocks], row_count)
+		if node.negation:
+			node.truth_values_wo_negation = join_columns([block[i][1] for block in blocks], row_count)
+	for T in list_of_trees:
+		T.row_count = row_count * 2**fixed
+
+validity_engines = {
+	"sat": check_validity_sat,
+	"truth_table": check_validity_short_circuit,
+	"gray": check_validity_gray,
+	"columns": check_validity_columns,
+	"parallel": check_validity_parallel,
+	"bdd": check_validity_bdd,
+	"components": check_validity_components,
+}
 
 ###########################################################################################################################################
 
@@ -501,38 +1930,278 @@ sample7 = ["A and B", "A"]
 
 sample8 = ["( if p, then q ) and ( if r, then s )", "p or r", "q or s"] #is Valid
 
-def answer_truth_table_validity(list_of_statements):
+def answer_truth_table_validity(list_of_statements, workers=None, block_rows=None, file=None, table_format="fixed", stats=None,
+								simplify=False, show_removed=False):
 	"""
-	Input: List of Statements (Argument). 
+	Input: 1. List of Statements (Argument). 
+		   2. workers : Integer (optional) - the number of worker processes to evaluate the truth table in parallel (see assign_truth_values_parallel).
+		   3. block_rows : Integer (optional) - if it is given, the truth table is streamed: it is evaluated and printed block by block 
+		   	  of at most block_rows rows (see generate_truth_table_blocks), so the memory does not grow with the number of rows.
+		   4. file : File object to print to. By default, it is the standard output.
+		   5. table_format : String - the format of the truth table (see print_truth_table). Unless it is "fixed", 
+		   	  the validity is printed to the standard output instead of the file, so that the file only contains the truth table.
+		   6. stats : Stats (optional) - if it is given, the time of every phase (parse, atoms, assign, describe, print, validity),
+		   	  the number of nodes, the number of rows evaluated and the hits of the cache of parse_statement are recorded in it (see stats.py).
+		   7. simplify : Bool - if it is True, the argument is simplified first with simplify_argument, in the phase simplify. The truth table only 
+		   	  has the rows of the atomic sentences which are left. The atomic sentences which were removed are fixed to their recorded truth values
+		   	  (False if their truth values do not matter), so the columns of the original statements keep the validity of the argument.
+		   	  What was removed is printed after the validity. It cannot be combined with workers or block_rows.
+		   8. show_removed : Bool - whether the atomic sentences removed by simplify keep their (constant) columns in the truth table.
 	Output: Return none. Print truth table and the validity of the arguments.
 
-	1.  Break all the statements into lists of atomic sentences and connectives.
+	1.  Parse all the statements into one FlatTree, which stores the identical subformulas once.
+		If the truth table is evaluated in parallel or streamed, create a Logic Tree for each statement using create_logic_trees instead.
+		The Logic Trees share their identical subformulas through node_table.
 	2. 	Identify all the atomic sentences.
 	3.  Generate lists of truth values for the atomic sentences and map different atomic sentences to columns of truth values created such that 
 		when the columns of truth values of atomic sentences are displayed in the truth table, each row has distinct combination of truth values.
-	4.	For the lists taken from step (1), create a Logic Tree for each list. Find out the truth values for each node as well as their descriptions.
+	4.	Find out the truth values for each node of the Logic Trees as well as their descriptions.
 	    Map all the internal nodes to their respective truth values using truth_tables_complex_sent method.
 	5. 	Append all the logic trees into the list logic_trees and append the mapping from step (4) to the list logic_trees_complex.
 	6.  Print the truth table using the function print_truth_table.
 	7.  Check the validity using the function check_validty, and print it.
 	"""
-	logical_sentences = [replace_parentheses_with_list(split_into_list(s)) for s in list_of_statements]
-	atomic_sentences = identify_atomic_sentences(logical_sentences)
-	truth_values_atomic_sentences = generate_truth_values_for_atomic_sentences(atomic_sentences)
-	logic_trees = []
-	logic_trees_complex = []
-	for s in logical_sentences:
-		T = Tree()
-		T.create_logic_tree(s)
-		T.assign_truth_values_to_node(truth_values_atomic_sentences)
+	if simplify and (workers or block_rows):
+		raise ValueError("simplify cannot be combined with workers or block_rows")
+
+	if stats:
+		parse_cache_info = parse_statement.cache_info()
+	with phase(stats, "parse"):
+		if workers or block_rows:
+			logic_trees, atomic_sentences = create_logic_trees(list_of_statements)
+		else:
+			flat_tree = FlatTree(list_of_statements)
+			atomic_sentences = flat_tree.atomic_sentences
+	simplification = None
+	if simplify:
+		with phase(stats, "simplify"):
+			simplification = simplify_argument(*create_logic_trees(list_of_statements))
+	rows = 2**len(simplification.atomic_sentences if simplification else atomic_sentences)
+	if stats:
+		stats.count_cache("parse_cache", parse_cache_info, parse_statement.cache_info())
+		stats.count("nodes", len(dag_nodes(logic_trees)) if workers or block_rows else len(flat_tree))
+		stats.count("rows_evaluated", rows)
+
+	if block_rows:
+		print_truth_table_streaming(list_of_statements, logic_trees, atomic_sentences, block_rows, file, table_format, stats)
+		if stats:
+			stats.report()
+		return
+
+	with phase(stats, "atoms"):
+		if simplification:
+			truth_values_remaining = generate_truth_values_for_atomic_sentences(simplification.atomic_sentences)
+			truth_values_atomic_sentences = OrderedDict((s, truth_values_remaining[s] if s in truth_values_remaining 
+														 else (column_mask(rows) if simplification.removed_atoms[s] else 0)) for s in atomic_sentences)
+		else:
+			truth_values_atomic_sentences = generate_truth_values_for_atomic_sentences(atomic_sentences)
+	if workers:
+		with phase(stats, "assign"):
+			assign_truth_values_parallel(logic_trees, atomic_sentences, workers)
+		with phase(stats, "describe"):
+			for T in logic_trees:
+				T.describe(T.root)
+		with phase(stats, "print"):
+			logic_trees_complex = []
+			for T in logic_trees:
+				T.truth_tables_complex_sent(T.root)
+				logic_trees_complex.append(T.truth_tables_output)
+			print_truth_table(truth_values_atomic_sentences, logic_trees, logic_trees_complex, file, table_format)
+		with phase(stats, "validity"):
+			is_valid = check_validity(logic_trees)
+	else:
+		with phase(stats, "assign"):
+			flat_tree.assign_truth_values(truth_values_atomic_sentences, rows)
+		with phase(stats, "describe"):
+			flat_tree.describe()
+		with phase(stats, "print"):
+			shown = simplification.atomic_sentences if simplification and not show_removed else None
+			flat_tree.print_truth_table(file, table_format, shown)
+		with phase(stats, "validity"):
+			is_valid = flat_tree.check_validity()
+	print("Premises: ", list_of_statements[:-1], "\nConclusion: ", list_of_statements[-1], "\n", is_valid, 
+		  file = file if table_format == "fixed" else None)
+	if simplification:
+		for line in simplification.report(list_of_statements):
+			print(line, file = file if table_format == "fixed" else None)
+	if stats:
+		stats.report()
+
+def print_truth_table_streaming(list_of_statements, logic_trees, dict_atomic_sentences, block_rows, file=None, table_format="fixed", stats=None):
+	"""
+	Input: 1. List of Statements (Argument). 
+		   2. A list of the logic trees formed from the list of given statements.
+		   3. A dictionary which maps all the symbols of atomic sentences to None
+		   4. block_rows : Integer - the maximum number of rows in a block
+		   5. file : File object to print to. By default, it is the standard output.
+		   6. table_format : String - the format of the truth table (see print_truth_table).
+		   7. stats : Stats (optional) - the phases describe and print are recorded in it. Since the blocks are evaluated, printed and checked
+		   	  one after another, the phase print includes evaluating the blocks and checking their validity.
+	Output: Return none. Print truth table and the validity of the arguments, like answer_truth_table_validity.
+
+	1.	Describe the logic trees, write the header row, and find the column of every item of the header row once with resolve_truth_table_columns.
+		The columns of the atomic sentences are looked up in truth_values_block, which is updated with the columns of every block.
+	2.	For each block from generate_truth_table_blocks, write its rows and check its validity with check_validity.
+	3.	The argument is "Not Valid" if any block is "Not Valid". Otherwise, it "Is Valid" if any block "Is Valid". Otherwise, it is "Not Logically Connected".
+	"""
+	with phase(stats, "describe"):
+		for T in logic_trees:
+			T.describe(T.root)
+			T.truth_tables_complex_sent(T.root)
+	top_row = truth_table_header(dict_atomic_sentences, logic_trees)
+	truth_values_block = OrderedDict.fromkeys(dict_atomic_sentences)
+	resolved = resolve_truth_table_columns(top_row, truth_values_block, [T.truth_tables_output for T in logic_trees])
+
+	writer = open_writer(table_format, file or sys.stdout, top_row)
+	writer.write_header()
+	verdicts = set()
+	with phase(stats, "print"):
+		for columns, row_count in generate_truth_table_blocks(logic_trees, dict_atomic_sentences, block_rows):
+			truth_values_block.update(columns)
+			writer.write_rows(truth_table_columns(resolved), row_count)
+			verdicts.add(check_validity(logic_trees))
+		writer.flush()
+
+	is_valid = "Not Logically Connected"
+	if "Not Valid" in verdicts:
+		is_valid = "Not Valid"
+	elif "Is Valid" in verdicts:
+		is_valid = "Is Valid"
+	print("Premises: ", list_of_statements[:-1], "\nConclusion: ", list_of_statements[-1], "\n", is_valid, 
+		  file = file if table_format == "fixed" else None)
+
+def save_truth_table(list_of_statements, path, block_rows=2**20):
+	"""
+	Input: 1. List of Statements (Argument). 
+		   2. path : String - the path of the truth table file (see tablefile.py)
+		   3. block_rows : Integer - the maximum number of rows evaluated at a time (see generate_truth_table_blocks).
+	Output: Return none. The truth table is saved in the file, which can be opened with tablefile.TruthTableFile to check the validity,
+			query the rows or print the truth table without parsing or evaluating the statements again.
+
+	1.	Create the Logic Trees of the statements like answer_truth_table_validity, and describe them to find the header row of the truth table.
+	2.	Evaluate the truth table block by block with generate_truth_table_blocks, and write the columns of every item of the header row to the file.
+		The file is closed even if a block cannot be written.
+	"""
+	logic_trees, atomic_sentences = create_logic_trees(list_of_statements)
+	for T in logic_trees:
 		T.describe(T.root)
 		T.truth_tables_complex_sent(T.root)
-		logic_trees.append(T)
-		logic_trees_complex.append(T.truth_tables_output)
-
-	print_truth_table(truth_values_atomic_sentences, logic_trees, logic_trees_complex)
-	print("Premises: ", list_of_statements[:-1], "\nConclusion: ", list_of_statements[-1], "\n", check_validity(logic_trees))
 
-answer_truth_table_validity(sample3)
-print()
-answer_truth_table_validity(sample3_A)
\ No newline at end of file
+	top_row = truth_table_header(atomic_sentences, logic_trees)
+	with TruthTableFileWriter(path, list_of_statements, atomic_sentences, top_row, [T.root.desc for T in logic_trees], 2**len(atomic_sentences)) as table_file:
+		first_row = 0
+		for truth_values_block, row_count in generate_truth_table_blocks(logic_trees, atomic_sentences, max(8, block_rows)):
+			columns = dict(truth_values_block)
+			for T in logic_trees:
+				columns.update(T.truth_tables_output)
+			table_file.write_block(columns, first_row, row_count)
+			first_row += row_count
+
+def answer_validity(list_of_statements, engine="sat", stats=None, simplify=False):
+	"""
+	Input: 1. List of Statements (Argument). 
+		   2. engine : String - the name of the engine in validity_engines which checks the validity.
+		   	  "sat" (default) uses the SAT solver, which scales to arguments with hundreds of atomic sentences.
+		   	  "truth_table" searches the rows of the truth table lazily, which is only suitable for small arguments.
+		   	  "gray" searches the rows in Gray-code order, evaluating again only the nodes above the atomic sentence which changes.
+		   	  "columns" evaluates the whole columns of the premises and the conclusion with their compiled column functions.
+		   	  "parallel" evaluates the columns in blocks of rows in a pool of worker processes.
+		   	  "bdd" builds reduced ordered binary decision diagrams, which stay small for structured arguments such as chains of implications.
+		   	  "components" splits the argument into the groups of statements which share no atomic sentences, and checks each group separately.
+		   3. stats : Stats (optional) - if it is given, the time of the phases parse and validity, the number of nodes and the hits of the caches
+		   	  of parse_statement and compiled_formulas are recorded in it (see stats.py).
+		   4. simplify : Bool - whether the argument is simplified with simplify_argument before the engine checks it (see check_validity_simplified).
+		   	  The counterexample still has all the atomic sentences of the argument.
+	Output: Tuple - (String - the validity of the argument, Ordered Dictionary - the counterexample or None). Print the validity of the argument.
+
+	This is the validity-only mode of answer_truth_table_validity. The truth table is not built.
+	1.  Parse all the statements and create a Logic Tree for each statement, and identify all the atomic sentences, using create_logic_trees.
+	2.	Check the validity and look for a counterexample using the chosen engine.
+	3.	Print the validity, and the counterexample if there is one.
+	"""
+	if engine not in validity_engines:
+		raise ValueError("Unknown engine %r. Choose one of: %s" % (engine, ", ".join(validity_engines)))
+
+	if stats:
+		parse_cache_info = parse_statement.cache_info()
+		compiled_misses = compiled_formulas.misses
+	with phase(stats, "parse"):
+		logic_trees, atomic_sentences = create_logic_trees(list_of_statements)
+	with phase(stats, "validity"):
+		if simplify:
+			is_valid, counterexample = check_validity_simplified(logic_trees, atomic_sentences, engine)
+		else:
+			is_valid, counterexample = validity_engines[engine](logic_trees, atomic_sentences)
+	if stats:
+		stats.count_cache("parse_cache", parse_cache_info, parse_statement.cache_info())
+		stats.count("compiled_formulas_misses", compiled_formulas.misses - compiled_misses)
+		stats.count("nodes", len(dag_nodes(logic_trees)))
+		stats.report()
+	print("Premises: ", list_of_statements[:-1], "\nConclusion: ", list_of_statements[-1], "\n", is_valid)
+	if counterexample:
+		print("Counterexample: ", ", ".join("%s = %s" % (s, v) for s, v in counterexample.items()))
+	return is_valid, counterexample
+
+def validate_batch(list_of_arguments, columns=False, max_atoms=20):
+	"""
+	Input: 1. A list of arguments. Each argument is a list of statements, and its last entry is the conclusion.
+		   2. columns : Bool - whether the results include the columns of truth values of the statements.
+		   3. max_atoms : Integer - the arguments with more atomic sentences are checked with the SAT solver instead of the truth table.
+	Output: A list of the results of the arguments, in the same order. Each result is an Ordered Dictionary with the keys
+			"verdict" : String - the validity of the argument, like check_validity.
+			"counterexample" : Ordered Dictionary - the first row of the truth table which is a counterexample, or None.
+			"atomic_sentences" : List of the atomic sentences, in the order of the columns of the truth table. The atomic sentences of the arguments
+			checked with the truth table are sorted, so that the arguments with the same atomic sentences share the truth table.
+			"columns" (if columns is True) : Ordered Dictionary which maps every statement to its column of truth values, packed into an integer 
+			where bit i is the row i of the truth table. It is None for the arguments checked with the SAT solver.
+	Nothing is printed, so it can be used as a library, e.g., by service.py.
+
+	Checking many small arguments one by one spends most of the time parsing and generating the same columns again.
+	1.	Group the arguments by the set of their atomic sentences, in sorted order, so that "A or B" and "B or A" are in the same group.
+		The arguments of a group have the same truth table rows.
+	2.	For each group, generate the columns of the atomic sentences once, and create the Logic Trees of all the arguments of the group 
+		with one node_table, so that a subformula which appears in several arguments of the group is one node, evaluated once.
+	3.	Compare the columns of the premises and the conclusion of each argument with verdict_of_columns, like check_validity_columns.
+	"""
+	results = [None] * len(list_of_arguments)
+	groups = OrderedDict()
+	for i, list_of_statements in enumerate(list_of_arguments):
+		if not list_of_statements:
+			raise ValueError("Argument %d has no statements" % i)
+		atomic_sentences = identify_atomic_sentences_of_statements(list_of_statements)
+		if len(atomic_sentences) > max_atoms:
+			logic_trees, _ = create_logic_trees(list_of_statements)
+			is_valid, counterexample = check_validity_sat(logic_trees, atomic_sentences)
+			results[i] = OrderedDict([("verdict", is_valid), ("counterexample", counterexample), 
+									  ("atomic_sentences", list(atomic_sentences))])
+			if columns:
+				results[i]["columns"] = None
+		else:
+			groups.setdefault(tuple(sorted(atomic_sentences)), []).append(i)
+
+	for atoms, indices in groups.items():
+		dict_atomic_sentences = OrderedDict.fromkeys(atoms)
+		truth_values_atomic_sentences = generate_truth_values_for_atomic_sentences(dict_atomic_sentences)
+		row_count = 2**len(atoms)
+		mask = column_mask(row_count)
+		node_table = {}
+		for i in indices:
+			roots = []
+			for s in list_of_arguments[i]:
+				T = Tree()
+				T.create_logic_tree_from_statement(s, node_table)
+				roots.append(T.assign_truth_values_to_node(truth_values_atomic_sentences, row_count))
+			premises = mask
+			for root in roots[:-1]:
+				premises &= root.truth_values
+			conclusion = roots[-1].truth_values
+			is_valid, counterexample = verdict_of_columns(premises, conclusion, dict_atomic_sentences)
+			results[i] = OrderedDict([("verdict", is_valid), ("counterexample", counterexample), ("atomic_sentences", list(atoms))])
+			if columns:
+				results[i]["columns"] = OrderedDict((s, root.truth_values) for s, root in zip(list_of_arguments[i], roots))
+	return results
+
+if __name__ == "__main__":
+	answer_truth_table_validity(sample3)
+	print()
+	answer_truth_table_validity(sample3_A)
@@ -0,0 +1,364 @@
+"""
+SAT solver engine for checking the validity of large arguments.
+
+The truth table of an argument with n atomic sentences has 2^n rows, which is unusable beyond about 25 atomic sentences.
+Instead, an argument is invalid if and only if "premises ^ ~conclusion" is satisfiable. Therefore,
+
+1.	The logic trees are converted into a formula in conjunctive normal form (CNF) using the Tseitin transformation (class CNF).
+	The CNF only grows linearly with the size of the logic trees.
+2.	The satisfiability of the CNF is decided by a conflict-driven clause learning (CDCL) solver (class Solver).
+
+The literals follow the DIMACS convention: variable v is the literal v, and its negation is the literal -v.
+"""
+
+from collections import OrderedDict
+import heapq
+
+class CNF:
+	"""
+	This is a class for a formula in conjunctive normal form built from Logic Trees with the Tseitin transformation.
+
+	Each internal node of a Logic Tree gets a fresh variable x which is constrained to be equivalent to the connective of its child nodes.
+	For example, for the node "a and b", the clauses (~x V a), (~x V b) and (x V ~a V ~b) say that x <-> ( a ^ b ).
+	The negation of a node does not need any clause because it is the literal -x.
+	"""
+
+	def __init__(self):
+		"""
+		Attributes:
+		clauses : List of the clauses. Each clause is a list of literals.
+		variables : Ordered Dictionary that maps the atomic sentences to their variables, in the order the atomic sentences are found.
+		num_vars : Integer - the number of variables used so far (the atomic sentences and the Tseitin variables).
+		literals : Dictionary that maps the id of nodes which have been converted to their literals, so that a node shared by several trees is converted once.
+		"""
+		self.clauses = []
+		self.variables = OrderedDict()
+		self.num_vars = 0
+		self.literals = {}
+
+	def new_var(self):
+		self.num_vars += 1
+		return self.num_vars
+
+	def atom_var(self, atom):
+		if atom not in self.variables:
+			self.variables[atom] = self.new_var()
+		return self.variables[atom]
+
+	def add_tree(self, node):
+		"""
+		Input: A node (the root of a Logic Tree)
+		Output: Integer - the literal which is True if and only if the logical statement of the node is True.
+
+		1.	If the node is a leaf, the literal is the variable of the atomic sentence.
+		2.	If the node is an internal node, convert its child nodes first, and then add the Tseitin clauses of the connective for a fresh variable.
+			"and" and "or" take any number of child nodes. "nand" and "nor" are the negations of "and" and "or", so they use the same clauses
+			and the negation of the fresh variable.
+		3.	If the node is negated, return the negation of the literal.
+		"""
+		stack = [(node, False)]	# the nodes are converted in post-order with an explicit stack, so any depth can be converted
+		while stack:
+			n, expanded = stack.pop()
+			if id(n) in self.literals:
+				continue
+			if n.children and not expanded:
+				stack.append((n, True))
+				stack += [(child, False) for child in reversed(n.children)]
+				continue
+			self.literals[id(n)] = self.add_node(n)
+		return self.literals[id(node)]
+
+	def add_node(self, node):
+		"""
+		Input: A node whose child nodes are converted already
+		Output: Integer - the literal of the node, after the Tseitin clauses of its connective are added (see add_tree).
+		"""
+		if not node.children:	#the node is a leaf
+			lit = self.atom_var(node.data)
+		else:
+			args = [self.literals[id(child)] for child in node.children]
+			lit = self.new_var()
+			if node.data in ("and", "nand"):	# x <-> ( a1 ^ ... ^ ak )
+				self.clauses += [[-lit, a] for a in args] + [[lit] + [-a for a in args]]
+			elif node.data in ("or", "nor"):	# x <-> ( a1 V ... V ak )
+				self.clauses += [[-lit] + args] + [[lit, -a] for a in args]
+			else:
+				a, b = args
+				if node.data == "then":	# x <-> ( a -> b )
+					self.clauses += [[-lit, -a, b], [lit, a], [lit, -b]]
+				elif node.data == "iff":	# x <-> ( a <-> b )
+					self.clauses += [[-lit, -a, b], [-lit, a, -b], [lit, a, b], [lit, -a, -b]]
+				elif node.data == "xor":	# x <-> ( a XOR b )
+					self.clauses += [[-lit, a, b], [-lit, -a, -b], [lit, -a, b], [lit, a, -b]]
+			if node.data in ("nand", "nor"):
+				lit = -lit
+
+		if node.negation:
+			lit = -lit
+		return lit
+
+def luby(i):
+	"""
+	Return the i-th (starting from 1) term of the Luby sequence 1, 1, 2, 1, 1, 2, 4, 1, 1, 2, ..., which is used to schedule the restarts.
+	"""
+	k = 1
+	while (1 << k) - 1 < i:
+		k += 1
+	while (1 << k) - 1 != i:
+		i -= (1 << (k - 1)) - 1
+		k = 1
+		while (1 << k) - 1 < i:
+			k += 1
+	return 1 << (k - 1)
+
+class Solver:
+	"""
+	This is a class for a CDCL SAT solver.
+
+	1.	Unit propagation uses two watched literals per clause: the first two literals of a clause are watched, and a clause is only
+		visited when one of its watched literals becomes False.
+	2.	When a conflict is found, a clause is learned from the first unique implication point, and the solver backjumps to the
+		second highest decision level in the learned clause.
+	3.	The next variable to decide is the unassigned variable with the highest activity (VSIDS). The variables in the conflicts are bumped,
+		and the solver decides the phase which the variable had the last time it was assigned (phase saving).
+	4.	The search restarts from decision level 0 after a number of conflicts given by the Luby sequence.
+	"""
+
+	restart_base = 100
+	var_decay = 0.95
+
+	def __init__(self, num_vars, clauses):
+		"""
+		Attributes:
+		assigns : List - the truth value of each variable: 1 (True), -1 (False) or 0 (unassigned).
+		level : List - the decision level at which each variable is assigned.
+		reason : List - the clause which implied each variable, or None for decisions.
+		trail : List of the literals assigned so far, in order. trail_lim stores where each decision level starts in the trail.
+		watches : Dictionary that maps each literal to the clauses watching it.
+		ok : Bool - False if the clauses are found unsatisfiable when they are added.
+		"""
+		self.num_vars = num_vars
+		self.assigns = [0] * (num_vars + 1)
+		self.level = [0] * (num_vars + 1)
+		self.reason = [None] * (num_vars + 1)
+		self.phase = [-1] * (num_vars + 1)
+		self.activity = [0.0] * (num_vars + 1)
+		self.var_inc = 1.0
+		self.heap = [(0.0, v) for v in range(1, num_vars + 1)]
+		self.trail = []
+		self.trail_lim = []
+		self.qhead = 0
+		self.watches = {}
+		self.ok = True
+		for clause in clauses:
+			self.add_clause(clause)
+
+	def value(self, lit):
+		"""
+		Return True or False if the literal is assigned, otherwise None.
+		"""
+		a = self.assigns[abs(lit)]
+		if a == 0:
+			return None
+		return (a > 0) == (lit > 0)
+
+	def add_clause(self, clause):
+		"""
+		Add a clause before the search. Duplicated literals are removed, tautologies are ignored,
+		and unit clauses are assigned at decision level 0.
+		"""
+		if not self.ok:
+			return
+		clause = list(OrderedDict.fromkeys(clause))
+		if any(-lit in clause for lit in clause):
+			return
+		if not clause:
+			self.ok = False
+		elif len(clause) == 1:
+			if self.value(clause[0]) is False:
+				self.ok = False
+			elif self.value(clause[0]) is None:
+				self.enqueue(clause[0], None)
+		else:
+			self.watch(clause)
+
+	def watch(self, clause):
+		self.watches.setdefault(clause[0], []).append(clause)
+		self.watches.setdefault(clause[1], []).append(clause)
+
+	def enqueue(self, lit, reason):
+		v = abs(lit)
+		self.assigns[v] = 1 if lit > 0 else -1
+		self.level[v] = len(self.trail_lim)
+		self.reason[v] = reason
+		self.trail.append(lit)
+
+	def propagate(self):
+		"""
+		Output: The conflicting clause, or None if unit propagation finishes without any conflict.
+
+		For each literal p assigned in the trail, visit the clauses watching -p, which has just become False.
+		1.	Make sure the False literal is the second watched literal, clause[1].
+		2.	If the first watched literal is True, the clause is satisfied, so keep watching -p.
+		3.	Otherwise, look for another literal which is not False to watch instead of -p.
+		4.	If there is none, the clause is unit: assign the first watched literal, or report a conflict if it is False.
+		"""
+		while self.qhead < len(self.trail):
+			false_lit = -self.trail[self.qhead]
+			self.qhead += 1
+			watching = self.watches.get(false_lit, [])
+			kept = []
+			for i, clause in enumerate(watching):
+				if clause[0] == false_lit:
+					clause[0], clause[1] = clause[1], clause[0]
+				first = clause[0]
+				first_value = self.value(first)
+				if first_value is True:
+					kept.append(clause)
+					continue
+				for k in range(2, len(clause)):
+					if self.value(clause[k]) is not False:
+						clause[1], clause[k] = clause[k], clause[1]
+						self.watches.setdefault(clause[1], []).append(clause)
+						break
+				else:
+					kept.append(clause)
+					if first_value is False:
+						kept.extend(watching[i+1:])
+						self.watches[false_lit] = kept
+						self.qhead = len(self.trail)
+						return clause
+					self.enqueue(first, clause)
+			self.watches[false_lit] = kept
+		return None
+
+	def analyze(self, conflict):
+		"""
+		Input: The conflicting clause.
+		Output: Tuple - (the learned clause, the decision level to backjump to)
+
+		Resolve the conflicting clause with the reasons of the literals assigned at the current decision level,
+		walking the trail backwards, until only one literal of the current decision level is left (the first unique implication point).
+		The negation of that literal is put first in the learned clause, and the literal with the highest decision level among
+		the others is put second so that both can be watched.
+		"""
+		seen = set()
+		learnt = [None]
+		counter = 0
+		index = len(self.trail) - 1
+		current_level = len(self.trail_lim)
+		clause, p = conflict, None
+		while True:
+			for q in (clause if p is None else clause[1:]):
+				v = abs(q)
+				if v not in seen and self.level[v] > 0:
+					seen.add(v)
+					self.bump(v)
+					if self.level[v] == current_level:
+						counter += 1
+					else:
+						learnt.append(q)
+			while abs(self.trail[index]) not in seen:
+				index -= 1
+			p = self.trail[index]
+			index -= 1
+			clause = self.reason[abs(p)]
+			seen.discard(abs(p))
+			counter -= 1
+			if counter == 0:
+				break
+		learnt[0] = -p
+
+		back_level = 0
+		if len(learnt) > 1:
+			max_i = max(range(1, len(learnt)), key=lambda i: self.level[abs(learnt[i])])
+			learnt[1], learnt[max_i] = learnt[max_i], learnt[1]
+			back_level = self.level[abs(learnt[1])]
+		self.var_inc /= self.var_decay
+		return learnt, back_level
+
+	def bump(self, v):
+		self.activity[v] += self.var_inc
+		if self.activity[v] > 1e100:	# rescale all the activities to avoid overflow
+			self.activity = [a * 1e-100 for a in self.activity]
+			self.var_inc *= 1e-100
+			self.heap = [(-self.activity[u], u) for u in range(1, self.num_vars + 1) if self.assigns[u] == 0]
+			heapq.heapify(self.heap)
+		elif self.assigns[v] == 0:
+			heapq.heappush(self.heap, (-self.activity[v], v))
+
+	def backtrack(self, level):
+		"""
+		Unassign all the literals above the given decision level, saving their phases and putting them back into the heap.
+		"""
+		if len(self.trail_lim) > level:
+			for lit in self.trail[self.trail_lim[level]:]:
+				v = abs(lit)
+				self.phase[v] = self.assigns[v]
+				self.assigns[v] = 0
+				self.reason[v] = None
+				heapq.heappush(self.heap, (-self.activity[v], v))
+			del self.trail[self.trail_lim[level]:]
+			del self.trail_lim[level:]
+			self.qhead = len(self.trail)
+
+	def pick_branch(self):
+		"""
+		Return the unassigned variable with the highest activity, or None if all the variables are assigned.
+		Entries of the heap whose variables are assigned or whose activities are outdated are skipped.
+		"""
+		while self.heap:
+			a, v = heapq.heappop(self.heap)
+			if self.assigns[v] == 0 and -a == self.activity[v]:
+				return v
+		for v in range(1, self.num_vars + 1):
+			if self.assigns[v] == 0:
+				return v
+		return None
+
+	def solve(self):
+		"""
+		Output: Dictionary that maps each variable to its truth value in a satisfying assignment, or None if the clauses are unsatisfiable.
+		"""
+		if not self.ok:
+			return None
+
+		conflicts, restarts = 0, 1
+		restart_limit = self.restart_base * luby(restarts)
+		while True:
+			conflict = self.propagate()
+			if conflict is not None:
+				if not self.trail_lim:	# conflict at decision level 0
+					self.ok = False
+					return None
+				conflicts += 1
+				learnt, back_level = self.analyze(conflict)
+				self.backtrack(back_level)
+				if len(learnt) == 1:
+					self.enqueue(learnt[0], None)
+				else:
+					self.watch(learnt)
+					self.enqueue(learnt[0], learnt)
+			elif conflicts >= restart_limit:
+				conflicts = 0
+				restarts += 1
+				restart_limit = self.restart_base * luby(restarts)
+				self.backtrack(0)
+			else:
+				v = self.pick_branch()
+				if v is None:
+					return {v: self.assigns[v] > 0 for v in range(1, self.num_vars + 1)}
+				self.trail_lim.append(len(self.trail))
+				self.enqueue(v * self.phase[v], None)
+
+def satisfy(cnf, units):
+	"""
+	Input: 1. A CNF
+		   2. A list of literals which must be True
+	Output: Ordered Dictionary that maps the atomic sentences of the CNF to their truth values in a satisfying assignment,
+			or None if the CNF and the literals are unsatisfiable.
+	"""
+	model = Solver(cnf.num_vars, cnf.clauses + [[lit] for lit in units]).solve()
+	if model is None:
+		return None
+	return OrderedDict((atom, model[v]) for atom, v in cnf.variables.items())
@@ -0,0 +1,232 @@
+"""
+A long-running service which checks the validity of arguments sent as newline-delimited JSON, so that a client does not start a new process
+for every check.
+
+Usage:
+	python service.py									read the requests from the standard input and write the responses to the standard output
+	python service.py --socket /tmp/truth-table.sock	listen on a unix socket. Every connection is a stream of requests and responses.
+
+Every request is one line of JSON:
+	{"id": 1, "statements": ["if A, then B", "A", "B"]}					one argument. The last statement is the conclusion.
+	{"id": 2, "arguments": [["A", "A or B"], ["A and B", "B"]]}			several arguments, checked together with validate_batch.
+	{"id": 3, "statements": ["A", "A or B"], "columns": true}			also return the columns of truth values of the statements.
+An argument must be a non-empty list of strings. Every response is one line of JSON with the same "id", and the result of validate_batch
+("verdict", "counterexample", "atomic_sentences", "columns"), a list "results" of them for "arguments", or "error" if the request cannot be checked.
+The columns are hexadecimal strings of the packed bits (bit i is the row i), since they are too large for JSON numbers.
+The requests of a stream are checked concurrently, so the responses may come in a different order than the requests.
+
+1.	At most max_concurrent checks run at the same time. They run in an executor, so that the event loop keeps reading requests.
+2.	If a request is the same as a request which is still being checked, it waits for the result of that check instead of checking it again.
+3.	The results are kept in a least recently used cache of at most cache_size requests.
+4.	A line longer than the limit of the stream (LINE_LIMIT bytes by default) is skipped with an error response, and the stream goes on.
+"""
+
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import asyncio
+import json
+import sys
+
+from logic import validate_batch
+
+LINE_LIMIT = 2**26	# the longest line of a request on a socket, in bytes
+
+def check_argument(list_of_statements):
+	"""
+	Raise ValueError unless list_of_statements is a non-empty list of strings.
+	"""
+	if not isinstance(list_of_statements, list) or not list_of_statements or not all(isinstance(s, str) for s in list_of_statements):
+		raise ValueError("an argument must be a non-empty list of statements (strings), not %s" % json.dumps(list_of_statements)[:100])
+
+def encode_result(result):
+	"""
+	Return a copy of a result of validate_batch whose columns are hexadecimal strings.
+	"""
+	result = OrderedDict(result)
+	if result.get("columns"):
+		result["columns"] = OrderedDict((s, "%x" % column) for s, column in result["columns"].items())
+	return result
+
+class Service:
+	"""
+	This is a class for the checks of the requests of one or more streams, which share the limit of concurrency, the checks in flight and the cache.
+
+	Attributes:
+	semaphore : asyncio.Semaphore - it limits the number of checks running at the same time to max_concurrent.
+	in_flight : Dictionary that maps the keys of the requests being checked to the futures of their results.
+	cache : Ordered Dictionary that maps the keys of the requests to their results. The least recently used result is evicted first.
+	executor : the executor of the checks, e.g., a ProcessPoolExecutor. By default, the default executor of the event loop (threads).
+	"""
+
+	def __init__(self, max_concurrent=8, cache_size=2**16, executor=None):
+		self.semaphore = asyncio.Semaphore(max_concurrent)
+		self.in_flight = {}
+		self.cache = OrderedDict()
+		self.cache_size = cache_size
+		self.executor = executor
+
+	async def check(self, list_of_arguments, columns=False):
+		"""
+		Input: 1. A list of arguments (lists of statements)
+			   2. columns : Bool - whether the results include the columns of truth values (see validate_batch)
+		Output: The list of the results of validate_batch.
+		"""
+		key = (tuple(tuple(statements) for statements in list_of_arguments), columns)
+		if key in self.cache:
+			self.cache.move_to_end(key)
+			return self.cache[key]
+		if key in self.in_flight:
+			return await asyncio.shield(self.in_flight[key])
+
+		future = self.in_flight[key] = asyncio.get_running_loop().create_future()
+		try:
+			async with self.semaphore:
+				results = await asyncio.get_running_loop().run_in_executor(self.executor, validate_batch, list_of_arguments, columns)
+		except Exception as e:
+			future.set_exception(e)
+			future.exception()	# mark the exception as retrieved, so it is not logged when no other request waits for it
+			raise
+		else:
+			future.set_result(results)
+			self.cache[key] = results
+			if len(self.cache) > self.cache_size:
+				self.cache.popitem(last=False)
+			return results
+		finally:
+			del self.in_flight[key]
+
+	async def respond(self, line):
+		"""
+		Input: String - one line of a request
+		Output: String - the line of the response in JSON. Whatever fails, including the encoding of the response,
+				the response is an error with the id of the request, so that every request gets a response.
+		"""
+		request_id = None
+		try:
+			request = json.loads(line)
+			if not isinstance(request, dict):
+				raise ValueError("a request must be a JSON object")
+			request_id = request.get("id")
+			columns = bool(request.get("columns", False))
+			response = OrderedDict([("id", request_id)])
+			if "arguments" in request:
+				if not isinstance(request["arguments"], list) or not request["arguments"]:
+					raise ValueError("arguments must be a non-empty list of arguments")
+				for list_of_statements in request["arguments"]:
+					check_argument(list_of_statements)
+				response["results"] = [encode_result(result) for result in await self.check(request["arguments"], columns)]
+			else:
+				check_argument(request.get("statements"))
+				response.update(encode_result((await self.check([request["statements"]], columns))[0]))
+			return json.dumps(response)
+		except Exception as e:
+			return json.dumps(OrderedDict([("id", request_id), ("error", "%s: %s" % (type(e).__name__, e))]))
+
+	async def serve(self, readline, write):
+		"""
+		Input: 1. readline : coroutine function which returns the next line of the requests in bytes, or b"" at the end of the stream.
+					  It raises ValueError if the line is too long, after skipping the whole line.
+			   2. write : coroutine function which writes a line of a response in bytes.
+		Output: None. Read the requests until the stream ends, and write every response as soon as it is ready.
+		"""
+		async def handle(line):
+			response = await self.respond(line)
+			try:
+				await write((response + "\n").encode())
+			except ConnectionError:	# the client is gone
+				pass
+
+		tasks = set()
+		while True:
+			try:
+				line = await readline()
+			except ValueError as e:
+				await write((json.dumps(OrderedDict([("id", None), ("error", "ValueError: %s" % e)])) + "\n").encode())
+				continue
+			if not line:
+				break
+			if line.strip():
+				task = asyncio.ensure_future(handle(line.decode()))
+				tasks.add(task)
+				task.add_done_callback(tasks.discard)
+		if tasks:
+			await asyncio.wait(tasks)
+
+async def serve_stdio(service):
+	"""
+	Serve the requests of the standard input, and write the responses to the standard output.
+	The standard input is read in a thread, since it may be a file, which the event loop cannot wait for.
+	"""
+	loop = asyncio.get_running_loop()
+
+	async def readline():
+		return await loop.run_in_executor(None, sys.stdin.buffer.readline)
+
+	async def write(line):
+		sys.stdout.buffer.write(line)
+		sys.stdout.buffer.flush()
+
+	await service.serve(readline, write)
+
+async def serve_socket(service, path, limit=LINE_LIMIT):
+	"""
+	Serve the requests of every connection to the unix socket at path, until the process is stopped.
+	A line longer than limit bytes is read and dropped in chunks, so it does not end the connection.
+	"""
+	async def connection(reader, writer):
+		async def readline():
+			try:
+				return await reader.readuntil(b"\n")
+			except asyncio.IncompleteReadError as e:	# the last line has no newline
+				return e.partial
+			except asyncio.LimitOverrunError:
+				pass
+			while True:	# skip the rest of the long line
+				try:
+					await reader.readuntil(b"\n")
+					break
+				except asyncio.LimitOverrunError as e:
+					await reader.readexactly(e.consumed)
+				except asyncio.IncompleteReadError:
+					break
+			raise ValueError("the request is longer than %d bytes" % limit)
+
+		async def write(line):
+			writer.write(line)
+			await writer.drain()
+
+		try:
+			await service.serve(readline, write)
+		finally:
+			writer.close()
+
+	server = await asyncio.start_unix_server(connection, path, limit=limit)
+	async with server:
+		await server.serve_forever()
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description="Check the validity of arguments sent as newline-delimited JSON.")
+	parser.add_argument("--socket", metavar="PATH", help="listen on the unix socket PATH instead of the standard input")
+	parser.add_argument("--max-concurrent", type=int, default=8, help="the largest number of checks running at the same time")
+	parser.add_argument("--cache-size", type=int, default=2**16, help="the largest number of results in the cache")
+	parser.add_argument("--workers", type=int, help="check in a pool of worker processes instead of threads")
+	args = parser.parse_args(argv)
+
+	async def run():
+		executor = ProcessPoolExecutor(args.workers) if args.workers else None
+		service = Service(args.max_concurrent, args.cache_size, executor)
+		try:
+			if args.socket:
+				await serve_socket(service, args.socket)
+			else:
+				await serve_stdio(service)
+		finally:
+			if executor:
+				executor.shutdown()
+
+	asyncio.run(run())
+	return 0
+
+if __name__ == "__main__":
+	sys.exit(main())
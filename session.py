@@ -0,0 +1,215 @@
+"""
+A long-lived session of an argument which is edited one statement at a time, e.g., by interactive what-if tools.
+
+answer_truth_table_validity starts from scratch on every call. A Session keeps, between the edits of the argument:
+1.	The Logic Trees of the statements, which share their identical subformulas through one node_table.
+2.	The columns of truth values of the subformulas, in a least recently used cache keyed by their descriptions (see Tree.describe),
+	which is bounded by a budget of memory. A column which has been evicted is computed again from its child nodes when it is needed.
+3.	The atomic sentences, in the order they were introduced. When a statement introduces a new atomic sentence, it is added after
+	all the others, and the cached columns are extended to the new rows with extend_column instead of being evaluated again.
+Therefore, adding a statement only evaluates its subformulas which are not cached yet, and removing a statement evaluates nothing.
+"""
+
+from collections import OrderedDict
+
+from logic import (Tree, column_mask, connective_column, dag_nodes, extend_column,
+				   generate_truth_values_for_atomic_sentences, identify_atomic_sentences_of_statements,
+				   post_order, print_truth_table, verdict_of_columns)
+
+class Session:
+	"""
+	This is a class for an argument whose premises and conclusion can be changed, reusing the work done for the previous versions of the argument.
+
+	The atomic sentences stay in the session after the statements which use them are removed. They do not change the validity of the argument,
+	but they remain columns of the truth table.
+	"""
+
+	def __init__(self, list_of_statements=(), memory_budget=2**28):
+		"""
+		Input: 1. List of Statements (Argument) (optional). The last entry is the conclusion. The other entries are the premises.
+			   2. memory_budget : Integer - the maximum number of bytes of the cached columns of truth values.
+
+		Attributes:
+		premises : List of the premises (Strings).
+		conclusion : String - the conclusion, or None.
+		atomic_sentences : Ordered Dictionary which maps the atomic sentences to None, in the order they were introduced.
+		truth_values_atomic_sentences : Ordered Dictionary which maps the atomic sentences to their columns of truth values, or None until they are needed.
+		node_table : Dictionary shared by the Logic Trees of all the statements to intern their nodes (see Tree.create_logic_tree).
+		trees : Dictionary that maps the statements of the argument to their described Logic Trees. The trees of removed statements are dropped.
+		columns : Ordered Dictionary - the cache of columns, which maps the descriptions of the nodes to the tuples (bytes, number of atomic sentences, column).
+				  A column of k atomic sentences is extended when it is used with more atomic sentences. The least recently used column is evicted first.
+		cached_bytes : Integer - the number of bytes of the columns in the cache.
+		"""
+		self.premises = []
+		self.conclusion = None
+		self.atomic_sentences = OrderedDict()
+		self.truth_values_atomic_sentences = None
+		self.node_table = {}
+		self.trees = {}
+		self.columns = OrderedDict()
+		self.memory_budget = memory_budget
+		self.cached_bytes = 0
+
+		list_of_statements = list(list_of_statements)
+		for s in list_of_statements[:-1]:
+			self.add_premise(s)
+		if list_of_statements:
+			self.set_conclusion(list_of_statements[-1])
+
+	def statements(self):
+		"""
+		Output: List of Statements (Argument) - the premises, then the conclusion.
+		"""
+		return self.premises + [self.conclusion]
+
+	def tree(self, s):
+		"""
+		Return the Logic Tree of the statement s. It is created and described the first time, and its new atomic sentences are added to the session.
+		"""
+		if s not in self.trees:
+			T = Tree()
+			T.create_logic_tree_from_statement(s, self.node_table)
+			T.describe(T.root)
+			new_atoms = [atom for atom in identify_atomic_sentences_of_statements([s]) if atom not in self.atomic_sentences]
+			if new_atoms:
+				self.atomic_sentences.update(OrderedDict.fromkeys(new_atoms))
+				self.truth_values_atomic_sentences = None
+			self.trees[s] = T
+		return self.trees[s]
+
+	def add_premise(self, s):
+		"""
+		Modifying method. Append the statement s to the premises.
+		"""
+		self.tree(s)
+		self.premises.append(s)
+
+	def remove_premise(self, s):
+		"""
+		Modifying method. Remove the first premise which is the statement s. Raise ValueError if there is none.
+		"""
+		self.premises.remove(s)
+		self.forget(s)
+
+	def set_conclusion(self, s):
+		"""
+		Modifying method. Replace the conclusion with the statement s.
+		"""
+		self.tree(s)
+		previous, self.conclusion = self.conclusion, s
+		if previous is not None:
+			self.forget(previous)
+
+	def forget(self, s):
+		"""
+		Modifying method. If the statement s is no longer in the argument, drop its Logic Tree, and the entries of node_table 
+		of the nodes which no other statement uses. Its columns stay in the cache until they are evicted.
+		"""
+		if s in self.trees and s not in self.statements():
+			del self.trees[s]
+			live = set(map(id, dag_nodes(self.trees.values())))
+			self.node_table = {key: node for key, node in self.node_table.items() if id(node) in live}
+
+	def row_count(self):
+		return 2**len(self.atomic_sentences)
+
+	def cache(self, desc, column):
+		"""
+		Store the column of the description desc in the cache, and evict the least recently used columns until the cache is within the memory budget.
+		"""
+		column_bytes = self.row_count() // 8 + 1
+		if desc in self.columns:
+			self.cached_bytes -= self.columns.pop(desc)[0]
+		self.columns[desc] = (column_bytes, len(self.atomic_sentences), column)
+		self.cached_bytes += column_bytes
+		while self.cached_bytes > self.memory_budget and self.columns:
+			self.cached_bytes -= self.columns.popitem(last=False)[1][0]
+
+	def cached_column(self, desc):
+		"""
+		Return the cached column of the description desc, extended with one row-doubling for each atomic sentence added since it was cached,
+		or None if it is not cached.
+		"""
+		if desc not in self.columns:
+			return None
+		self.columns.move_to_end(desc)
+		column_bytes, atom_count, column = self.columns[desc]
+		if atom_count < len(self.atomic_sentences):
+			while atom_count < len(self.atomic_sentences):
+				column = extend_column(column, 2**atom_count)
+				atom_count += 1
+			self.cache(desc, column)
+		return column
+
+	def column(self, node):
+		"""
+		Input: A node of the Logic Tree of a statement of the session.
+		Output: Integer - the node's column of truth values over all the atomic sentences of the session, including its negation.
+
+		1.	If the column of the node's description is cached, extend it to the new atomic sentences with cached_column.
+		2.	Otherwise, visit the nodes below it whose columns are not cached with post_order, which does not recurse, child nodes first.
+			If a node is a leaf, its column is the column of its atomic sentence.
+			If it is an internal node, compute its column from the columns of its child nodes with connective_column.
+		3.	Negate the column if the node is negated, and cache it.
+		"""
+		column = self.cached_column(node.desc)
+		if column is not None:
+			return column
+
+		mask = column_mask(self.row_count())
+		computed = {}	# the columns computed here, which may be evicted from the cache before their parent node uses them
+		for n in post_order([node], lambda n: n.desc in self.columns):
+			if not n.children:	#the node is a leaf
+				if self.truth_values_atomic_sentences is None:
+					self.truth_values_atomic_sentences = generate_truth_values_for_atomic_sentences(self.atomic_sentences)
+				column = self.truth_values_atomic_sentences[n.data]
+			else:
+				column = connective_column(n.data, [computed[id(child)] if id(child) in computed else self.column(child) for child in n.children], mask)
+			if n.negation:
+				column ^= mask
+			self.cache(n.desc, column)
+			computed[id(n)] = column
+		return computed[id(node)]
+
+	def check_validity(self):
+		"""
+		Output: Tuple - (String - whether the argument is valid or invalid, Ordered Dictionary - the counterexample or None), like check_validity_columns.
+				Only the columns of the roots are looked up, so an argument whose statements are cached is checked without evaluating anything.
+		"""
+		premises = column_mask(self.row_count())
+		for s in self.premises:
+			premises &= self.column(self.trees[s].root)
+		conclusion = self.column(self.trees[self.conclusion].root)
+		return verdict_of_columns(premises, conclusion, self.atomic_sentences)
+
+	def print_truth_table(self, file=None, table_format="fixed"):
+		"""
+		Input: 1. file : File object to print to. By default, it is the standard output.
+			   2. table_format : String - the format of the truth table (see print_truth_table in logic.py).
+		Output: Return none. Print the truth table and the validity of the argument, like answer_truth_table_validity.
+
+		The columns of all the nodes are taken from the cache with Session.column and assigned to the nodes,
+		so that the header row and the columns are found with Tree.truth_tables_complex_sent like answer_truth_table_validity.
+		They are cleared from the nodes after printing, so that only the cache keeps columns, within the memory budget.
+		"""
+		logic_trees = [self.trees[s] for s in self.statements()]
+		mask = column_mask(self.row_count())
+		for node in dag_nodes(logic_trees):
+			node.truth_values = self.column(node)
+			node.truth_values_wo_negation = node.truth_values ^ mask if node.negation else None
+
+		logic_trees_complex = []
+		for T in logic_trees:
+			T.row_count = self.row_count()
+			T.truth_tables_output = OrderedDict()
+			T.truth_tables_complex_sent(T.root)
+			logic_trees_complex.append(T.truth_tables_output)
+		if self.truth_values_atomic_sentences is None:
+			self.truth_values_atomic_sentences = generate_truth_values_for_atomic_sentences(self.atomic_sentences)
+
+		print_truth_table(self.truth_values_atomic_sentences, logic_trees, logic_trees_complex, file, table_format)
+		for T in logic_trees:
+			T.clear_truth_values()
+			T.truth_tables_output = OrderedDict()
+		print("Premises: ", self.premises, "\nConclusion: ", self.conclusion, "\n", self.check_validity()[0],
+			  file = file if table_format == "fixed" else None)
@@ -0,0 +1,102 @@
+"""
+Runtime statistics of the phases of a validity check, e.g., answer_truth_table_validity(list_of_statements, stats=Stats()).
+
+A Stats object records:
+1.	The wall time of every phase (parse, atoms, assign, describe, print, validity, ...), and optionally the bytes allocated in every phase,
+	which are measured with tracemalloc.
+2.	Counters, such as the number of nodes of the Logic Trees and the number of rows evaluated.
+3.	The hits and misses of the caches, such as the cache of parse_statement.
+The statistics can be exported as JSON, or handed to a callback when the check is finished.
+
+When no Stats object is given, the functions use phase(None, name), which returns one shared context manager that does nothing,
+and skip the counters, so the statistics cost nothing when they are disabled.
+"""
+
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
+import json
+import time
+import tracemalloc
+
+NO_PHASE = nullcontext()
+
+def phase(stats, name):
+	"""
+	Input: 1. stats : Stats or None
+		   2. name : String - the name of the phase
+	Output: A context manager which records the phase in stats, or does nothing if stats is None.
+	"""
+	return NO_PHASE if stats is None else stats.phase(name)
+
+class Stats:
+	"""
+	This is a class for the statistics of one or more validity checks.
+
+	Attributes:
+	phases : Ordered Dictionary that maps the names of the phases to dictionaries {"seconds", "calls"}, and "allocated_bytes" and "peak_bytes"
+			 if the memory is traced. A phase which runs several times accumulates its time and its allocated bytes.
+	counters : Ordered Dictionary that maps the names of the counters to Integers, e.g., "nodes", "rows_evaluated", "parse_cache_hits".
+	trace_memory : Bool - whether the bytes allocated in every phase are measured with tracemalloc.
+	callback : Function (optional) - called with the Stats object by Stats.report, when the check is finished.
+	"""
+
+	def __init__(self, trace_memory=False, callback=None):
+		self.phases = OrderedDict()
+		self.counters = OrderedDict()
+		self.trace_memory = trace_memory
+		self.callback = callback
+
+	@contextmanager
+	def phase(self, name):
+		"""
+		A context manager which records the wall time of the code inside it as the phase name.
+		If trace_memory is True, tracemalloc is started for the phase if it is not tracing already, and the allocated bytes
+		(the traced memory at the end minus the traced memory at the start) and the peak of the traced memory during the phase are recorded.
+		"""
+		record = self.phases.setdefault(name, OrderedDict([("seconds", 0.0), ("calls", 0)]))
+		started_tracing = self.trace_memory and not tracemalloc.is_tracing()
+		if started_tracing:
+			tracemalloc.start()
+		if self.trace_memory:
+			tracemalloc.reset_peak()
+			memory_start = tracemalloc.get_traced_memory()[0]
+		start = time.perf_counter()
+		try:
+			yield record
+		finally:
+			record["seconds"] += time.perf_counter() - start
+			record["calls"] += 1
+			if self.trace_memory:
+				memory_end, memory_peak = tracemalloc.get_traced_memory()
+				record["allocated_bytes"] = record.get("allocated_bytes", 0) + memory_end - memory_start
+				record["peak_bytes"] = max(record.get("peak_bytes", 0), memory_peak - memory_start)
+			if started_tracing:
+				tracemalloc.stop()
+
+	def count(self, name, amount=1):
+		self.counters[name] = self.counters.get(name, 0) + amount
+
+	def count_cache(self, name, info_before, info_after):
+		"""
+		Input: 1. name : String - the name of the cache
+			   2. info_before, info_after : the cache_info() of a functools.lru_cache before and after the check
+		Output: None. The hits and misses of the cache during the check are added to the counters name_hits and name_misses.
+		"""
+		self.count(name + "_hits", info_after.hits - info_before.hits)
+		self.count(name + "_misses", info_after.misses - info_before.misses)
+
+	def as_dict(self):
+		return OrderedDict([("phases", self.phases), ("counters", self.counters)])
+
+	def to_json(self, **kwargs):
+		"""
+		Return the statistics as a JSON string. The keyword arguments are passed to json.dumps, e.g., indent=1.
+		"""
+		return json.dumps(self.as_dict(), **kwargs)
+
+	def report(self):
+		"""
+		Hand the statistics to the callback, if there is one.
+		"""
+		if self.callback:
+			self.callback(self)
@@ -0,0 +1,217 @@
+"""
+A binary file format for computed truth tables, which can be memory-mapped to reuse a truth table without parsing or evaluating the statements again.
+
+Layout of the file:
+1.	Magic bytes b"TRUTHTBL", then the version and the length of the header as 4-byte little-endian unsigned integers.
+2.	The header, which is JSON encoded in UTF-8. It contains the statements of the argument, the atomic sentences, the header row of the truth table (top_row),
+	the number of rows, the description of the root of every statement (see Tree.describe), and the index of the columns, which maps
+	the description of every column to its offset and its length in bytes from the start of the data.
+3.	The data: the columns of truth values packed into bits, each starting at a multiple of 64 bytes. Bit i of a column (bit i % 8 of byte i // 8)
+	is the truth value of row i, which is the same as the integers of the columns in little-endian order.
+
+The columns are written block by block of rows, so a truth table which does not fit in memory can still be saved (see TruthTableFileWriter).
+When a file is opened with TruthTableFile, it is memory-mapped, and the columns are returned as memoryviews of the mapping without copying.
+Several processes which open the same file share it through the page cache.
+"""
+
+from collections import OrderedDict
+import json
+import mmap
+import struct
+import sys
+
+from writers import open_writer
+
+MAGIC = b"TRUTHTBL"
+VERSION = 1
+ALIGNMENT = 64
+PREAMBLE = struct.Struct("<8sII")	# magic, version, length of the header
+
+def column_bytes(row_count):
+	return (row_count + 7) // 8
+
+class TruthTableFileWriter:
+	"""
+	This is a class to save a truth table to a file, block by block of rows.
+	"""
+
+	def __init__(self, path, list_of_statements, atomic_sentences, top_row, roots, row_count):
+		"""
+		Input: 1. path : String - the path of the file
+			   2. List of Statements (Argument).
+			   3. A list of the atomic sentences
+			   4. top_row : List - the header row of the truth table, including the separator "|"
+			   5. roots : List - the description of the root of every statement, in the order of the statements
+			   6. row_count : Integer - number of rows in the truth table
+
+		The header is written, and the file is extended to its full size, so that the blocks can be written at their offsets in any order.
+		"""
+		self.row_count = row_count
+		self.index = OrderedDict()
+		offset = 0
+		for desc in top_row:
+			if desc != "|" and desc not in self.index:
+				self.index[desc] = (offset, column_bytes(row_count))
+				offset += -(-column_bytes(row_count) // ALIGNMENT) * ALIGNMENT
+
+		header = json.dumps({
+			"statements": list(list_of_statements),
+			"atomic_sentences": list(atomic_sentences),
+			"top_row": list(top_row),
+			"roots": list(roots),
+			"row_count": row_count,
+			"columns": self.index,
+		}).encode("utf-8")
+		self.data_start = -(-(PREAMBLE.size + len(header)) // ALIGNMENT) * ALIGNMENT
+
+		self.file = open(path, "wb")
+		try:
+			self.file.write(PREAMBLE.pack(MAGIC, VERSION, len(header)))
+			self.file.write(header)
+			self.file.truncate(self.data_start + offset)
+		except BaseException:
+			self.file.close()
+			raise
+
+	def write_block(self, columns, first_row, row_count):
+		"""
+		Input: 1. A dictionary which maps the descriptions of the columns to their columns of truth values in the block
+			   2. first_row : Integer - the index of the first row of the block in the truth table. It must be a multiple of 8.
+			   3. row_count : Integer - number of rows in the block. It must be a multiple of 8 unless the block is the last one.
+		Output: None. The columns of the block are written at their offsets.
+		"""
+		for desc, (offset, length) in self.index.items():
+			self.file.seek(self.data_start + offset + first_row // 8)
+			self.file.write(columns[desc].to_bytes(column_bytes(row_count), "little"))
+
+	def close(self):
+		self.file.close()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *exc_info):
+		self.close()
+
+class TruthTableFile:
+	"""
+	This is a class for a truth table file opened with mmap.
+
+	Attributes:
+	statements : List of Statements (Argument).
+	atomic_sentences : List of the atomic sentences.
+	top_row : List - the header row of the truth table.
+	roots : List - the description of the root of every statement.
+	row_count : Integer - number of rows in the truth table.
+	index : Dictionary that maps the descriptions of the columns to their offsets and lengths in bytes.
+	"""
+
+	def __init__(self, path):
+		self.file = open(path, "rb")
+		self.mmap = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+		magic, version, header_length = PREAMBLE.unpack_from(self.mmap, 0)
+		if magic != MAGIC:
+			raise ValueError("%s is not a truth table file" % path)
+		if version != VERSION:
+			raise ValueError("Unsupported version %d of truth table file %s" % (version, path))
+
+		header = json.loads(self.mmap[PREAMBLE.size:PREAMBLE.size + header_length].decode("utf-8"))
+		self.statements = header["statements"]
+		self.atomic_sentences = header["atomic_sentences"]
+		self.top_row = header["top_row"]
+		self.roots = header["roots"]
+		self.row_count = header["row_count"]
+		self.index = header["columns"]
+		self.data = memoryview(self.mmap)[-(-(PREAMBLE.size + header_length) // ALIGNMENT) * ALIGNMENT:]
+
+	def column(self, desc):
+		"""
+		Return the column of truth values of the description desc as a memoryview of the packed bits, without copying.
+		"""
+		offset, length = self.index[desc]
+		return self.data[offset:offset + length]
+
+	def column_values(self, desc, first_row=0, row_count=None):
+		"""
+		Return the column of truth values of the description desc as an integer, like the columns of Tree.assign_truth_values_to_node.
+		If first_row and row_count are given, return only the block of rows from first_row, which must be a multiple of 8.
+		Without them, the whole column is copied into the integer, so the large tables should be read block by block.
+		"""
+		if row_count is None:
+			row_count = self.row_count - first_row
+		view = self.column(desc)[first_row // 8:first_row // 8 + column_bytes(row_count)]
+		return int.from_bytes(view, "little") & ((1 << row_count) - 1)
+
+	def truth_value(self, desc, row):
+		"""
+		Return the truth value of the description desc in the row of the truth table.
+		"""
+		return bool(self.column(desc)[row >> 3] >> (row & 7) & 1)
+
+	def row(self, row):
+		"""
+		Return an Ordered Dictionary which maps every item of the header row to its truth value in the row of the truth table.
+		"""
+		return OrderedDict((desc, self.truth_value(desc, row)) for desc in self.top_row if desc != "|")
+
+	def check_validity(self, block_rows=2**20):
+		"""
+		Input: block_rows : Integer - the number of rows read from the file at a time. It is rounded down to a multiple of 8.
+		Output: String - whether the argument is valid or invalid, with the same verdicts as check_validity in logic.py,
+				computed from the columns of the roots in the file.
+
+		The columns of the roots are combined block by block of rows, like check_validity_parallel, so that only one block of each column
+		is copied out of the memory map at a time. The conclusion of a block is only read if the premises are all True in some row of the block,
+		and the search stops at the first block with a counterexample.
+		"""
+		block_rows = max(8, block_rows - block_rows % 8)
+		is_valid = "Not Logically Connected"
+		for first_row in range(0, self.row_count, block_rows):
+			row_count = min(block_rows, self.row_count - first_row)
+			premises = (1 << row_count) - 1
+			for desc in self.roots[:-1]:
+				premises &= self.column_values(desc, first_row, row_count)
+				if not premises:
+					break
+			if not premises:
+				continue
+			conclusion = self.column_values(self.roots[-1], first_row, row_count)
+			if premises & ~conclusion:
+				return "Not Valid"
+			if premises & conclusion:
+				is_valid = "Is Valid"
+		return is_valid
+
+	def print_truth_table(self, file=None, table_format="fixed", block_rows=2**16):
+		"""
+		Input: 1. file : File object to print to. By default, it is the standard output.
+			   2. table_format : String - the format of the truth table (see writers.py).
+			   3. block_rows : Integer - the number of rows read from the file and written at a time. It is rounded down to a multiple of 8.
+		Output: None. Print the truth table in the file, like print_truth_table in logic.py.
+		"""
+		block_rows = max(8, block_rows - block_rows % 8)
+		writer = open_writer(table_format, file or sys.stdout, self.top_row)
+		writer.write_header()
+		for first_row in range(0, self.row_count, block_rows):
+			row_count = min(block_rows, self.row_count - first_row)
+			columns = [None if desc == "|" else self.column_values(desc, first_row, row_count) for desc in self.top_row]
+			writer.write_rows(columns, row_count)
+		writer.flush()
+
+	def close(self):
+		"""
+		Close the file. A memory map cannot be closed while the memoryviews returned by column still exist, so if the caller still holds some,
+		the map is left open, and it is unmapped when the last of them is released or garbage collected.
+		"""
+		self.data.release()
+		try:
+			self.mmap.close()
+		except BufferError:	# exported pointers exist
+			pass
+		self.file.close()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *exc_info):
+		self.close()
@@ -0,0 +1,98 @@
+"""
+Tests of the BDD engine (check_validity_bdd) against the brute force, and of the operations of the BDD manager of bdd.py.
+"""
+
+from itertools import product
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import logic
+from bdd import BDD, FALSE, TRUE
+from test_engines import EngineTestCase, evaluate, random_arguments, random_formula, statement
+
+def implication_chain(n):
+	"""
+	Output: String - "if A0, then ( if A1, then ( ... A(n-1) ) )", whose BDD is n levels deep.
+	"""
+	s = "A%d" % (n - 1)
+	for i in reversed(range(n - 1)):
+		s = "if A%d, then ( %s )" % (i, s)
+	return s
+
+class TestBDD(EngineTestCase):
+
+	def test_verdicts(self):
+		arguments = random_arguments(300)
+		for ordering in ["static", "reverse", "frequency"]:
+			for sift in [False, True]:
+				self.assert_engine(logic.check_validity_bdd, arguments, ordering=ordering, sift=sift)
+				self.assert_known_arguments(logic.check_validity_bdd, ordering=ordering, sift=sift)
+
+	def test_count(self):
+		rng = random.Random(13)
+		for _ in range(100):
+			formula = random_formula(rng, "ABCD", rng.randint(0, 4))
+			T = logic.Tree()
+			T.create_logic_tree_from_statement(statement(formula))
+			manager = BDD("ABCD")
+			u = manager.from_tree(T.root)
+			expected = sum(evaluate(formula, dict(zip("ABCD", values))) for values in product([True, False], repeat=4))
+			self.assertEqual(manager.count(u), expected, statement(formula))
+			self.assertEqual(manager.count(manager.negate(u)), 16 - expected, statement(formula))
+
+	def test_deep_chain(self):
+		n = 1500
+		T = logic.Tree()
+		T.create_logic_tree_from_statement(implication_chain(n))
+		manager = BDD(["A%d" % i for i in range(n)])
+		u = manager.from_tree(T.root)
+		self.assertEqual(manager.count(u), 2**n - 1)	# False only if all the atomic sentences but the last are True
+		v = manager.negate(u)
+		self.assertEqual(manager.count(v), 1)
+		self.assertEqual(manager.apply("and", u, v), FALSE)
+		self.assertEqual(manager.apply("or", u, v), TRUE)
+		self.assertEqual(manager.apply("xor", u, manager.apply("then", manager.atom("A0"), u)), FALSE)
+
+	def test_swaps_keep_statements_and_size(self):
+		rng = random.Random(14)
+		for _ in range(30):
+			formulas = [random_formula(rng, "ABCDE", rng.randint(1, 4)) for _ in range(3)]
+			manager = BDD("ABCDE")
+			roots = []
+			for f in formulas:
+				T = logic.Tree()
+				T.create_logic_tree_from_statement(statement(f))
+				roots.append(manager.from_tree(T.root))
+			manager.refs, manager.live = {}, 0
+			for root in roots:
+				manager.reference(root)
+			for _ in range(20):
+				manager.swap(rng.randrange(4))
+				self.assertEqual(manager.live, manager.size(roots))
+			manager.refs = None
+			for f, root in zip(formulas, roots):
+				for values in product([True, False], repeat=5):
+					assignment = dict(zip("ABCDE", values))
+					u = root
+					while u > TRUE:
+						u = manager.high[u] if assignment[manager.var[u]] else manager.low[u]
+					self.assertEqual(u == TRUE, evaluate(f, assignment))
+
+	def test_sift(self):
+		n = 200
+		list_of_statements = ["if A%d, then A%d" % (i, i + 1) for i in range(n)] + ["if A0, then A%d" % n]
+		logic_trees, dict_atomic_sentences = logic.create_logic_trees(list_of_statements)
+		manager = BDD(list(dict_atomic_sentences)[::-1])
+		roots = [manager.from_tree(T.root) for T in logic_trees]
+		size = manager.size(roots)
+		manager.sift(roots)
+		self.assertLessEqual(manager.size(roots), size)
+		self.assertIsNone(manager.refs)
+		self.assertEqual(logic.check_validity_bdd(logic_trees, dict_atomic_sentences, sift=True)[0], "Is Valid")
+
+if __name__ == "__main__":
+	unittest.main()
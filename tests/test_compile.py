@@ -0,0 +1,63 @@
+"""
+Tests of the compiled row and column functions of Tree.compile and of the columns engine (check_validity_columns) against the brute force.
+"""
+
+from itertools import product
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import logic
+from test_engines import EngineTestCase, evaluate, random_arguments, random_formula, statement
+
+class TestCompile(EngineTestCase):
+
+	def test_columns_engine(self):
+		self.assert_engine(logic.check_validity_columns, random_arguments(300))
+		self.assert_known_arguments(logic.check_validity_columns)
+
+	def test_row_and_column_functions(self):
+		rng = random.Random(7)
+		atoms = "ABCD"
+		dict_atomic_sentences = logic.OrderedDict.fromkeys(atoms)
+		truth_values_atomic_sentences = logic.generate_truth_values_for_atomic_sentences(dict_atomic_sentences)
+		for _ in range(200):
+			formula = random_formula(rng, atoms, rng.randint(0, 4))
+			T = logic.Tree()
+			T.create_logic_tree_from_statement(statement(formula))
+			column = T.evaluate_column(truth_values_atomic_sentences)
+			for row in range(2**len(atoms)):
+				assignment = logic.assignment_of_row(dict_atomic_sentences, row)
+				expected = evaluate(formula, assignment)
+				self.assertEqual(T.evaluate(assignment), expected, statement(formula))
+				self.assertEqual(T.interpret(assignment), expected, statement(formula))
+				self.assertEqual(bool(column >> row & 1), expected, statement(formula))
+
+	def test_deep_statement(self):
+		s = "A"
+		for i in range(3000):
+			s = "( %s ) and B" % s if i % 2 else "if ( %s ), then B" % s
+		T = logic.Tree()
+		T.create_logic_tree_from_statement(s)
+		truth_values_atomic_sentences = logic.generate_truth_values_for_atomic_sentences(logic.OrderedDict.fromkeys("AB"))
+		self.assertEqual(T.evaluate_column(truth_values_atomic_sentences), T.assign_truth_values_to_node(truth_values_atomic_sentences).truth_values)
+		for values in product([True, False], repeat=2):
+			assignment = dict(zip("AB", values))
+			self.assertEqual(T.evaluate(assignment), T.interpret(assignment))
+
+	def test_lru_cache(self):
+		cache = logic.LRUCache(2)
+		cache.store("a", 1)
+		cache.store("b", 2)
+		self.assertEqual(cache.lookup("a"), 1)	# "b" is now the least recently used
+		cache.store("c", 3)
+		self.assertEqual(list(cache), ["a", "c"])
+		self.assertIsNone(cache.lookup("b"))
+		self.assertEqual(cache.misses, 1)
+		self.assertLessEqual(len(logic.compiled_formulas), logic.compiled_formulas.maxsize)
+
+if __name__ == "__main__":
+	unittest.main()
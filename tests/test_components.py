@@ -0,0 +1,62 @@
+"""
+Tests of the decomposition of arguments into independent components (independent_components, check_validity_components) against the brute force.
+"""
+
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import logic
+from test_engines import EngineTestCase, random_arguments, random_formula, statement
+
+def random_split_arguments(count, seed=0):
+	"""
+	Output: a list of count random arguments whose statements use the atoms of one of two disjoint groups, so that most arguments
+			have more than one component.
+	"""
+	rng = random.Random(seed)
+	arguments = []
+	for _ in range(count):
+		formulas = [random_formula(rng, rng.choice(["ABC", "DEF"]), rng.randint(0, 2)) for _ in range(rng.randint(2, 5))]
+		arguments.append((formulas, [statement(f) for f in formulas]))
+	return arguments
+
+class TestComponents(EngineTestCase):
+
+	def test_verdicts(self):
+		arguments = random_split_arguments(300) + random_arguments(100)
+		for engine in ["sat", "truth_table", "columns", "bdd"]:
+			self.assert_engine(logic.check_validity_components, arguments, engine=engine)
+			self.assert_known_arguments(logic.check_validity_components, engine=engine)
+
+	def test_counterexample_covers_all_atoms(self):
+		for formulas, list_of_statements in random_split_arguments(100, seed=11):
+			logic_trees, dict_atomic_sentences = logic.create_logic_trees(list_of_statements)
+			verdict, counterexample = logic.check_validity_components(logic_trees, dict_atomic_sentences)
+			if counterexample:
+				self.assertEqual(list(counterexample), list(dict_atomic_sentences))
+
+	def test_independent_components(self):
+		logic_trees, dict_atomic_sentences = logic.create_logic_trees(["A and B", "C", "if B, then D", "E or C", "not ( F )", "D"])
+		components = logic.independent_components(logic_trees, dict_atomic_sentences)
+		self.assertEqual([(trees, list(atoms)) for trees, atoms in components], 
+						 [([0, 2, 5], ["A", "B", "D"]), ([1, 3], ["C", "E"]), ([4], ["F"])])
+
+	def test_components_are_independent(self):
+		for formulas, list_of_statements in random_split_arguments(100, seed=12):
+			logic_trees, dict_atomic_sentences = logic.create_logic_trees(list_of_statements)
+			components = logic.independent_components(logic_trees, dict_atomic_sentences)
+			self.assertEqual(sorted(i for trees, _ in components for i in trees), list(range(len(list_of_statements))))
+			seen = set()
+			for trees, atoms in components:
+				self.assertFalse(seen & set(atoms))
+				seen |= set(atoms)
+				for i in trees:
+					self.assertTrue(set(logic.identify_atomic_sentences_of_statements([list_of_statements[i]])) <= set(atoms))
+			self.assertEqual(seen, set(dict_atomic_sentences))
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,147 @@
+"""
+Compare the validity engines of logic.py with a brute-force evaluation of small random arguments, so that a change of an engine cannot
+silently change its verdicts or counterexamples.
+
+The random statements are built as nested tuples, which are written as statements for the engines and evaluated directly by the tests,
+so the expected verdicts do not depend on the parser or the Logic Trees.
+"""
+
+from itertools import product
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import logic
+
+OPERATORS = {
+	"and": lambda a, b: a and b,
+	"or": lambda a, b: a or b,
+	"then": lambda a, b: (not a) or b,
+	"iff": lambda a, b: a == b,
+	"xor": lambda a, b: a != b,
+	"nand": lambda a, b: not (a and b),
+	"nor": lambda a, b: not (a or b),
+}
+
+def random_formula(rng, atoms, depth):
+	"""
+	Output: a random formula of at most the given depth, as a tuple ("atom", A), ("not", f) or (operator, f, g).
+	"""
+	if depth == 0 or rng.random() < 0.25:
+		formula = ("atom", rng.choice(atoms))
+	else:
+		formula = (rng.choice(sorted(OPERATORS)), random_formula(rng, atoms, depth - 1), random_formula(rng, atoms, depth - 1))
+	if rng.random() < 0.25:
+		formula = ("not", formula)
+	return formula
+
+def statement(formula):
+	"""
+	Output: String - the formula written as a statement in the input format of logic.py.
+	"""
+	def operand(f):
+		return statement(f) if f[0] == "atom" else "( %s )" % statement(f)
+
+	if formula[0] == "atom":
+		return formula[1]
+	if formula[0] == "not":
+		return "not %s" % operand(formula[1])
+	if formula[0] == "then":
+		return "if %s, then %s" % (operand(formula[1]), operand(formula[2]))
+	return "%s %s %s" % (operand(formula[1]), formula[0], operand(formula[2]))
+
+def evaluate(formula, assignment):
+	if formula[0] == "atom":
+		return assignment[formula[1]]
+	if formula[0] == "not":
+		return not evaluate(formula[1], assignment)
+	return OPERATORS[formula[0]](evaluate(formula[1], assignment), evaluate(formula[2], assignment))
+
+def brute_force_verdict(formulas, atoms):
+	"""
+	Output: String - the verdict of the argument (the last formula is the conclusion), from every assignment of the atoms.
+	"""
+	verdict = "Not Logically Connected"
+	for values in product([True, False], repeat=len(atoms)):
+		assignment = dict(zip(atoms, values))
+		if all(evaluate(f, assignment) for f in formulas[:-1]):
+			if not evaluate(formulas[-1], assignment):
+				return "Not Valid"
+			verdict = "Is Valid"
+	return verdict
+
+def random_arguments(count, max_atoms=5, seed=0):
+	"""
+	Output: a list of count random arguments, as tuples (formulas, statements).
+	"""
+	rng = random.Random(seed)
+	arguments = []
+	for _ in range(count):
+		atoms = "ABCDEF"[:rng.randint(1, max_atoms)]
+		formulas = [random_formula(rng, atoms, rng.randint(0, 3)) for _ in range(rng.randint(1, 4))]
+		arguments.append((formulas, [statement(f) for f in formulas]))
+	return arguments
+
+# a few arguments with a known verdict, which the random arguments may miss
+KNOWN_ARGUMENTS = [
+	(["if A, then B", "A", "B"], "Is Valid"),
+	(["if A, then B", "B", "A"], "Not Valid"),
+	(["A and not ( A )", "B"], "Not Logically Connected"),
+	(["A or B", "not ( A )", "B"], "Is Valid"),
+	(["A"], "Not Valid"),
+	(["A or not ( A )"], "Is Valid"),
+]
+
+class EngineTestCase(unittest.TestCase):
+
+	def assert_engine(self, check, arguments, **kwargs):
+		"""
+		Check the verdict of the engine check for every argument against the brute force, and that a counterexample makes all the premises True
+		and the conclusion False.
+		"""
+		for formulas, statements in arguments:
+			logic_trees, dict_atomic_sentences = logic.create_logic_trees(statements)
+			verdict, counterexample = check(logic_trees, dict_atomic_sentences, **kwargs)
+			self.assertEqual(verdict, brute_force_verdict(formulas, list(dict_atomic_sentences)), statements)
+			if verdict == "Not Valid":
+				self.assertIsNotNone(counterexample, statements)
+				self.assertTrue(all(evaluate(f, counterexample) for f in formulas[:-1]), (statements, counterexample))
+				self.assertFalse(evaluate(formulas[-1], counterexample), (statements, counterexample))
+			else:
+				self.assertIsNone(counterexample, statements)
+
+	def assert_known_arguments(self, check, **kwargs):
+		for statements, expected in KNOWN_ARGUMENTS:
+			logic_trees, dict_atomic_sentences = logic.create_logic_trees(statements)
+			self.assertEqual(check(logic_trees, dict_atomic_sentences, **kwargs)[0], expected, statements)
+
+class TestEngines(EngineTestCase):
+
+	def test_sat(self):
+		self.assert_engine(logic.check_validity_sat, random_arguments(300))
+		self.assert_known_arguments(logic.check_validity_sat)
+
+	def test_check_validity(self):
+		for formulas, statements in random_arguments(300):
+			logic_trees, dict_atomic_sentences = logic.create_logic_trees(statements)
+			truth_values_atomic_sentences = logic.generate_truth_values_for_atomic_sentences(dict_atomic_sentences)
+			for T in logic_trees:
+				T.assign_truth_values_to_node(truth_values_atomic_sentences)
+			self.assertEqual(logic.check_validity(logic_trees), brute_force_verdict(formulas, list(dict_atomic_sentences)), statements)
+
+	def test_simplified(self):
+		arguments = random_arguments(300, max_atoms=6)
+		for engine in ["sat", "truth_table", "gray", "columns", "bdd"]:
+			self.assert_engine(logic.check_validity_simplified, arguments, engine=engine)
+			self.assert_known_arguments(logic.check_validity_simplified, engine=engine)
+
+	def test_answer_validity(self):
+		for engine in sorted(logic.validity_engines):
+			for statements, expected in KNOWN_ARGUMENTS:
+				self.assertEqual(logic.answer_validity(statements, engine)[0], expected, (engine, statements))
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,71 @@
+"""
+The default truth table is printed from a FlatTree, while the parallel and streamed truth tables are printed from the Logic Trees.
+These tests check that both representations print the same truth table and give the same verdict.
+"""
+
+import io
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import logic
+from test_engines import brute_force_verdict, random_arguments
+
+def node_truth_table(list_of_statements, table_format):
+	"""
+	Output: Tuple - (String - the truth table printed from the Logic Trees, String - the verdict of check_validity)
+	"""
+	logic_trees, dict_atomic_sentences = logic.create_logic_trees(list_of_statements)
+	truth_values_atomic_sentences = logic.generate_truth_values_for_atomic_sentences(dict_atomic_sentences)
+	logic_trees_complex = []
+	for T in logic_trees:
+		T.assign_truth_values_to_node(truth_values_atomic_sentences)
+		T.describe(T.root)
+		T.truth_tables_complex_sent(T.root)
+		logic_trees_complex.append(T.truth_tables_output)
+	file = io.StringIO()
+	logic.print_truth_table(truth_values_atomic_sentences, logic_trees, logic_trees_complex, file, table_format)
+	return file.getvalue(), logic.check_validity(logic_trees)
+
+def flat_truth_table(list_of_statements, table_format):
+	flat_tree = logic.FlatTree(list_of_statements)
+	flat_tree.assign_truth_values(logic.generate_truth_values_for_atomic_sentences(flat_tree.atomic_sentences))
+	flat_tree.describe()
+	file = io.StringIO()
+	flat_tree.print_truth_table(file, table_format)
+	return file.getvalue(), flat_tree.check_validity()
+
+def answer(list_of_statements, **kwargs):
+	file = io.StringIO()
+	logic.answer_truth_table_validity(list_of_statements, file=file, **kwargs)
+	return file.getvalue()
+
+class TestFlatTree(unittest.TestCase):
+
+	def test_same_as_logic_trees(self):
+		for formulas, list_of_statements in random_arguments(300, seed=1):
+			for table_format in ["fixed", "jsonl"]:
+				table, verdict = flat_truth_table(list_of_statements, table_format)
+				self.assertEqual((table, verdict), node_truth_table(list_of_statements, table_format), list_of_statements)
+			atoms = list(logic.identify_atomic_sentences_of_statements(list_of_statements))
+			self.assertEqual(verdict, brute_force_verdict(formulas, atoms), list_of_statements)
+
+	def test_block_rows(self):
+		for formulas, list_of_statements in random_arguments(100, seed=2):
+			expected = answer(list_of_statements)
+			for block_rows in [1, 2, 8]:
+				self.assertEqual(answer(list_of_statements, block_rows=block_rows), expected, (list_of_statements, block_rows))
+
+	def test_workers(self):
+		for formulas, list_of_statements in random_arguments(10, seed=3):
+			self.assertEqual(answer(list_of_statements, workers=2), answer(list_of_statements), list_of_statements)
+
+	def test_shared_and_atomic_statements(self):
+		for list_of_statements in [["A", "A"], ["not ( A )", "A", "not ( not ( A ) )"], ["A and B", "not ( A and B )", "B and A", "A and B"],
+								   ["if A, then B", "( if A, then B ) or C", "C"], logic.sample1]:
+			self.assertEqual(flat_truth_table(list_of_statements, "fixed"), node_truth_table(list_of_statements, "fixed"), list_of_statements)
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,42 @@
+"""
+Tests of the Gray-code enumeration of the rows (generate_rows_gray) and of the gray engine (check_validity_gray) against the brute force.
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import logic
+from test_engines import EngineTestCase, evaluate, random_arguments
+
+class TestGray(EngineTestCase):
+
+	def test_verdicts(self):
+		self.assert_engine(logic.check_validity_gray, random_arguments(300))
+		self.assert_known_arguments(logic.check_validity_gray)
+
+	def test_rows(self):
+		# every row is visited once, consecutive rows differ in one atomic sentence, and the values of the roots are updated correctly
+		for formulas, list_of_statements in random_arguments(100, seed=10):
+			logic_trees, dict_atomic_sentences = logic.create_logic_trees(list_of_statements)
+			visited = []
+			for row, values in logic.generate_rows_gray(logic_trees, dict_atomic_sentences):
+				assignment = logic.assignment_of_row(dict_atomic_sentences, row)
+				self.assertEqual(list(values), [evaluate(f, assignment) for f in formulas], (list_of_statements, row))
+				if visited:
+					self.assertEqual(bin(row ^ visited[-1]).count("1"), 1)
+				visited.append(row)
+			self.assertEqual(sorted(visited), list(range(2**len(dict_atomic_sentences))))
+
+	def test_shared_subformulas(self):
+		# the trees share their nodes through node_table, but every copy of a shared node must be updated
+		list_of_statements = ["( A and B ) or C", "not ( A and B )", "( A and B ) iff ( C xor A )", "A and B"]
+		logic_trees, dict_atomic_sentences = logic.create_logic_trees(list_of_statements)
+		for row, values in logic.generate_rows_gray(logic_trees, dict_atomic_sentences):
+			assignment = logic.assignment_of_row(dict_atomic_sentences, row)
+			self.assertEqual(list(values), [T.interpret(assignment) for T in logic_trees], row)
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,67 @@
+"""
+Tests of the FormulaIndex of index.py against a brute-force comparison of every pair of statements.
+"""
+
+from itertools import product
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from index import FormulaIndex
+from test_engines import evaluate, random_formula, statement
+
+def random_catalog(count, atoms, seed):
+	"""
+	Output: Tuple - (List of the formulas, List of the statements) of a random catalog. Some statements are written twice
+			or negated twice, so that the catalog has equivalent statements which are not identical.
+	"""
+	rng = random.Random(seed)
+	formulas = []
+	for _ in range(count):
+		formula = random_formula(rng, atoms, rng.randint(0, 3))
+		formulas.append(formula)
+		if rng.random() < 0.2:
+			formulas.append(("not", ("not", formula)))
+	return formulas, [statement(f) for f in formulas]
+
+class TestFormulaIndex(unittest.TestCase):
+
+	def assert_brute_force(self, formulas, list_of_statements, atoms, **kwargs):
+		index = FormulaIndex(list_of_statements, **kwargs)
+		rows = [dict(zip(atoms, values)) for values in product([True, False], repeat=len(atoms))]
+		truth = [tuple(evaluate(f, row) for row in rows) for f in formulas]
+
+		classes = {}
+		for i, values in enumerate(truth):
+			classes.setdefault(values, []).append(i)
+		self.assertEqual(sorted(map(sorted, index.classes)), sorted(classes.values()))
+		for i in range(len(formulas)):
+			self.assertEqual(sorted(index.equivalents(i)), sorted(list_of_statements[j] for j in classes[truth[i]] if j != i))
+			entailed = [j for j in range(len(formulas)) if j != i and all(b or not a for a, b in zip(truth[i], truth[j]))]
+			self.assertEqual(index.entailed_by(i), entailed, list_of_statements[i])
+		self.assertEqual(index.entailments(), [index.entailed_by(i) for i in range(len(formulas))])
+		return index
+
+	def test_exact(self):
+		for seed in range(5):
+			formulas, list_of_statements = random_catalog(60, "ABCD", seed)
+			index = self.assert_brute_force(formulas, list_of_statements, "ABCD")
+			self.assertTrue(index.exact)
+
+	def test_sampled(self):
+		for seed in range(5):
+			formulas, list_of_statements = random_catalog(60, "ABCD", seed)
+			index = self.assert_brute_force(formulas, list_of_statements, "ABCD", max_atoms=2, sample_rows=4, seed=seed)
+			self.assertFalse(index.exact)
+			self.assertIsNotNone(index.manager)	# 4 sampled rows cannot tell the statements apart, so candidates were verified with the BDD
+
+	def test_equivalence_classes(self):
+		index = FormulaIndex(["A and B", "B and A", "not ( not ( A and B ) )", "A or B", "if A, then B", "not ( A ) or B"])
+		self.assertEqual(index.equivalence_classes(), [["A and B", "B and A", "not ( not ( A and B ) )"], ["A or B"], ["if A, then B", "not ( A ) or B"]])
+		self.assertEqual(index.entailed_by(0), [1, 2, 3, 4, 5])
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,41 @@
+"""
+Tests of the parallel engine, which evaluates blocks of rows of the truth table in a pool of worker processes.
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import logic
+from test_engines import EngineTestCase, random_arguments
+
+class TestParallel(EngineTestCase):
+
+	def test_verdicts(self):
+		arguments = random_arguments(8, seed=8)
+		for fixed in [None, 0, 1, 2]:
+			self.assert_engine(logic.check_validity_parallel, arguments, workers=2, fixed=fixed)
+		self.assert_known_arguments(logic.check_validity_parallel, workers=2, fixed=1)
+
+	def test_blocks(self):
+		dict_atomic_sentences = logic.OrderedDict.fromkeys("ABCDE")
+		truth_values_atomic_sentences = logic.generate_truth_values_for_atomic_sentences(dict_atomic_sentences)
+		for fixed in range(6):
+			blocks = [logic.generate_truth_values_for_block(dict_atomic_sentences, block, fixed) for block in range(2**fixed)]
+			for atom in dict_atomic_sentences:
+				column = logic.join_columns([block[atom] for block in blocks], 2**(5 - fixed))
+				self.assertEqual(column, truth_values_atomic_sentences[atom], (fixed, atom))
+
+	def test_assign_truth_values_parallel(self):
+		for formulas, list_of_statements in random_arguments(4, seed=9):
+			logic_trees, dict_atomic_sentences = logic.create_logic_trees(list_of_statements)
+			logic.assign_truth_values_parallel(logic_trees, dict_atomic_sentences, workers=2, fixed=1)
+			expected, _ = logic.create_logic_trees(list_of_statements)
+			truth_values_atomic_sentences = logic.generate_truth_values_for_atomic_sentences(dict_atomic_sentences)
+			for T, E in zip(logic_trees, expected):
+				self.assertEqual(T.root.truth_values, E.assign_truth_values_to_node(truth_values_atomic_sentences).truth_values, list_of_statements)
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,102 @@
+"""
+Tests of tokenize and parse_statement of logic.py: the precedence of the connectives, the punctuation, and the statements which cannot be parsed.
+"""
+
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from logic import parse_statement, tokenize
+from test_engines import OPERATORS, evaluate, random_formula, statement
+
+def evaluate_postfix(tokens, assignment):
+	"""
+	Output: Boolean - the truth value of a statement in postfix order under an assignment of its atomic sentences.
+	"""
+	stack = []
+	for token in tokens:
+		if token == "not":
+			stack.append(not stack.pop())
+		elif token in OPERATORS:
+			b = stack.pop()
+			a = stack.pop()
+			stack.append(OPERATORS[token](a, b))
+		else:
+			stack.append(assignment[token])
+	return stack.pop()
+
+class TestParser(unittest.TestCase):
+
+	def test_precedence(self):
+		self.assertEqual(parse_statement("A or B and C"), ("A", "B", "C", "and", "or"))
+		self.assertEqual(parse_statement("A and B or C"), ("A", "B", "and", "C", "or"))
+		self.assertEqual(parse_statement("A nand B xor C"), ("A", "B", "nand", "C", "xor"))
+		self.assertEqual(parse_statement("A or B then C"), ("A", "B", "or", "C", "then"))
+		self.assertEqual(parse_statement("A iff B then C"), ("A", "B", "C", "then", "iff"))
+		self.assertEqual(parse_statement("( A or B ) and C"), ("A", "B", "or", "C", "and"))
+		self.assertEqual(parse_statement("not A and B"), ("A", "not", "B", "and"))
+		self.assertEqual(parse_statement("not ( A and B ), then C"), ("A", "B", "and", "not", "C", "then"))
+
+	def test_left_associative(self):
+		self.assertEqual(parse_statement("A or B xor C"), ("A", "B", "or", "C", "xor"))
+		self.assertEqual(parse_statement("A nand B nand C"), ("A", "B", "nand", "C", "nand"))
+		self.assertEqual(parse_statement("A iff B iff C"), ("A", "B", "iff", "C", "iff"))
+
+	def test_then_right_associative(self):
+		self.assertEqual(parse_statement("if A, then if B, then C"), ("A", "B", "C", "then", "then"))
+		self.assertEqual(parse_statement("A then B then C"), parse_statement("A then ( B then C )"))
+		self.assertNotEqual(parse_statement("A then B then C"), parse_statement("( A then B ) then C"))
+
+	def test_not(self):
+		self.assertEqual(parse_statement("not A"), ("A", "not"))
+		self.assertEqual(parse_statement("not not A"), ("A", "not", "not"))
+		self.assertEqual(parse_statement("A"), ("A",))
+
+	def test_punctuation(self):
+		self.assertEqual(tokenize("if A.1, then B"), ["A1", "then", "B"])
+		self.assertEqual(parse_statement("if A.1, then B"), ("A1", "B", "then"))
+		self.assertEqual(parse_statement("(A and B)!"), ("A", "B", "and"))
+
+	def test_random_statements(self):
+		rng = random.Random(0)
+		atoms = ["A", "B", "C", "D"]
+		for _ in range(300):
+			formula = random_formula(rng, atoms, rng.randint(0, 4))
+			tokens = parse_statement(statement(formula))
+			for _ in range(4):
+				assignment = dict((a, rng.random() < 0.5) for a in atoms)
+				self.assertEqual(evaluate_postfix(tokens, assignment), evaluate(formula, assignment))
+
+	def test_deep_nesting(self):
+		n = 5000
+		self.assertEqual(len(parse_statement("( " * n + "A" + " )" * n)), 1)
+		self.assertEqual(parse_statement("not " * n + "A"), ("A",) + ("not",) * n)
+
+	def assert_error(self, s, message):
+		with self.assertRaises(ValueError) as context:
+			parse_statement(s)
+		self.assertIn(message, str(context.exception))
+
+	def test_unmatched_parentheses(self):
+		self.assert_error("( A and B", "unmatched '('")
+		self.assert_error("A and B )", "unmatched ')'")
+		self.assert_error("( A ) )", "unmatched ')'")
+
+	def test_missing_operand(self):
+		self.assert_error("A and", "incomplete statement")
+		self.assert_error("", "incomplete statement")
+		self.assert_error("not", "incomplete statement")
+		self.assert_error("and A", "expected an atomic sentence before 'and'")
+		self.assert_error("A or and B", "expected an atomic sentence before 'and'")
+		self.assert_error("( ) and A", "expected an atomic sentence before ')'")
+
+	def test_missing_connective(self):
+		self.assert_error("A B", "expected a connective before 'B'")
+		self.assert_error("( A ) ( B )", "expected a connective before '('")
+		self.assert_error("A not B", "expected a connective before 'not'")
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,144 @@
+"""
+Tests of the JSON-lines service of service.py.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import logic
+from service import Service, serve_socket
+from test_engines import brute_force_verdict, random_arguments
+
+def respond(line, service=None):
+	"""
+	Output: the response of the service to the line, decoded from JSON.
+	"""
+	return json.loads(asyncio.run((service or Service()).respond(line)))
+
+def columns_over(list_of_statements, atomic_sentences):
+	"""
+	Output: List of the columns of the statements over the atomic sentences, in that order.
+	"""
+	truth_values_atomic_sentences = logic.generate_truth_values_for_atomic_sentences(logic.OrderedDict.fromkeys(atomic_sentences))
+	columns = []
+	for s in list_of_statements:
+		T = logic.Tree()
+		T.create_logic_tree_from_statement(s)
+		columns.append(T.evaluate_column(truth_values_atomic_sentences))
+	return columns
+
+class TestValidateBatch(unittest.TestCase):
+
+	def test_same_as_brute_force(self):
+		arguments = random_arguments(200, seed=4)
+		results = logic.validate_batch([list_of_statements for _, list_of_statements in arguments], columns=True)
+		for (formulas, list_of_statements), result in zip(arguments, results):
+			atoms = sorted(logic.identify_atomic_sentences_of_statements(list_of_statements))
+			self.assertEqual(result["verdict"], brute_force_verdict(formulas, atoms), list_of_statements)
+			self.assertEqual(result["atomic_sentences"], atoms)
+			self.assertEqual(result["columns"], dict(zip(list_of_statements, columns_over(list_of_statements, atoms))))
+			if result["counterexample"]:
+				self.assertEqual(list(result["counterexample"]), atoms)
+
+	def test_grouped_by_atom_set(self):
+		arguments = [["B or A", "A"], ["A and B", "B"], ["if B, then A", "B", "A"], ["C", "A or C"]]
+		with mock.patch("logic.generate_truth_values_for_atomic_sentences", 
+						wraps=logic.generate_truth_values_for_atomic_sentences) as generate:
+			results = logic.validate_batch(arguments, columns=True)
+		self.assertEqual(generate.call_count, 2)	# {A, B} and {A, C}
+		self.assertEqual([result["atomic_sentences"] for result in results], [["A", "B"], ["A", "B"], ["A", "B"], ["A", "C"]])
+		self.assertEqual([result["verdict"] for result in results], ["Not Valid", "Is Valid", "Is Valid", "Is Valid"])
+		self.assertEqual(list(results[0]["counterexample"].items()), [("A", False), ("B", True)])
+		self.assertEqual(list(results[0]["columns"].values()), columns_over(arguments[0], ["A", "B"]))
+
+	def test_sat_above_max_atoms(self):
+		results = logic.validate_batch([["if A, then B", "if B, then C", "if A, then C"], ["C or B", "A", "B"], ["A", "A or B"]], 
+									   columns=True, max_atoms=1)
+		self.assertEqual([result["verdict"] for result in results], ["Is Valid", "Not Valid", "Is Valid"])
+		self.assertEqual([result["columns"] for result in results], [None, None, None])
+		self.assertEqual(results[1]["atomic_sentences"], ["C", "B", "A"])	# in the order of the statements, without a truth table
+		counterexample = results[1]["counterexample"]
+		self.assertTrue((counterexample["C"] or counterexample["B"]) and counterexample["A"] and not counterexample["B"])
+
+	def test_empty_argument(self):
+		with self.assertRaises(ValueError):
+			logic.validate_batch([["A"], []])
+
+class TestRespond(unittest.TestCase):
+
+	def test_statements(self):
+		response = respond(json.dumps({"id": 1, "statements": ["if A, then B", "A", "B"]}))
+		self.assertEqual(response, {"id": 1, "verdict": "Is Valid", "counterexample": None, "atomic_sentences": ["A", "B"]})
+
+	def test_arguments(self):
+		response = respond(json.dumps({"id": "x", "arguments": [["A", "A or B"], ["A or B", "A"]]}))
+		self.assertEqual(response["id"], "x")
+		self.assertEqual([result["verdict"] for result in response["results"]], ["Is Valid", "Not Valid"])
+
+	def test_hex_columns(self):
+		list_of_statements = ["A%d or A%d" % (i, i + 1) for i in range(14)] + ["A0"]
+		response = respond(json.dumps({"id": 1, "statements": list_of_statements, "columns": True}))
+		atoms = sorted(logic.identify_atomic_sentences_of_statements(list_of_statements))
+		self.assertEqual(response["atomic_sentences"], atoms)
+		self.assertEqual(list(response["columns"]), list_of_statements)
+		self.assertEqual([int(column, 16) for column in response["columns"].values()], columns_over(list_of_statements, atoms))
+
+	def test_cached_results_are_not_encoded(self):
+		service = Service()
+		line = json.dumps({"id": 1, "statements": ["A", "A or B"], "columns": True})
+		self.assertEqual(respond(line, service), respond(line, service))
+		self.assertTrue(all(isinstance(column, int) for results in service.cache.values() for column in results[0]["columns"].values()))
+
+	def test_errors(self):
+		for request, request_id in [("[1, 2]", None), ("not json", None), ('{"id": 2, "statements": []}', 2), ('{"id": 3, "statements": "A"}', 3),
+									('{"id": 4, "statements": ["A", 5]}', 4), ('{"id": 5, "arguments": [["A"], []]}', 5), ('{"id": 6, "arguments": []}', 6),
+									('{"id": 7, "statements": ["A and"]}', 7), ('{"id": 8, "statements": ["( A", "B"]}', 8)]:
+			response = respond(request)
+			self.assertEqual(list(response), ["id", "error"], request)
+			self.assertEqual(response["id"], request_id, request)
+
+class TestSocket(unittest.TestCase):
+
+	def exchange(self, lines, limit):
+		"""
+		Output: List of the responses (decoded JSON) to the lines, sent over one connection to a socket served with the given limit.
+		"""
+		async def run(path):
+			server = asyncio.ensure_future(serve_socket(Service(), path, limit))
+			while not os.path.exists(path):
+				await asyncio.sleep(0.01)
+			reader, writer = await asyncio.open_unix_connection(path)
+			writer.write(b"".join(line + b"\n" for line in lines))
+			writer.write_eof()
+			responses = [json.loads(line) for line in (await reader.read()).splitlines()]
+			writer.close()
+			server.cancel()
+			return responses
+
+		with tempfile.TemporaryDirectory() as directory:
+			return asyncio.run(run(os.path.join(directory, "service.sock")))
+
+	def test_line_longer_than_limit(self):
+		long_request = json.dumps({"id": 1, "arguments": [["A", "A or B"]] * 3000}).encode()
+		self.assertGreater(len(long_request), 4096)
+		responses = self.exchange([long_request, json.dumps({"id": 2, "statements": ["if A, then B", "A", "B"]}).encode()], limit=4096)
+		self.assertEqual(len(responses), 2)
+		self.assertEqual(responses[0]["id"], None)
+		self.assertIn("longer than 4096 bytes", responses[0]["error"])
+		self.assertEqual(responses[1]["id"], 2)
+		self.assertEqual(responses[1]["verdict"], "Is Valid")
+
+	def test_long_line_within_limit(self):
+		responses = self.exchange([json.dumps({"id": 1, "arguments": [["A", "A or B"]] * 3000}).encode()], limit=2**20)
+		self.assertEqual(len(responses[0]["results"]), 3000)
+		self.assertTrue(all(result["verdict"] == "Is Valid" for result in responses[0]["results"]))
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,109 @@
+"""
+Tests of the incremental Session of session.py. A Session which has been edited must give the same answers as a Session and 
+answer_truth_table_validity which start from scratch.
+"""
+
+import io
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import logic
+from session import Session
+
+def truth_table(list_of_statements):
+	file = io.StringIO()
+	logic.answer_truth_table_validity(list_of_statements, file=file)
+	return file.getvalue()
+
+class TestSession(unittest.TestCase):
+
+	def assert_matches(self, session):
+		"""
+		Compare the session with a fresh Session of its statements, with the columns of its statements over its atomic sentences,
+		and with answer_truth_table_validity if the atomic sentences are in the same order.
+		"""
+		list_of_statements = session.statements()
+		verdict, counterexample = session.check_validity()
+		self.assertEqual(verdict, Session(list_of_statements).check_validity()[0], list_of_statements)
+		if counterexample:
+			self.assertEqual(list(counterexample), list(session.atomic_sentences))
+			values = [logic.Tree() for _ in list_of_statements]
+			for T, s in zip(values, list_of_statements):
+				T.create_logic_tree_from_statement(s)
+			self.assertTrue(all(T.evaluate(counterexample) for T in values[:-1]), (list_of_statements, counterexample))
+			self.assertFalse(values[-1].evaluate(counterexample), (list_of_statements, counterexample))
+
+		# the cached columns, extended with extend_column, are the columns over all the atomic sentences of the session
+		truth_values_atomic_sentences = logic.generate_truth_values_for_atomic_sentences(session.atomic_sentences)
+		expected = {}
+		for s in list_of_statements:
+			T = logic.Tree()
+			T.create_logic_tree_from_statement(s, {})
+			T.assign_truth_values_to_node(truth_values_atomic_sentences)
+			T.describe(T.root)
+			for node in logic.post_order([T.root]):
+				expected[node.desc] = node.truth_values
+		for desc in list(session.columns):
+			if desc in expected:
+				self.assertEqual(session.cached_column(desc), expected[desc], desc)
+		self.assertLessEqual(session.cached_bytes, session.memory_budget)
+
+		if list(session.atomic_sentences) == list(logic.identify_atomic_sentences_of_statements(list_of_statements)):
+			file = io.StringIO()
+			session.print_truth_table(file)
+			self.assertEqual(file.getvalue(), truth_table(list_of_statements))
+
+	def test_edits(self):
+		for memory_budget in [2**28, 64, 1]:
+			session = Session(["A", "B", "A or B"], memory_budget)
+			self.assert_matches(session)
+			session.add_premise("if B, then C")	# a new atomic sentence extends the cached columns
+			self.assert_matches(session)
+			session.add_premise("( C and not ( D ) ) or A")
+			self.assert_matches(session)
+			session.remove_premise("B")
+			self.assert_matches(session)
+			session.set_conclusion("D iff ( A and B )")
+			self.assert_matches(session)
+			session.set_conclusion("A or B")
+			self.assert_matches(session)
+			self.assertEqual(session.statements(), ["A", "if B, then C", "( C and not ( D ) ) or A", "A or B"])
+
+	def test_remove_missing_premise(self):
+		session = Session(["A", "B"])
+		with self.assertRaises(ValueError):
+			session.remove_premise("C")
+
+	def test_forget_removed_statements(self):
+		session = Session(["A and B", "C or D", "A"])
+		session.remove_premise("C or D")
+		self.assertEqual(set(session.trees), {"A and B", "A"})
+		live = set(map(id, logic.dag_nodes(session.trees.values())))
+		self.assertTrue(all(id(node) in live for node in session.node_table.values()))
+
+	def test_random_edits(self):
+		rng = random.Random(0)
+		atoms = "ABCDE"
+
+		def random_statement():
+			parts = [rng.choice(atoms) for _ in range(rng.randint(1, 3))]
+			return (" %s " % rng.choice(["and", "or", "xor", "iff"])).join(parts) if len(parts) > 1 else parts[0]
+
+		for memory_budget in [2**28, 16, 1]:
+			session = Session([random_statement()], memory_budget)
+			for _ in range(40):
+				edit = rng.random()
+				if edit < 0.5:
+					session.add_premise(random_statement())
+				elif edit < 0.8 and session.premises:
+					session.remove_premise(rng.choice(session.premises))
+				else:
+					session.set_conclusion(random_statement())
+				self.assert_matches(session)
+
+if __name__ == "__main__":
+	unittest.main()
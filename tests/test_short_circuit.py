@@ -0,0 +1,37 @@
+"""
+Tests of the short-circuiting search of the rows of the truth table (check_validity_short_circuit) against the brute force.
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import logic
+from test_engines import EngineTestCase, random_arguments
+
+class TestShortCircuit(EngineTestCase):
+
+	def test_verdicts(self):
+		self.assert_engine(logic.check_validity_short_circuit, random_arguments(300))
+		self.assert_known_arguments(logic.check_validity_short_circuit)
+
+	def test_assignments_in_row_order(self):
+		dict_atomic_sentences = logic.OrderedDict.fromkeys("ABC")
+		truth_values_atomic_sentences = logic.generate_truth_values_for_atomic_sentences(dict_atomic_sentences)
+		for row, assignment in enumerate(logic.generate_assignments(dict_atomic_sentences)):
+			self.assertEqual(list(assignment), ["A", "B", "C"])
+			for atom, value in assignment.items():
+				self.assertEqual(value, bool(truth_values_atomic_sentences[atom] >> row & 1), (row, atom))
+		self.assertEqual(row, 7)
+
+	def test_first_counterexample(self):
+		# the counterexample is the first row of the truth table, like check_validity_columns
+		for formulas, list_of_statements in random_arguments(100, seed=6):
+			logic_trees, dict_atomic_sentences = logic.create_logic_trees(list_of_statements)
+			self.assertEqual(logic.check_validity_short_circuit(logic_trees, dict_atomic_sentences),
+							 logic.check_validity_columns(logic_trees, dict_atomic_sentences), list_of_statements)
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,94 @@
+"""
+Tests of the truth table files of tablefile.py, saved with save_truth_table.
+"""
+
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import logic
+from tablefile import TruthTableFile, TruthTableFileWriter
+from test_engines import brute_force_verdict, random_arguments
+
+class TestTruthTableFile(unittest.TestCase):
+
+	def setUp(self):
+		self.directory = tempfile.mkdtemp()
+
+	def tearDown(self):
+		shutil.rmtree(self.directory)
+
+	def save(self, list_of_statements, block_rows=2**20):
+		path = os.path.join(self.directory, "table.tt")
+		logic.save_truth_table(list_of_statements, path, block_rows)
+		return TruthTableFile(path)
+
+	def test_same_as_answer_truth_table_validity(self):
+		for formulas, list_of_statements in random_arguments(100, seed=5):
+			for block_rows in [8, 2**20]:
+				with self.save(list_of_statements, block_rows) as table_file:
+					for table_format in ["fixed", "csv"]:
+						expected = io.StringIO()
+						logic.answer_truth_table_validity(list_of_statements, file=expected, table_format=table_format)
+						printed = io.StringIO()
+						table_file.print_truth_table(printed, table_format, block_rows=8)
+						self.assertTrue(expected.getvalue().startswith(printed.getvalue()), list_of_statements)
+						self.assertEqual(printed.getvalue().count("\n"), table_file.row_count + 1)
+
+					verdict = brute_force_verdict(formulas, table_file.atomic_sentences)
+					for check_rows in [8, 16, 2**20]:
+						self.assertEqual(table_file.check_validity(check_rows), verdict, list_of_statements)
+
+	def test_rows(self):
+		list_of_statements = ["if A, then B", "not ( A )", "B or C", "C"]
+		with self.save(list_of_statements, block_rows=8) as table_file:
+			self.assertEqual(table_file.row_count, 8)
+			for row in range(table_file.row_count):
+				assignment = logic.assignment_of_row(table_file.atomic_sentences, row)
+				values = table_file.row(row)
+				self.assertEqual([values[atom] for atom in table_file.atomic_sentences], list(assignment.values()))
+				for s, desc in zip(list_of_statements, table_file.roots):
+					T = logic.Tree()
+					T.create_logic_tree_from_statement(s)
+					self.assertEqual(values[desc], T.evaluate(assignment), (s, row))
+
+	def test_larger_than_one_block(self):
+		list_of_statements = ["A0 or A1 or A2 or A3 or A4 or A5 or A6 or A7 or A8 or A9", "A0 iff A9"]
+		with self.save(list_of_statements, block_rows=16) as table_file:
+			self.assertEqual(table_file.row_count, 1024)
+			logic_trees, atomic_sentences = logic.create_logic_trees(list_of_statements)
+			truth_values_atomic_sentences = logic.generate_truth_values_for_atomic_sentences(atomic_sentences)
+			for T, desc in zip(logic_trees, table_file.roots):
+				self.assertEqual(table_file.column_values(desc), T.evaluate_column(truth_values_atomic_sentences))
+			self.assertEqual(table_file.check_validity(16), logic.check_validity_columns(logic_trees, atomic_sentences)[0])
+
+	def test_close_with_held_view(self):
+		table_file = self.save(["A", "A or B"])
+		view = table_file.column(table_file.roots[-1])
+		table_file.close()
+		self.assertTrue(table_file.file.closed)
+		self.assertEqual(view[0] & 1, 1)	# the view is still readable
+		view.release()
+
+	def test_writer_closed_on_error(self):
+		opened = []
+		original = TruthTableFileWriter.__init__
+
+		def init(self, *args):
+			original(self, *args)
+			opened.append(self.file)
+
+		with mock.patch.object(TruthTableFileWriter, "__init__", init), \
+			 mock.patch.object(TruthTableFileWriter, "write_block", side_effect=OSError("disk full")):
+			with self.assertRaises(OSError):
+				logic.save_truth_table(["A", "B"], os.path.join(self.directory, "table.tt"))
+		self.assertTrue(opened[0].closed)
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,44 @@
+"""
+Tests of the truth table writers of writers.py.
+"""
+
+import io
+import json
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import logic
+
+def truth_table(list_of_statements, table_format, **kwargs):
+	"""
+	Output: String - the truth table printed by answer_truth_table_validity in the format, without the verdict.
+	"""
+	file = io.StringIO()
+	logic.answer_truth_table_validity(list_of_statements, file=file, table_format=table_format, **kwargs)
+	return file.getvalue()
+
+class TestJSONLines(unittest.TestCase):
+
+	def rows(self, list_of_statements, **kwargs):
+		lines = [line for line in truth_table(list_of_statements, "jsonl", **kwargs).splitlines() if line.startswith("{")]
+		self.assertEqual(len(lines), 2**len(logic.identify_atomic_sentences_of_statements(list_of_statements)))
+		return lines
+
+	def test_atomic_statements_are_not_repeated(self):
+		for list_of_statements in [logic.sample1, ["A", "A or B", "B"], ["not ( A )", "A"]]:
+			for kwargs in [{}, {"block_rows": 1}]:
+				for line in self.rows(list_of_statements, **kwargs):
+					keys = json.loads(line, object_pairs_hook=lambda pairs: [key for key, _ in pairs])
+					self.assertEqual(len(keys), len(set(keys)), line)
+
+	def test_values(self):
+		rows = [json.loads(line) for line in self.rows(logic.sample1)]
+		self.assertEqual(list(rows[0]), ["A", "B", "( A -> B )"])
+		for row in rows:
+			self.assertEqual(row["( A -> B )"], (not row["A"]) or row["B"])
+
+if __name__ == "__main__":
+	unittest.main()
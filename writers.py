@@ -0,0 +1,181 @@
+"""
+Writers of truth tables in different formats: fixed-width (as printed by print_truth_table), CSV, TSV, Markdown and JSON Lines.
+
+Printing a truth table one cell at a time costs one call to print per cell. Instead, a writer formats a whole block of rows at once:
+
+1.	Every column of truth values, which is packed into an integer, is unpacked into a string with one character per row.
+	Each column uses its own pair of characters for False and True, so a character says both the column and the truth value.
+2.	The strings of the columns are zipped into the rows of the block, and joined with newlines into one string.
+3.	One call to str.translate replaces every character by the text of its cell, e.g., "True           " or ', "A": true'.
+	The text of each cell, including the separators, is prepared once for each column when the writer is created.
+4.	The text of the whole block is written to the file with one call to write.
+"""
+
+import csv
+import io
+import json
+
+CELL_BASE = 0xE000	# the characters of the cells are taken from the Private Use Area of Unicode, which never appear in the text of the cells
+
+class TableWriter:
+	"""
+	This is the base class of the writers. Subclasses define the texts of the header and of the cells.
+
+	The header row (see truth_table_header in logic.py) may contain the separator "|" between the atomic sentences and the statements.
+	It is kept by the fixed-width writer only. A statement which is an atomic sentence appears twice in the header row, 
+	once as an atomic sentence and once as a statement. The writers whose names must be unique keep only the first column of every name.
+	"""
+
+	keep_separator = False
+	unique_names = False
+
+	def __init__(self, file, top_row):
+		"""
+		Attributes:
+		file : File object to write to.
+		top_row : List - the header row of the truth table, including the separator "|".
+		header : List - the header row without the separator if the format does not keep it, and without the repeated names if the names must be unique.
+		skipped : Set of the indices of the items of top_row which are not written.
+		translation : Dictionary that maps the characters of the cells to their texts (see str.translate).
+		"""
+		self.file = file
+		self.top_row = top_row
+		self.skipped = set()
+		seen = set()
+		for i, name in enumerate(top_row):
+			if name == "|" and not self.keep_separator or self.unique_names and name in seen:
+				self.skipped.add(i)
+			seen.add(name)
+		self.header = [name for i, name in enumerate(top_row) if i not in self.skipped]
+		self.translation = {}
+		for i, name in enumerate(self.header):
+			first, last = i == 0, i == len(self.header) - 1
+			if name == "|":
+				self.translation[CELL_BASE + 2*i] = self.separator_cell(first, last)
+			else:
+				self.translation[CELL_BASE + 2*i] = self.cell(name, False, first, last)
+				self.translation[CELL_BASE + 2*i + 1] = self.cell(name, True, first, last)
+
+	def cell(self, name, value, first, last):
+		"""
+		Return the text of a cell of the column name with the truth value value, including the separators before or after it.
+		first and last tell whether the column is the first or the last column of the row.
+		"""
+		raise NotImplementedError
+
+	def separator_cell(self, first, last):
+		return ""
+
+	def header_text(self):
+		raise NotImplementedError
+
+	def write_header(self):
+		self.file.write(self.header_text())
+
+	def write_rows(self, columns, row_count):
+		"""
+		Input: 1. A list of the columns of truth values of the header row (top_row). The column of the separator "|" can be None.
+			   2. row_count : Integer - number of rows in the columns
+		Output: None. Write the rows to the file.
+		"""
+		if not row_count:
+			return
+		strings = []
+		for i, (name, column) in enumerate(zip(self.top_row, columns)):
+			if i in self.skipped:
+				continue
+			if name == "|":
+				strings.append(chr(CELL_BASE + 2*len(strings)) * row_count)
+				continue
+			bits = format(column, "0%db" % row_count)[::-1]
+			j = len(strings)
+			strings.append(bits.translate({ord("0"): CELL_BASE + 2*j, ord("1"): CELL_BASE + 2*j + 1}))
+		rows = "\n".join(map("".join, zip(*strings))) + "\n"
+		self.file.write(rows.translate(self.translation))
+
+	def flush(self):
+		self.file.flush()
+
+class FixedWidthWriter(TableWriter):
+	"""
+	Every cell is left-aligned in 15 characters, like the truth table printed by print_truth_table.
+	"""
+
+	keep_separator = True
+	width = 15
+
+	def cell(self, name, value, first, last):
+		return "%-*s" % (self.width, value)
+
+	def separator_cell(self, first, last):
+		return " " * self.width
+
+	def header_text(self):
+		return "".join("%-*s" % (self.width, t) for t in self.header) + "\n"
+
+class CSVWriter(TableWriter):
+	"""
+	Comma-separated values. The header row is quoted by the csv module when it is necessary.
+	"""
+
+	delimiter = ","
+
+	def cell(self, name, value, first, last):
+		return str(value) if first else self.delimiter + str(value)
+
+	def header_text(self):
+		text = io.StringIO()
+		csv.writer(text, delimiter=self.delimiter, lineterminator="\n").writerow(self.header)
+		return text.getvalue()
+
+class TSVWriter(CSVWriter):
+	"""
+	Tab-separated values.
+	"""
+
+	delimiter = "\t"
+
+class MarkdownWriter(TableWriter):
+	"""
+	A Markdown table. The character "|" in the header row is escaped.
+	"""
+
+	def cell(self, name, value, first, last):
+		return ("| " if first else " | ") + str(value) + (" |" if last else "")
+
+	def header_text(self):
+		names = [t.replace("|", "\\|") for t in self.header]
+		return "| " + " | ".join(names) + " |\n" + "|" + "|".join("---" for _ in names) + "|\n"
+
+class JSONLinesWriter(TableWriter):
+	"""
+	One JSON object per row, which maps the header row to the truth values. There is no header line.
+	The keys of an object must be unique, so a repeated name of the header row appears once.
+	"""
+
+	unique_names = True
+
+	def cell(self, name, value, first, last):
+		return ("{" if first else ", ") + json.dumps(name) + ": " + json.dumps(value) + ("}" if last else "")
+
+	def header_text(self):
+		return ""
+
+table_writers = {
+	"fixed": FixedWidthWriter,
+	"csv": CSVWriter,
+	"tsv": TSVWriter,
+	"markdown": MarkdownWriter,
+	"jsonl": JSONLinesWriter,
+}
+
+def open_writer(table_format, file, top_row):
+	"""
+	Input: 1. table_format : String - one of the formats in table_writers.
+		   2. file : File object to write to.
+		   3. top_row : List - the header row of the truth table.
+	Output: The writer of the format.
+	"""
+	if table_format not in table_writers:
+		raise ValueError("Unknown table format %r. Choose one of: %s" % (table_format, ", ".join(table_writers)))
+	return table_writers[table_format](file, top_row)